@@ -0,0 +1,12 @@
+"""
+Benchmark suite for the CBZ library.
+
+Times the hot paths of the library (loading, packing, saving,
+metadata serialization and player rendering) on synthetic comics,
+and compares the results against a stored baseline.
+
+Usage:
+    python -m benchmarks run -o baseline.json
+    python -m benchmarks run --baseline baseline.json
+    python -m benchmarks compare baseline.json results.json
+"""
@@ -0,0 +1,87 @@
+"""CLI entry point for the benchmark suite."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.fixtures import COMPRESSIONS, FORMATS, FixtureSpec
+from benchmarks.runner import CASES, compare, run
+
+
+def _load(path: Path) -> dict:
+    """Read a benchmark report."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _report(baseline: dict, current: dict, threshold: float) -> int:
+    """Print the comparison of two reports and return the exit status."""
+    if baseline.get("fixture") != current.get("fixture"):
+        print("Warning: the reports were made with different fixtures.", file=sys.stderr)
+
+    rows = compare(baseline, current, threshold)
+    print(f"{'case':<16} {'metric':<12} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for row in rows:
+        fmt = "{:>12.6f}" if row["metric"] == "median" else "{:>12,.0f}"
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['name']:<16} {row['metric']:<12} {fmt.format(row['baseline'])} "
+              f"{fmt.format(row['current'])} {row['ratio']:>7.2f}{flag}")
+
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {threshold:.0%}.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks or compare two reports."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="CBZ library benchmark suite"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks on a synthetic comic.")
+    run_parser.add_argument("-o", "--output", type=Path, help="Write the JSON report to this file.")
+    run_parser.add_argument("--pages", type=int, default=FixtureSpec.pages, help="Number of pages.")
+    run_parser.add_argument("--width", type=int, default=FixtureSpec.width, help="Page width in pixels.")
+    run_parser.add_argument("--height", type=int, default=FixtureSpec.height, help="Page height in pixels.")
+    run_parser.add_argument("--format", choices=FORMATS, default=FixtureSpec.format, help="Page image format.")
+    run_parser.add_argument("--compression", choices=COMPRESSIONS, default=FixtureSpec.compression,
+                            help="Compression of the CBZ members.")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per case.")
+    run_parser.add_argument("--case", action="append", choices=CASES, dest="cases",
+                            help="Case to run (repeatable, default: all).")
+    run_parser.add_argument("--baseline", type=Path, help="Compare the results against this report.")
+    run_parser.add_argument("--threshold", type=float, default=0.1,
+                            help="Tolerated relative slowdown or memory increase (default: 0.1).")
+
+    compare_parser = commands.add_parser("compare", help="Compare a report against a baseline.")
+    compare_parser.add_argument("baseline", type=Path, help="Baseline report.")
+    compare_parser.add_argument("current", type=Path, help="Report to check.")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="Tolerated relative slowdown or memory increase (default: 0.1).")
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return _report(_load(args.baseline), _load(args.current), args.threshold)
+
+    spec = FixtureSpec(args.pages, args.width, args.height, args.format, args.compression)
+    report = run(spec, args.repeat, args.cases, progress=lambda name: print(f"Running {name}...", file=sys.stderr))
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    elif args.baseline is None:
+        print(text)
+
+    if args.baseline is not None:
+        return _report(_load(args.baseline), report, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Synthetic comic fixtures.
+
+Generates deterministic page images and CBZ/PDF files from them,
+with a configurable page count, page dimensions, image format and
+archive compression.
+"""
+
+from __future__ import annotations
+
+import random
+import zipfile
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from PIL import Image
+
+from cbz.comic import ComicInfo
+from cbz.constants import PageType
+from cbz.page import PageInfo
+
+# Archive compression methods by name
+COMPRESSIONS: Dict[str, int] = {
+    "stored": zipfile.ZIP_STORED,
+    "deflated": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+
+# Pillow format names by image format
+FORMATS: Dict[str, str] = {"jpeg": "JPEG", "png": "PNG", "webp": "WEBP"}
+
+# Side of the random texture scaled up to the page size
+_TEXTURE_SIZE = 64
+
+
+@dataclass
+class FixtureSpec:
+    """Parameters of a synthetic comic.
+
+    Attributes:
+        pages: Number of pages.
+        width: Page width in pixels.
+        height: Page height in pixels.
+        format: Image format of the pages (jpeg, png or webp).
+        compression: Compression of the CBZ members (stored, deflated, bzip2 or lzma).
+    """
+
+    pages: int = 20
+    width: int = 1200
+    height: int = 1800
+    format: str = "jpeg"
+    compression: str = "stored"
+
+    def __post_init__(self) -> None:
+        if self.format not in FORMATS:
+            raise ValueError(f"Unknown image format: {self.format}")
+        if self.compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {self.compression}")
+
+
+def make_image(size: Tuple[int, int], image_format: str = "jpeg", seed: int = 0) -> bytes:
+    """Create a page image with a smooth random texture.
+
+    The texture compresses like a scanned page rather than like noise
+    or a flat color. The same seed always gives the same image.
+
+    Args:
+        size: Image dimensions (width, height).
+        image_format: Image format (jpeg, png or webp).
+        seed: Seed of the random texture.
+
+    Returns:
+        Encoded image data.
+    """
+    texture = random.Random(seed).randbytes(_TEXTURE_SIZE * _TEXTURE_SIZE * 3)
+    img = Image.frombytes("RGB", (_TEXTURE_SIZE, _TEXTURE_SIZE), texture)
+    img = img.resize(size, Image.Resampling.BICUBIC)
+
+    buffer = BytesIO()
+    img.save(buffer, format=FORMATS[image_format], quality=85)
+    return buffer.getvalue()
+
+
+def make_pages(spec: FixtureSpec) -> List[PageInfo]:
+    """Create the pages of a synthetic comic."""
+    return [
+        PageInfo.loads(
+            make_image((spec.width, spec.height), spec.format, seed=i),
+            type=PageType.FRONT_COVER if i == 0 else PageType.STORY,
+            name=f"page-{i:04}.{spec.format}",
+        )
+        for i in range(spec.pages)
+    ]
+
+
+def make_comic(spec: FixtureSpec) -> ComicInfo:
+    """Create a synthetic comic with metadata."""
+    return ComicInfo.from_pages(
+        pages=make_pages(spec),
+        title="Benchmark",
+        series="Benchmark Series",
+        number=1,
+        year=2024,
+        summary="Synthetic comic generated for benchmarks.",
+    )
+
+
+def make_cbz(path: Path, spec: FixtureSpec) -> Path:
+    """Write a synthetic CBZ file.
+
+    Args:
+        path: Destination file path.
+        spec: Parameters of the comic.
+
+    Returns:
+        Path of the written file.
+    """
+    make_comic(spec).save(path, compression=COMPRESSIONS[spec.compression])
+    return path
+
+
+def make_pdf(path: Path, spec: FixtureSpec) -> Path:
+    """Write a synthetic PDF file, one image per page.
+
+    Args:
+        path: Destination file path.
+        spec: Parameters of the comic.
+
+    Returns:
+        Path of the written file.
+    """
+    make_comic(spec).save_pdf(path)
+    return path
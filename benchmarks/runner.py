@@ -0,0 +1,245 @@
+"""
+Benchmark cases, measurements and comparison.
+
+Each case prepares its inputs once, then its timed callable is run
+several times: the minimum and median durations are reported, and
+the peak Python memory allocated by one extra run is measured with
+tracemalloc (kept out of the timed runs, which it would slow down).
+"""
+
+from __future__ import annotations
+
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, Optional
+
+import PIL
+
+import cbz
+from cbz.comic import ComicInfo
+from cbz.render import fit_size, render
+
+from benchmarks.fixtures import FixtureSpec, make_cbz, make_pdf
+
+# Window size used for the player rendering case
+RENDER_SIZE = (1280, 800)
+
+# Threads used by the parallel loading case (compare with from_cbz)
+LOAD_WORKERS = 4
+
+
+@dataclass
+class Fixtures:
+    """Synthetic files shared by the benchmark cases.
+
+    Attributes:
+        spec: Parameters of the synthetic comic.
+        cbz: Path of the CBZ file.
+        pdf: Path of the PDF file.
+        directory: Directory for the files written by the cases.
+    """
+
+    spec: FixtureSpec
+    cbz: Path
+    pdf: Path
+    directory: Path
+
+
+Case = Callable[[Fixtures], ContextManager[Callable[[], object]]]
+
+# Benchmark cases by name, in registration order
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Callable[[Fixtures], Iterator[Callable[[], object]]]], Case]:
+    """Register a benchmark case.
+
+    The decorated generator prepares the inputs, yields the callable
+    to time, and releases the inputs once resumed.
+    """
+    def register(func: Callable[[Fixtures], Iterator[Callable[[], object]]]) -> Case:
+        CASES[name] = contextmanager(func)
+        return CASES[name]
+    return register
+
+
+@case("from_cbz")
+def _from_cbz(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    yield lambda: ComicInfo.from_cbz(fixtures.cbz)
+
+
+@case("from_cbz_workers")
+def _from_cbz_workers(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    yield lambda: ComicInfo.from_cbz(fixtures.cbz, workers=LOAD_WORKERS)
+
+
+@case("from_cbz_lazy")
+def _from_cbz_lazy(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    yield lambda: ComicInfo.from_cbz(fixtures.cbz, lazy=True).close()
+
+
+@case("read_info")
+def _read_info(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    yield lambda: ComicInfo.read_info(fixtures.cbz)
+
+
+@case("from_pdf")
+def _from_pdf(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    yield lambda: ComicInfo.from_pdf(fixtures.pdf)
+
+
+@case("get_info")
+def _get_info(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    with ComicInfo.from_cbz(fixtures.cbz, lazy=True) as comic:
+        yield comic.get_info
+
+
+@case("pack")
+def _pack(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    comic = ComicInfo.from_cbz(fixtures.cbz)
+    yield comic.pack
+
+
+@case("pack_deflated")
+def _pack_deflated(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    comic = ComicInfo.from_cbz(fixtures.cbz)
+    yield lambda: comic.pack(compression=zipfile.ZIP_DEFLATED)
+
+
+@case("save")
+def _save(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    output = fixtures.directory / "save.cbz"
+    with ComicInfo.from_cbz(fixtures.cbz, lazy=True) as comic:
+        yield lambda: comic.save(output)
+
+
+@case("save_pdf")
+def _save_pdf(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    output = fixtures.directory / "save.pdf"
+    with ComicInfo.from_cbz(fixtures.cbz, lazy=True) as comic:
+        yield lambda: comic.save_pdf(output)
+
+
+@case("render")
+def _render(fixtures: Fixtures) -> Iterator[Callable[[], object]]:
+    # Pages scaled to fit the player window, as the player renders them
+    comic = ComicInfo.from_cbz(fixtures.cbz)
+    pages = [(p.content, fit_size(p.image_width, p.image_height, *RENDER_SIZE)) for p in comic]
+
+    def run() -> None:
+        for content, size in pages:
+            render(content, size)
+    yield run
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> Dict[str, float]:
+    """Time a callable and measure its peak memory.
+
+    Args:
+        func: Callable to measure.
+        repeat: Number of timed runs, after one warm-up run.
+
+    Returns:
+        Dictionary with the min and median durations in seconds, and
+        the peak memory in bytes allocated by Python during one run.
+    """
+    func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"min": min(times), "median": statistics.median(times), "peak_memory": peak}
+
+
+def run(spec: FixtureSpec, repeat: int = 5, names: Optional[Iterable[str]] = None,
+        progress: Optional[Callable[[str], None]] = None) -> dict:
+    """Run benchmark cases on a synthetic comic.
+
+    Args:
+        spec: Parameters of the synthetic comic.
+        repeat: Number of timed runs per case.
+        names: Names of the cases to run (default: all).
+        progress: Called with the name of each case before it runs.
+
+    Returns:
+        JSON-serializable report with the environment, the fixture
+        parameters and the results of each case.
+
+    Raises:
+        KeyError: If a case name is unknown.
+    """
+    names = list(names) if names is not None else list(CASES)
+    cases = [(name, CASES[name]) for name in names]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        fixtures = Fixtures(spec, make_cbz(directory / "comic.cbz", spec),
+                            make_pdf(directory / "comic.pdf", spec), directory)
+        for name, bench in cases:
+            if progress is not None:
+                progress(name)
+            with bench(fixtures) as func:
+                results[name] = measure(func, repeat)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cbz": cbz.__version__,
+            "pillow": PIL.__version__,
+        },
+        "fixture": asdict(spec),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1) -> List[dict]:
+    """Compare benchmark results against a baseline.
+
+    The median duration and the peak memory of each case present in
+    both reports are compared; a case regresses when a value exceeds
+    the baseline by more than the threshold.
+
+    Args:
+        baseline: Report of the reference run.
+        current: Report of the run to check.
+        threshold: Tolerated relative increase (0.1 for 10%).
+
+    Returns:
+        One entry per case and metric: name, metric, baseline value,
+        current value, ratio and whether it is a regression.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        for metric in ("median", "peak_memory"):
+            ratio = result[metric] / reference[metric] if reference[metric] else 1.0
+            rows.append({
+                "name": name,
+                "metric": metric,
+                "baseline": reference[metric],
+                "current": result[metric],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            })
+    return rows
@@ -7,6 +7,7 @@ CBR (Comic Book RAR) and PDF files.
 
 from cbz.comic import ComicInfo
 from cbz.page import PageInfo
+from cbz.table import PageTable, PageView
 from cbz.constants import (
     AgeRating,
     Format,
@@ -28,6 +29,8 @@ __version__ = "4.0.0"
 __all__ = [
     "ComicInfo",
     "PageInfo",
+    "PageTable",
+    "PageView",
     "AgeRating",
     "Format",
     "LanguageISO",
@@ -6,8 +6,8 @@ import argparse
 import sys
 from pathlib import Path
 
-from cbz.comic import ComicInfo
 from cbz.exceptions import CBZError
+from cbz.player import Player
 
 
 def main() -> None:
@@ -21,6 +21,11 @@ def main() -> None:
         metavar="<file>",
         help="Path to the CBZ, CBR or PDF comic book file."
     )
+    parser.add_argument(
+        "-c", "--continuous",
+        action="store_true",
+        help="Display pages in a continuous vertical scroll (webtoon mode)."
+    )
     args = parser.parse_args()
 
     path: Path = args.comic_path
@@ -29,15 +34,9 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        suffix = path.suffix.lower()
-        if suffix == ".pdf":
-            comic = ComicInfo.from_pdf(path)
-        elif suffix == ".cbr":
-            comic = ComicInfo.from_cbr(path)
-        else:
-            comic = ComicInfo.from_cbz(path)
-
-        comic.show()
+        # Pages are loaded in the background once the window is shown
+        player = Player(path, continuous=args.continuous)
+        player.run()
     except CBZError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,285 @@
+"""
+Archive access helpers.
+
+Provides the ArchiveSource class, a shared handle on a CBZ/CBR
+archive used to read page content on demand, and low-level helpers
+to copy compressed ZIP members between archives.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import threading
+import time
+import zipfile
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple, Union
+
+from cbz.exceptions import CBZError
+
+# ZIP local file header: signature and fixed-size fields
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+LOCAL_SIGNATURE = b"PK\x03\x04"
+
+# General purpose flags kept when copying a member (compression options)
+_COPY_FLAGS = 0x06
+_ENCRYPTED_FLAG = 0x01
+
+# Oldest and newest CPython versions whose private zipfile internals, used
+# by copy_member(), compress_member() and ComicInfo.update_metadata(), were
+# verified: ZipFile._lock, _writing, _seekable, _writecheck(), _didModify,
+# start_dir, filelist, NameToInfo and zipfile._get_compressor(). Checked on
+# CPython 3.9.18, 3.10.13, 3.11.7, 3.12.1 and 3.13.0.
+ZIP_INTERNALS_VERSIONS = ((3, 9), (3, 13))
+
+
+def zip_internals_supported() -> bool:
+    """True if the running Python has verified zipfile internals.
+
+    Otherwise, callers fall back to the public ZipFile API: members are
+    compressed again with ZipFile.writestr() instead of being copied.
+    """
+    oldest, newest = ZIP_INTERNALS_VERSIONS
+    return oldest <= sys.version_info[:2] <= newest
+
+
+def _check_zip_internals() -> None:
+    """Refuse to use zipfile internals on unverified Python versions."""
+    if not zip_internals_supported():
+        raise CBZError(
+            f"zipfile internals not verified on Python {sys.version_info[0]}.{sys.version_info[1]}"
+        )
+
+
+def _fingerprint(path: Path) -> Tuple[int, int]:
+    """Return a cheap identity of the file content (size, mtime)."""
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def copy_member(zf: zipfile.ZipFile, name: str, info: zipfile.ZipInfo, data: bytes) -> None:
+    """Write an already compressed member to a ZipFile open for writing.
+
+    The compressed stream and CRC are written verbatim, bypassing
+    compression and checksum computation.
+
+    Args:
+        zf: Destination archive, open in "w", "x" or "a" mode.
+        name: Member name in the destination archive.
+        info: Member information (compression, CRC and sizes) of the data.
+        data: Compressed member data.
+
+    Raises:
+        CBZError: If zip_internals_supported() is False.
+    """
+    _check_zip_internals()
+    zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = info.compress_type
+    zinfo.flag_bits = info.flag_bits & _COPY_FLAGS
+    zinfo.external_attr = 0o600 << 16
+    zinfo.CRC = info.CRC
+    zinfo.file_size = info.file_size
+    zinfo.compress_size = len(data)
+
+    with zf._lock:
+        if zf._writing:
+            raise ValueError("Can't write to the ZIP file while there is an open writing handle")
+        if zf._seekable:
+            zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zf.fp.write(zinfo.FileHeader())
+        zf.fp.write(data)
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf.start_dir = zf.fp.tell()
+
+
+def compress_member(data: bytes, compress_type: int) -> Tuple[zipfile.ZipInfo, bytes]:
+    """Compress data as a ZIP member stream, outside of any ZipFile.
+
+    The zlib, bz2 and lzma compressors release the GIL, so this can
+    run concurrently on several threads before copy_member() writes
+    the results in order.
+
+    Args:
+        data: Uncompressed member data.
+        compress_type: ZIP compression method.
+
+    Returns:
+        Tuple (info, compressed data) suitable for copy_member().
+
+    Raises:
+        CBZError: If zip_internals_supported() is False.
+    """
+    _check_zip_internals()
+    info = zipfile.ZipInfo()
+    info.compress_type = compress_type
+    info.CRC = zlib.crc32(data)
+    info.file_size = len(data)
+    if compress_type == zipfile.ZIP_STORED:
+        compressed = data
+    else:
+        compressor = zipfile._get_compressor(compress_type)
+        compressed = compressor.compress(data) + compressor.flush()
+        if compress_type == zipfile.ZIP_LZMA:
+            # Compressed data includes an end-of-stream (EOS) marker
+            info.flag_bits |= 0x02
+    info.compress_size = len(compressed)
+    return info, compressed
+
+
+class ArchiveSource:
+    """Shared, lazily opened handle on a CBZ or CBR archive.
+
+    The underlying archive is opened on first access and can be closed
+    at any time; it is transparently reopened by the next read, unless
+    the file has changed on disk in the meantime. The member information
+    read when the archive is first opened is kept, so it stays available
+    without reopening the archive.
+
+    Attributes:
+        path: Path to the archive file.
+        opener: Archive class (zipfile.ZipFile or rarfile.RarFile).
+    """
+
+    def __init__(self, path: Union[Path, str], opener: type) -> None:
+        """Initialize the source without opening the archive.
+
+        Args:
+            path: Path to the archive file.
+            opener: Archive class (zipfile.ZipFile or rarfile.RarFile).
+        """
+        self.path = Path(path)
+        self.opener = opener
+        self._archive = None
+        self._raw: Optional[BinaryIO] = None
+        self._infos: Optional[dict] = None
+        self._lock = threading.Lock()
+        self._fingerprint = _fingerprint(self.path)
+
+    def _check_unchanged(self) -> None:
+        """Refuse to reopen an archive modified since it was first read."""
+        if _fingerprint(self.path) != self._fingerprint:
+            raise CBZError(f"Archive has changed on disk: {self.path}")
+
+    def _open(self):
+        """Open the underlying archive object."""
+        return self.opener(self.path, "r")
+
+    @property
+    def archive(self):
+        """Open archive object, opened on first access."""
+        with self._lock:
+            if self._archive is None:
+                self._check_unchanged()
+                self._archive = self._open()
+                if self._infos is None and hasattr(self._archive, "infolist"):
+                    self._infos = {info.filename: info for info in self._archive.infolist()}
+            return self._archive
+
+    def open_archive(self):
+        """Open a new archive object, independent of the shared one.
+
+        Used to read members from several threads without contending
+        for a single file handle; the caller must close it.
+        """
+        self._check_unchanged()
+        return self._open()
+
+    @property
+    def is_open(self) -> bool:
+        """True if the archive or a raw file handle on it is open."""
+        return self._archive is not None or self._raw is not None
+
+    @property
+    def is_zip(self) -> bool:
+        """True if the source is a ZIP archive (CBZ)."""
+        return issubclass(self.opener, zipfile.ZipFile)
+
+    def getinfo(self, name: str):
+        """Return the archive information of a member.
+
+        Raises:
+            KeyError: If the archive has no such member.
+        """
+        if self._infos is None:
+            return self.archive.getinfo(name)
+        return self._infos[name]
+
+    def read(self, name: str) -> bytes:
+        """Read the full content of an archive member.
+
+        Args:
+            name: Member name inside the archive.
+
+        Returns:
+            Uncompressed member data.
+        """
+        return self.archive.read(name)
+
+    def open(self, name: str) -> BinaryIO:
+        """Open an archive member for streaming reads.
+
+        Args:
+            name: Member name inside the archive.
+
+        Returns:
+            Binary file object of the uncompressed member data.
+        """
+        return self.archive.open(name, "r")
+
+    def read_raw(self, name: str) -> Tuple[zipfile.ZipInfo, Optional[bytes]]:
+        """Read the compressed stream of a ZIP member without decompressing it.
+
+        Args:
+            name: Member name inside the archive.
+
+        Returns:
+            Tuple (info, data). data is None if the member cannot be
+            copied verbatim (non-ZIP source or encrypted member).
+        """
+        info = self.getinfo(name)
+        if not self.is_zip or info.flag_bits & _ENCRYPTED_FLAG:
+            return info, None
+
+        with self._lock:
+            if self._raw is None:
+                self._check_unchanged()
+                self._raw = self.path.open("rb")
+            self._raw.seek(info.header_offset)
+            header = LOCAL_HEADER.unpack(self._raw.read(LOCAL_HEADER.size))
+            if header[0] != LOCAL_SIGNATURE:
+                raise CBZError(f"Bad local file header for member {name!r}")
+            # Skip the variable-length file name and extra field
+            self._raw.seek(header[-2] + header[-1], 1)
+            return info, self._raw.read(info.compress_size)
+
+    def close(self) -> None:
+        """Close the underlying archive if it is open."""
+        with self._lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+            if self._raw is not None:
+                self._raw.close()
+                self._raw = None
+
+    def __enter__(self) -> ArchiveSource:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # Open handles and locks cannot be pickled, only the location is kept
+        return {"path": self.path, "opener": self.opener}
+
+    def __setstate__(self, state: dict) -> None:
+        ArchiveSource.__init__(self, state["path"], state["opener"])
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.path)!r})"
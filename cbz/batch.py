@@ -0,0 +1,111 @@
+"""
+Batch loading of comic libraries.
+
+Loads many CBZ, CBR and PDF files in a process pool, streaming
+results back as they complete. Errors are reported per file
+without aborting the batch.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+from cbz.comic import ComicInfo
+
+
+@dataclass
+class BatchResult:
+    """Outcome of loading one file in a batch.
+
+    Attributes:
+        path: Path of the loaded file.
+        comic: Loaded comic, None if loading failed.
+        error: Exception raised while loading, None on success.
+    """
+
+    path: Path
+    comic: Optional[ComicInfo] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was loaded successfully."""
+        return self.error is None
+
+
+def load_file(path: Union[Path, str], metadata_only: bool = False) -> ComicInfo:
+    """Load a comic file, choosing the loader from its extension.
+
+    Args:
+        path: Path to a .cbz, .cbr or .pdf file.
+        metadata_only: If True, read only metadata (see ComicInfo.read_info);
+            PDF files are loaded lazily, their JPEG pages being read on access.
+
+    Returns:
+        Loaded ComicInfo instance.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".pdf":
+        return ComicInfo.from_pdf(path, lazy=metadata_only)
+    if metadata_only:
+        return ComicInfo.read_info(path)
+    if suffix == ".cbr":
+        return ComicInfo.from_cbr(path)
+    return ComicInfo.from_cbz(path)
+
+
+def load(paths: Iterable[Union[Path, str]], metadata_only: bool = False,
+         max_workers: Optional[int] = None, max_pending: Optional[int] = None) -> Iterator[BatchResult]:
+    """Load comic files in parallel worker processes.
+
+    Results are yielded in completion order. At most max_pending files
+    are submitted at once, so the paths iterable is consumed
+    progressively and memory stays bounded for large libraries.
+
+    Args:
+        paths: Paths of the files to load.
+        metadata_only: If True, read only metadata (see ComicInfo.read_info).
+        max_workers: Number of worker processes (default: CPU count).
+        max_pending: Maximum number of files in flight (default: 2 * max_workers).
+
+    Yields:
+        BatchResult for each file, with either the comic or the error.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max(max_pending or 2 * max_workers, 1)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending: Dict[Future, Path] = {}
+        paths = iter(paths)
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    path = next(paths, None)
+                    if path is None:
+                        exhausted = True
+                        break
+                    path = Path(path)
+                    pending[executor.submit(load_file, path, metadata_only)] = path
+
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        yield BatchResult(path=path, comic=future.result())
+                    else:
+                        yield BatchResult(path=path, error=error)
+        finally:
+            # Do not wait for files nobody will consume
+            for future in pending:
+                future.cancel()
@@ -9,26 +9,57 @@ from __future__ import annotations
 
 import functools
 import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
 import typing
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
 from io import BytesIO
 from pathlib import Path
-from typing import Iterator, List, Union
+from typing import BinaryIO, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 import rarfile
-import xmltodict
+from PIL import Image
 from pypdf import PdfReader
 
-from cbz.constants import IMAGE_FORMATS, XML_NAME
-from cbz.exceptions import EmptyArchiveError, InvalidMetadataError
+from cbz import instrumentation
+from cbz.archive import ArchiveSource, compress_member, copy_member, zip_internals_supported
+from cbz.constants import IMAGE_FORMATS, XML_NAME, LanguageISO
+from cbz.exceptions import (
+    CBZError,
+    EmptyArchiveError,
+    InvalidMetadataError,
+    UnsupportedFormatError
+)
+from cbz.metadata import iter_xml, parse_xml
 from cbz.models import ComicModel, PageModel
-from cbz.page import PageInfo
+from cbz.page import CONVERT_QUALITY, SUFFIX_ALIASES, PageInfo, read_image_info
+from cbz.pdf import (
+    PdfSource,
+    get_xobject,
+    is_inline,
+    member_name,
+    verbatim_jpeg,
+    verbatim_jpeg_info,
+    write_pdf
+)
+from cbz.probe import PROBE_SIZE, probe
+from cbz.table import PageTable
+from cbz.thumbnail import THUMBNAIL_SIZE, ThumbnailCache
+from cbz.transcode import TranscodeResult, resize_pages, transcode_pages
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct values remembered per memoized field converter
+CONVERTER_CACHE_SIZE = 1024
+
 
 @functools.lru_cache(maxsize=None)
 def _resolve_type_hints(model_cls: type) -> dict:
@@ -50,68 +81,91 @@ def _resolve_type_hints(model_cls: type) -> dict:
     return resolved
 
 
-def _extract_fields(items: dict, model_cls: type) -> dict:
-    """Extract and convert XML fields to Python model fields.
+def _parse_bool(value: str) -> bool:
+    """Convert an XML boolean (true, false, 1 or 0)."""
+    text = value.strip().lower()
+    if text in ("true", "1"):
+        return True
+    if text in ("false", "0"):
+        return False
+    raise ValueError(f"Invalid boolean: {value!r}")
 
-    Iterates over the dataclass fields of model_cls, looks up the
-    XML correspondence in items, and converts values to the correct type.
 
-    Args:
-        items: Dictionary of parsed XML elements/attributes.
-        model_cls: Dataclass class (ComicModel or PageModel).
+def _memoize(converter: Callable[[str], object]) -> Callable[[str], object]:
+    """Cache the results of a converter whose values repeat across files."""
+    return functools.lru_cache(maxsize=CONVERTER_CACHE_SIZE)(converter)
 
-    Returns:
-        Dictionary {python_name: converted_value}.
-    """
-    type_hints = _resolve_type_hints(model_cls)
-    result = {}
-    for f in fields(model_cls):
-        xml_name = f.metadata.get("xml_name")
-        if xml_name and xml_name in items:
-            raw = items[xml_name]
-            try:
-                field_type = type_hints.get(f.name, str)
-                result[f.name] = field_type(raw)
-            except (ValueError, KeyError):
-                logger.warning("Unable to convert field %s=%r", xml_name, raw)
-    return result
-
-
-def _serialize_fields(obj: object, model_cls: type) -> dict:
-    """Serialize object fields to an XML dictionary.
-
-    Ignores fields with default/empty values (empty strings, None, UNKNOWN).
-
-    Args:
-        obj: Model instance.
-        model_cls: Dataclass class of the model.
-
-    Returns:
-        Dictionary {xml_name: value} ready for XML serialization.
+
+class _ModelCodec:
+    """Conversion of a model class from and to XML values.
+
+    Compiled once per model class (see _codec()): the dataclass fields
+    and their types are resolved up front, so conversions only run
+    table lookups. Enum and language code conversions are memoized,
+    as the same values occur on every page and in every file.
+
+    Attributes:
+        table: {xml_name: (python_name, converter)} for parsing, with
+            attribute names stored without their @ prefix.
+        fields: (python_name, xml_name, skipped default) of serialized
+            fields: their enum default, or 0 for sizes (unknown).
     """
-    result = {}
-    for f in fields(model_cls):
-        xml_name = f.metadata.get("xml_name")
-        if not xml_name:
-            continue
-
-        value = getattr(obj, f.name)
-
-        # Skip default / empty values
-        if value is None:
-            continue
-        if isinstance(value, str) and not value:
-            continue
-        if isinstance(value, Enum) and value == f.default:
-            continue
-
-        # Convert enums to their string value
-        if isinstance(value, Enum):
-            result[xml_name] = value.value
-        else:
-            result[xml_name] = value
 
-    return result
+    def __init__(self, model_cls: type) -> None:
+        type_hints = _resolve_type_hints(model_cls)
+        self.table: Dict[str, Tuple[str, Callable[[str], object]]] = {}
+        self.fields: List[Tuple[str, str, Optional[Union[Enum, int]]]] = []
+        for f in fields(model_cls):
+            xml_name = f.metadata.get("xml_name")
+            if not xml_name:
+                continue
+
+            field_type = type_hints.get(f.name, str)
+            if field_type is bool:
+                converter = _parse_bool
+            elif isinstance(field_type, type) and issubclass(field_type, (Enum, LanguageISO)):
+                converter = _memoize(field_type)
+            else:
+                converter = field_type
+            self.table[xml_name.lstrip("@")] = (f.name, converter)
+            skipped = f.default if isinstance(f.default, Enum) or (field_type is int and f.default == 0) else None
+            self.fields.append((f.name, xml_name, skipped))
+
+    def serialize(self, obj: object) -> dict:
+        """Serialize object fields to an XML dictionary.
+
+        Ignores fields with default/empty values (empty strings, None,
+        UNKNOWN, and zero sizes or dimensions, e.g. of pages whose header
+        was not read).
+
+        Args:
+            obj: Model instance.
+
+        Returns:
+            Dictionary {xml_name: value} ready for XML serialization.
+        """
+        result = {}
+        for name, xml_name, skipped in self.fields:
+            value = getattr(obj, name)
+
+            # Skip default / empty values (enum members are singletons)
+            if value is None or value == "" or (skipped is not None and value == skipped):
+                continue
+
+            # Convert enums to their string value
+            result[xml_name] = value.value if isinstance(value, Enum) else value
+        return result
+
+
+@functools.lru_cache(maxsize=None)
+def _codec(model_cls: type) -> _ModelCodec:
+    """Return the codec of a model class, compiled on first use."""
+    return _ModelCodec(model_cls)
+
+
+def _compressed_size(zf: zipfile.ZipFile, start: int) -> int:
+    """Return the compressed size of the members written after the first start ones."""
+    return sum(info.compress_size for info in zf.infolist()[start:])
 
 
 @dataclass
@@ -127,7 +181,7 @@ class ComicInfo(ComicModel):
         - for page in comic: iterates over pages
 
     Attributes:
-        pages: List of comic pages.
+        pages: List of comic pages, or a PageTable (see compact loading).
     """
 
     pages: List[PageInfo] = field(default_factory=list)
@@ -148,25 +202,57 @@ class ComicInfo(ComicModel):
         return cls(pages=pages, **kwargs)
 
     @classmethod
-    def _from_archive(cls, path: Union[Path, str], opener: type) -> ComicInfo:
+    def _from_archive(cls, path: Union[Path, str], opener: type, lazy: bool = False,
+                      workers: int = 1, compact: bool = False) -> ComicInfo:
         """Load a comic from an archive file (CBZ or CBR).
 
         Args:
             path: Path to the archive file.
             opener: Archive class (zipfile.ZipFile or rarfile.RarFile).
+            lazy: If True, keep the archive open and read pages on access.
+            workers: Number of threads reading page members.
+            compact: If True, store pages in a PageTable.
 
         Returns:
             ComicInfo instance with pages and metadata.
         """
-        with opener(Path(path), "r") as archive:
-            return cls._process_archive(archive)
+        source = ArchiveSource(path, opener)
+        if not lazy:
+            with source:
+                return cls._process_archive(source, workers=workers, compact=compact)
+
+        try:
+            return cls._process_archive(source, lazy=True, workers=workers, compact=compact)
+        except Exception:
+            source.close()
+            raise
 
     @classmethod
-    def from_cbz(cls, path: Union[Path, str]) -> ComicInfo:
+    def from_cbz(cls, path: Union[Path, str], lazy: bool = False, workers: int = 1,
+                 compact: bool = False) -> ComicInfo:
         """Load a comic from a CBZ (ZIP) file.
 
+        In lazy mode only ComicInfo.xml and the image headers are read;
+        page content is fetched from the archive when accessed. Call
+        close() (or use the comic as a context manager) to release the
+        archive handle.
+
+        With workers > 1, page members are read and decompressed on a
+        thread pool, each thread with its own archive handle, while
+        pages are validated in order on the calling thread; page order
+        and errors are the same as with sequential loading. This only
+        pays off for compressed members; it is ignored in lazy mode.
+
+        In compact mode, pages are stored in a columnar PageTable and
+        accessed as PageView objects, which reduces the memory used per
+        page; combined with lazy loading, this suits comics with
+        thousands of pages.
+
         Args:
             path: Path to the .cbz file.
+            lazy: If True, read page content on demand.
+            workers: Number of threads reading page members (default: 1).
+            compact: If True, store pages in a PageTable.
 
         Returns:
             ComicInfo instance with pages and metadata.
@@ -174,14 +260,18 @@ class ComicInfo(ComicModel):
         Raises:
             EmptyArchiveError: If the archive contains no images.
         """
-        return cls._from_archive(path, zipfile.ZipFile)
+        return cls._from_archive(path, zipfile.ZipFile, lazy=lazy, workers=workers, compact=compact)
 
     @classmethod
-    def from_cbr(cls, path: Union[Path, str]) -> ComicInfo:
+    def from_cbr(cls, path: Union[Path, str], lazy: bool = False, workers: int = 1,
+                 compact: bool = False) -> ComicInfo:
         """Load a comic from a CBR (RAR) file.
 
         Args:
             path: Path to the .cbr file.
+            lazy: If True, read page content on demand (see from_cbz).
+            workers: Number of threads reading page members (see from_cbz).
+            compact: If True, store pages in a PageTable (see from_cbz).
 
         Returns:
             ComicInfo instance with pages and metadata.
@@ -189,17 +279,24 @@ class ComicInfo(ComicModel):
         Raises:
             EmptyArchiveError: If the archive contains no images.
         """
-        return cls._from_archive(path, rarfile.RarFile)
+        return cls._from_archive(path, rarfile.RarFile, lazy=lazy, workers=workers, compact=compact)
 
     @classmethod
-    def from_pdf(cls, path: Union[Path, str]) -> ComicInfo:
+    def from_pdf(cls, path: Union[Path, str], lazy: bool = False) -> ComicInfo:
         """Load a comic from a PDF file (image extraction).
 
         Only images are extracted; PDF metadata is not converted
-        to ComicInfo metadata.
+        to ComicInfo metadata. JPEG (DCTDecode) images are copied
+        verbatim from their stream; other images are decoded by pypdf.
+
+        In lazy mode, verbatim JPEG pages are read from the PDF file
+        when accessed and not kept in memory; their dimensions are read
+        from the image dictionaries, without decoding the images. Call
+        close() to release the file handle.
 
         Args:
             path: Path to the .pdf file.
+            lazy: If True, read JPEG page content on demand.
 
         Returns:
             ComicInfo instance with extracted images.
@@ -207,16 +304,157 @@ class ComicInfo(ComicModel):
         Raises:
             EmptyArchiveError: If the PDF contains no images.
         """
-        pages: List[PageInfo] = []
-        reader = PdfReader(Path(path))
-        for pdf_page in reader.pages:
-            for image in pdf_page.images:
-                pages.append(PageInfo.loads(data=image.data))
-
+        source = PdfSource(path) if lazy else None
+        with instrumentation.phase("from_pdf", "pages", path) as span:
+            pages = list(cls._iter_pdf_pages(path, source))
+            if span:
+                span.pages = len(pages)
+                span.bytes_read = sum(p.image_size for p in pages if p._content)
         if not pages:
             raise EmptyArchiveError("No valid images found in PDF file")
         return cls.from_pages(pages=pages)
 
+    @classmethod
+    def open_progressive(cls, path: Union[Path, str]) -> Tuple[ComicInfo, Iterator[PageInfo]]:
+        """Open a comic file and load its pages incrementally.
+
+        Only the metadata (ComicInfo.xml and the archive directory) is
+        read before returning. The comic starts without pages; each page
+        is appended to it when the returned iterator loads it, so pages
+        already loaded can be used while the others are read, for
+        instance from another thread. Instrumentation hooks receive the
+        same phases as with from_cbz(), from_cbr() or from_pdf().
+
+        Args:
+            path: Path to a .cbz, .cbr or .pdf file.
+
+        Returns:
+            Tuple (comic, iterator loading the pages in order).
+
+        Raises:
+            InvalidMetadataError: If ComicInfo.xml is invalid.
+        """
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix == ".pdf":
+            return cls._append_pages(cls(), cls._iter_pdf_pages(path), "from_pdf", path)
+
+        source = ArchiveSource(path, rarfile.RarFile if suffix == ".cbr" else zipfile.ZipFile)
+        try:
+            comic_kwargs, members = cls._read_directory(source)
+        except Exception:
+            source.close()
+            raise
+        return cls._append_pages(cls(**comic_kwargs), cls._iter_archive_pages(source, members), "load", path)
+
+    @classmethod
+    def read_info(cls, path: Union[Path, str], compact: bool = False) -> ComicInfo:
+        """Read comic metadata from a CBZ or CBR file without reading pages.
+
+        Only ComicInfo.xml and the archive directory are read. Pages carry
+        their name and size from the archive, and their dimensions and
+        attributes from ComicInfo.xml when present; their content remains
+        readable on access, as with lazy loading.
+
+        Args:
+            path: Path to the .cbz or .cbr file.
+            compact: If True, store pages in a PageTable (see from_cbz).
+
+        Returns:
+            ComicInfo instance with metadata and lazily loaded pages.
+
+        Raises:
+            UnsupportedFormatError: If the file is neither a ZIP nor a RAR archive.
+            InvalidMetadataError: If ComicInfo.xml is invalid.
+        """
+        if zipfile.is_zipfile(path):
+            opener = zipfile.ZipFile
+        elif rarfile.is_rarfile(path):
+            opener = rarfile.RarFile
+        else:
+            raise UnsupportedFormatError(f"Not a CBZ or CBR file: {path}")
+
+        source = ArchiveSource(path, opener)
+        with source:
+            return cls._process_archive(source, lazy=True, probe_headers=False, compact=compact)
+
+    @classmethod
+    def update_metadata(cls, path: Union[Path, str], **kwargs) -> None:
+        """Update the ComicInfo.xml of a CBZ file without rewriting its pages.
+
+        The new ComicInfo.xml is appended after the existing members and
+        the central directory is rewritten; page data is left untouched
+        on disk. The previous ComicInfo.xml is reclaimed if it is the
+        last member, otherwise it remains as unreferenced bytes.
+
+        On Python versions whose zipfile internals are not verified (see
+        cbz.archive.zip_internals_supported()), the archive is rewritten
+        to a temporary file instead, members being copied one by one.
+
+        Args:
+            path: Path to the .cbz file.
+            **kwargs: Comic metadata fields to update (title, series, etc.).
+
+        Raises:
+            UnsupportedFormatError: If the file is not a ZIP archive.
+            TypeError: If a keyword is not a comic metadata field.
+        """
+        path = Path(path)
+        if not zipfile.is_zipfile(path):
+            raise UnsupportedFormatError(f"In-place update requires a CBZ (ZIP) file: {path}")
+
+        names = {f.name for f in fields(ComicModel)}
+        for key in kwargs:
+            if key not in names:
+                raise TypeError(f"update_metadata() got an unexpected keyword argument {key!r}")
+
+        # Only ComicInfo.xml and the archive directory are read, as read_info() does
+        comic = cls.read_info(path)
+        for key, value in kwargs.items():
+            setattr(comic, key, value)
+        xml_content = comic._dump_xml()
+
+        if not zip_internals_supported():
+            cls._rewrite_metadata(path, xml_content)
+            return
+
+        with zipfile.ZipFile(path, "a") as zf:
+            compression = zipfile.ZIP_STORED
+            old = zf.NameToInfo.pop(XML_NAME, None)
+            if old is not None:
+                compression = old.compress_type
+                zf.filelist.remove(old)
+                if all(info.header_offset < old.header_offset for info in zf.filelist):
+                    # Last member: overwrite it instead of leaving a gap
+                    zf.start_dir = old.header_offset
+            zf.writestr(XML_NAME, xml_content, compress_type=compression)
+
+    @staticmethod
+    def _rewrite_metadata(path: Path, xml_content: bytes) -> None:
+        """Replace the ComicInfo.xml of a CBZ file by rewriting the whole archive.
+
+        Members keep their name, date and compression method; the new
+        archive replaces the original once complete.
+        """
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            with zipfile.ZipFile(path) as src, zipfile.ZipFile(tmp_path, "w") as dst:
+                try:
+                    compression = src.getinfo(XML_NAME).compress_type
+                except KeyError:
+                    compression = zipfile.ZIP_STORED
+                dst.writestr(XML_NAME, xml_content, compress_type=compression)
+                for info in src.infolist():
+                    if info.filename != XML_NAME:
+                        dst.writestr(info, src.read(info))
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink()
+            raise
+
     # -- Sequence protocol --
 
     def __len__(self) -> int:
@@ -235,72 +473,294 @@ class ComicInfo(ComicModel):
         """Check if a page belongs to the comic."""
         return page in self.pages
 
+    # -- Context manager protocol --
+
+    def __enter__(self) -> ComicInfo:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the archive handles held by lazily loaded pages.
+
+        Pages remain usable: their archive is reopened on next access.
+        """
+        for source in {id(p._source): p._source for p in self.pages if p._source is not None}.values():
+            source.close()
+
     # -- Internal methods --
 
+    @staticmethod
+    def _append_pages(comic: ComicInfo, pages: Iterator[PageInfo], operation: str,
+                      path: Path) -> Tuple[ComicInfo, Iterator[PageInfo]]:
+        """Pair a comic with an iterator adding each loaded page to it.
+
+        The iteration is reported as the pages phase of the operation.
+        """
+        def load() -> Iterator[PageInfo]:
+            with instrumentation.phase(operation, "pages", path) as span:
+                for page in pages:
+                    comic.pages.append(page)
+                    if span:
+                        span.pages += 1
+                        span.bytes_read += page.image_size if page._content else 0
+                    yield page
+        return comic, load()
+
     @classmethod
-    def _process_archive(cls, archive) -> ComicInfo:
-        """Common processing for CBZ and CBR archives.
+    def _iter_archive_pages(cls, source: ArchiveSource,
+                            members: List[Tuple[str, dict]]) -> Iterator[PageInfo]:
+        """Load archive pages one by one, closing the archive at the end."""
+        with source:
+            archive = source.archive
+            for name, page_kwargs in members:
+                yield cls._load_page(archive, source, name, page_kwargs)
+
+    @staticmethod
+    def _iter_pdf_pages(path: Union[Path, str], source: Optional[PdfSource] = None) -> Iterator[PageInfo]:
+        """Extract the images of a PDF file one by one.
 
-        Extracts the ComicInfo.xml file if present, then loads
-        images sorted alphabetically.
+        Args:
+            path: Path to the .pdf file.
+            source: If given, verbatim JPEG pages are read from it on access.
+
+        Yields:
+            PageInfo for each image, in page order.
+        """
+        with Path(path).open("rb") as fp:
+            # From a file object, pypdf reads on demand instead of loading the whole file
+            reader = PdfReader(fp)
+            for index, pdf_page in enumerate(reader.pages):
+                for image_id in pdf_page.images.keys():
+                    xobj = None if is_inline(image_id) else get_xobject(pdf_page, image_id)
+                    info = verbatim_jpeg_info(xobj) if source is not None and xobj is not None else None
+                    if info is not None:
+                        size, width, height = info
+                        yield PageInfo.from_source(
+                            source, member_name(index, image_id), suffix=".jpeg",
+                            image_width=width, image_height=height, image_size=size,
+                        )
+                        continue
+
+                    data = verbatim_jpeg(xobj) if xobj is not None else None
+                    if data is None:
+                        yield PageInfo.loads(data=pdf_page.images[image_id].data)
+                    else:
+                        yield PageInfo.loads(data=data)
+                # pypdf caches the objects it resolves, image streams included
+                reader.resolved_objects.clear()
+
+    @staticmethod
+    def _parse_metadata(fp: BinaryIO) -> Tuple[dict, List[dict]]:
+        """Parse ComicInfo.xml content into comic and page attributes.
+
+        Raises:
+            InvalidMetadataError: If the XML is invalid.
+        """
+        try:
+            return parse_xml(fp, _codec(ComicModel).table, _codec(PageModel).table)
+        except Exception as e:
+            raise InvalidMetadataError(f"XML parsing error: {e}") from e
+
+    @classmethod
+    def _read_directory(cls, source: ArchiveSource) -> Tuple[dict, List[Tuple[str, dict]]]:
+        """Read the metadata and list the image members of an archive.
 
         Args:
-            archive: Open archive object (ZipFile or RarFile).
+            source: Archive to read (CBZ or CBR).
 
         Returns:
-            ComicInfo instance.
+            Tuple (comic attributes, [(member name, page attributes)]),
+            with members sorted alphabetically.
         """
-        pages: List[PageInfo] = []
-        names = sorted(archive.namelist())
-        comic_data: dict = {}
+        with instrumentation.phase("load", "directory", source.path):
+            archive = source.archive
+            names = sorted(archive.namelist())
+        members: List[Tuple[str, dict]] = []
+        comic_kwargs: dict = {}
+        pages_info: List[dict] = []
 
         # Extract XML metadata
         if XML_NAME in names:
-            with archive.open(XML_NAME, "r") as f:
-                try:
-                    comic_data = xmltodict.parse(
-                        f.read(), force_list=("Page",)
-                    ).get("ComicInfo", {})
-                except Exception as e:
-                    raise InvalidMetadataError(f"XML parsing error: {e}") from e
+            with instrumentation.phase("load", "metadata", source.path) as span:
+                with archive.open(XML_NAME, "r") as f:
+                    comic_kwargs, pages_info = cls._parse_metadata(f)
+                if span:
+                    span.bytes_read = archive.getinfo(XML_NAME).file_size
             names.remove(XML_NAME)
 
-        # Extract comic fields
-        comic_kwargs = _extract_fields(comic_data, ComicModel)
-
-        # Extract page information
-        pages_info = comic_data.get("Pages", {}).get("Page", [])
-
         for i, name in enumerate(names):
             suffix = Path(name).suffix
             if suffix.lower() not in IMAGE_FORMATS:
                 logger.warning("Skipping unsupported file: %r", name)
                 continue
 
-            with archive.open(name, "r") as f:
-                page_kwargs: dict = {}
-                if i < len(pages_info):
-                    page_kwargs = _extract_fields(pages_info[i], PageModel)
-                page_kwargs["name"] = Path(name).name
-                pages.append(PageInfo.loads(data=f.read(), **page_kwargs))
+            page_kwargs: dict = {}
+            if i < len(pages_info):
+                page_kwargs = pages_info[i]
+            page_kwargs["name"] = Path(name).name
+            members.append((name, page_kwargs))
+
+        return comic_kwargs, members
+
+    @classmethod
+    def _process_archive(cls, source: ArchiveSource, lazy: bool = False,
+                         probe_headers: bool = True, workers: int = 1,
+                         compact: bool = False) -> ComicInfo:
+        """Common processing for CBZ and CBR archives.
+
+        Extracts the ComicInfo.xml file if present, then loads
+        images sorted alphabetically. Pages keep a reference to their
+        source member, used to copy them verbatim when saving.
+
+        Args:
+            source: Archive to read (CBZ or CBR).
+            lazy: If True, pages are created without reading their content.
+            probe_headers: In lazy mode, read image headers of pages whose
+                dimensions are missing from ComicInfo.xml.
+            workers: Number of threads reading and decompressing page
+                members (ignored in lazy mode).
+            compact: If True, store pages in a PageTable; each page is
+                added to it as soon as it is loaded.
+
+        Returns:
+            ComicInfo instance.
+        """
+        comic_kwargs, members = cls._read_directory(source)
+        archive = source.archive
+        if lazy:
+            load = functools.partial(cls._lazy_page, archive, source, probe_headers=probe_headers)
+        else:
+            load = functools.partial(cls._load_page, archive, source)
+
+        collect = PageTable if compact else list
+        with instrumentation.phase("load", "pages", source.path) as span:
+            if workers > 1 and not lazy and len(members) > 1:
+                contents = cls._read_members(source, [name for name, _ in members], workers)
+                pages = collect(
+                    cls._page_from_member(source, name, page_kwargs, data)
+                    for (name, page_kwargs), data in zip(members, contents)
+                )
+            else:
+                pages = collect(load(name, page_kwargs) for name, page_kwargs in members)
+            if span:
+                span.pages = len(pages)
+                span.bytes_read = sum(p.image_size for p in pages if p._content)
 
         return cls.from_pages(pages=pages, **comic_kwargs)
 
+    @staticmethod
+    def _load_page(archive, source: ArchiveSource, name: str, page_kwargs: dict) -> PageInfo:
+        """Read and validate a page from an archive member.
+
+        Args:
+            archive: Open archive object (ZipFile or RarFile).
+            source: Source archive, remembered by the page.
+            name: Member name inside the archive.
+            page_kwargs: Page attributes extracted from ComicInfo.xml.
+
+        Returns:
+            PageInfo instance with content loaded.
+        """
+        with archive.open(name, "r") as f:
+            return ComicInfo._page_from_member(source, name, page_kwargs, f.read())
+
+    @staticmethod
+    def _page_from_member(source: ArchiveSource, name: str, page_kwargs: dict, data: bytes) -> PageInfo:
+        """Validate the content of an archive member and create its page."""
+        page = PageInfo.loads(data=data, **page_kwargs)
+        page._source = source
+        page._member = name
+        return page
+
+    @staticmethod
+    def _read_members(source: ArchiveSource, names: List[str], workers: int) -> Iterator[bytes]:
+        """Read archive members on a thread pool, yielding their content in order.
+
+        Each thread reads through its own archive object, so file reads
+        and decompression, which release the GIL, run concurrently;
+        validating the pages is left to the calling thread. At most
+        2 * workers members are read ahead.
+
+        Args:
+            source: Archive to read.
+            names: Member names to read.
+            workers: Number of threads.
+
+        Yields:
+            Uncompressed content of each member, in order.
+        """
+        local = threading.local()
+        archives = []
+
+        def read(name: str) -> bytes:
+            archive = getattr(local, "archive", None)
+            if archive is None:
+                archive = local.archive = source.open_archive()
+                archives.append(archive)
+            return archive.read(name)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                window: Deque[Future] = deque()
+                for name in names:
+                    window.append(executor.submit(read, name))
+                    if len(window) >= 2 * workers:
+                        yield window.popleft().result()
+                while window:
+                    yield window.popleft().result()
+        finally:
+            for archive in archives:
+                archive.close()
+
+    @staticmethod
+    def _lazy_page(archive, source: ArchiveSource, name: str, page_kwargs: dict,
+                   probe_headers: bool = True) -> PageInfo:
+        """Create a lazily loaded page from an archive member.
+
+        Dimensions are taken from ComicInfo.xml when available, otherwise
+        only the first bytes of the member are read to probe its header.
+
+        Args:
+            archive: Open archive object (ZipFile or RarFile).
+            source: Source the page content is read from on access.
+            name: Member name inside the archive.
+            page_kwargs: Page attributes extracted from ComicInfo.xml.
+            probe_headers: If False, never read the member; dimensions
+                missing from ComicInfo.xml are left unset.
+
+        Returns:
+            PageInfo instance without content in memory.
+        """
+        page_kwargs["image_size"] = archive.getinfo(name).file_size
+        has_size = page_kwargs.get("image_width") and page_kwargs.get("image_height")
+        if has_size or not probe_headers:
+            suffix = Path(name).suffix.lower()
+            page_kwargs["suffix"] = SUFFIX_ALIASES.get(suffix, suffix)
+        else:
+            with archive.open(name, "r") as f:
+                head = f.read(PROBE_SIZE)
+                header = probe(head) or read_image_info(head + f.read())
+            suffix, width, height = header
+            page_kwargs.update(suffix=suffix, image_width=width, image_height=height)
+        return PageInfo.from_source(source, name, **page_kwargs)
+
     def get_info(self) -> dict:
         """Return comic metadata as an XML-ready dictionary.
 
-        Generates a dictionary ready for XML serialization via xmltodict,
+        Generates a dictionary in the xmltodict layout,
         including comic metadata, file information and page details.
 
         Returns:
             Structured dictionary for XML serialization.
         """
-        comic_info = _serialize_fields(self, ComicModel)
+        comic_info = _codec(ComicModel).serialize(self)
 
         # Build page information
         comic_pages = []
         for i, page in enumerate(self.pages):
-            page_info = _serialize_fields(page, PageModel)
+            page_info = _codec(PageModel).serialize(page)
             page_info["@Image"] = i
             comic_pages.append(dict(sorted(page_info.items())))
 
@@ -317,57 +777,319 @@ class ComicInfo(ComicModel):
         })
         return comic_info
 
-    def pack(self, rename: bool = True, compression: int = zipfile.ZIP_STORED) -> bytes:
+    def _iter_xml(self) -> Iterator[str]:
+        """Generate the ComicInfo.xml content in chunks, from the model fields.
+
+        The document is the same as get_info() serialized by xmltodict,
+        with self-closing <Page /> elements.
+        """
+        elements = _codec(ComicModel).serialize(self)
+        utcnow = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+        elements.setdefault("FileSize", sum(p.image_size for p in self.pages))
+        elements.setdefault("FileCreationTime", utcnow)
+        elements.setdefault("FileModifiedTime", utcnow)
+        elements["PageCount"] = len(self.pages)
+
+        def pages() -> Iterator[List[Tuple[str, object]]]:
+            for i, page in enumerate(self.pages):
+                page_info = _codec(PageModel).serialize(page)
+                page_info["@Image"] = i
+                yield [(name[1:], value) for name, value in sorted(page_info.items())]
+
+        return iter_xml(elements.items(), pages())
+
+    def _dump_xml(self) -> bytes:
+        """Serialize the comic metadata to ComicInfo.xml content."""
+        return "".join(self._iter_xml()).encode("utf-8")
+
+    def _write_xml(self, zf: zipfile.ZipFile, compress_type: Optional[int] = None) -> None:
+        """Stream ComicInfo.xml into a new member of an archive open for writing.
+
+        Args:
+            zf: Destination archive.
+            compress_type: Compression method (default: the archive's).
+        """
+        zinfo = zipfile.ZipInfo(XML_NAME, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = zf.compression if compress_type is None else compress_type
+        zinfo.external_attr = 0o600 << 16
+        with zf.open(zinfo, "w") as f:
+            for chunk in self._iter_xml():
+                f.write(chunk.encode("utf-8"))
+
+    def _write_archive(self, zf: zipfile.ZipFile, rename: bool, workers: int = 1,
+                       operation: str = "save", path: Optional[Path] = None) -> List[str]:
+        """Write metadata and pages to an open ZIP archive.
+
+        Pages loaded from a ZIP member stored with the same compression
+        are copied verbatim (compressed stream and CRC) instead of being
+        compressed again. With workers > 1 and a compressed method, the
+        other pages are compressed on a thread pool and written in order.
+        Both rely on zipfile internals; on Python versions where they are
+        not verified, every page is written with ZipFile.writestr().
+
+        Source archives opened only to copy members are closed before
+        returning.
+
+        Args:
+            zf: Destination archive open for writing.
+            rename: If True, rename pages to sequential format (page-001.jpg).
+            workers: Number of threads compressing pages.
+            operation: Operation name reported to instrumentation hooks.
+            path: Destination file reported to instrumentation hooks.
+
+        Returns:
+            Member names of the pages, in page order.
+        """
+        idle = {id(p._source): p._source for p in self.pages if p._source is not None and not p._source.is_open}
+        try:
+            return self._write_members(zf, rename, workers, operation, path)
+        finally:
+            for source in idle.values():
+                source.close()
+
+    def _write_members(self, zf: zipfile.ZipFile, rename: bool, workers: int, operation: str,
+                       path: Optional[Path]) -> List[str]:
+        """Write metadata and pages to an open ZIP archive (see _write_archive())."""
+        with instrumentation.phase(operation, "metadata", path) as span:
+            start = len(zf.infolist())
+            self._write_xml(zf)
+            if span:
+                span.bytes_written = _compressed_size(zf, start)
+
+        names = []
+        for i, page in enumerate(self.pages):
+            name = page.name
+            if not name or rename:
+                name = f"page-{i + 1:03d}{page.suffix}"
+            names.append(name)
+
+        with instrumentation.phase(operation, "pages", path) as span:
+            start = len(zf.infolist())
+            if workers <= 1 or zf.compression == zipfile.ZIP_STORED or not zip_internals_supported():
+                for name, page in zip(names, self.pages):
+                    member = self._raw_member(page, zf.compression)
+                    if member is None:
+                        zf.writestr(name, page.content)
+                    else:
+                        copy_member(zf, name, *member)
+            else:
+                self._write_pages_parallel(zf, names, workers)
+            if span:
+                span.pages = len(names)
+                span.bytes_written = _compressed_size(zf, start)
+        return names
+
+    def _write_pages_parallel(self, zf: zipfile.ZipFile, names: List[str], workers: int) -> None:
+        """Compress pages on a thread pool and write them in page order."""
+        def prepare(page: PageInfo) -> Tuple[zipfile.ZipInfo, bytes]:
+            member = self._raw_member(page, zf.compression)
+            return member or compress_member(page.content, zf.compression)
+
+        # Bounded window of in-flight pages, written in page order
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            window: Deque[Tuple[str, Future]] = deque()
+            for name, page in zip(names, self.pages):
+                window.append((name, executor.submit(prepare, page)))
+                if len(window) >= 2 * workers:
+                    name, future = window.popleft()
+                    copy_member(zf, name, *future.result())
+            while window:
+                name, future = window.popleft()
+                copy_member(zf, name, *future.result())
+
+    @staticmethod
+    def _raw_member(page: PageInfo, compression: int) -> Optional[Tuple[zipfile.ZipInfo, bytes]]:
+        """Read the source ZIP member of a page for a verbatim copy.
+
+        Args:
+            page: Page to copy.
+            compression: Compression method of the destination archive.
+
+        Returns:
+            Tuple (info, compressed data), or None if the page must be
+            compressed again (no ZIP source, other compression method,
+            encrypted or modified member, or zipfile internals not
+            verified on this Python version).
+        """
+        source = page._source
+        if source is None or not source.is_zip or not zip_internals_supported():
+            return None
+
+        try:
+            info = source.getinfo(page._member)
+            if info.compress_type != compression:
+                return None
+            if page._content and info.compress_type == zipfile.ZIP_STORED:
+                # Stored data is already in memory, only the CRC is reused
+                # (member information is kept by the source, not reopened)
+                data = page._content
+            else:
+                info, data = source.read_raw(page._member)
+        except (CBZError, KeyError, OSError) as e:
+            logger.debug("Unable to copy member %r verbatim: %s", page._member, e)
+            return None
+
+        if data is None:
+            return None
+        return info, data
+
+    def pack(self, rename: bool = True, compression: int = zipfile.ZIP_STORED,
+             workers: int = 1) -> bytes:
         """Pack the comic into CBZ format (ZIP archive).
 
         Args:
             rename: If True, rename pages to sequential format (page-001.jpg).
             compression: ZIP compression method (default: ZIP_STORED).
+            workers: Number of threads compressing pages (default: 1).
 
         Returns:
             Binary data of the CBZ file.
         """
         buf = BytesIO()
         with zipfile.ZipFile(buf, "w", compression) as zf:
-            # Write XML metadata
-            xml_content = xmltodict.unparse({"ComicInfo": self.get_info()}, pretty=True)
-            zf.writestr(XML_NAME, xml_content.replace("></Page>", " />").encode("utf-8"))
-
-            # Write pages
-            for i, page in enumerate(self.pages):
-                name = page.name
-                if not name or rename:
-                    name = f"page-{i + 1:03d}{page.suffix}"
-                zf.writestr(name, page.content)
+            self._write_archive(zf, rename, workers, operation="pack")
 
         data = buf.getvalue()
         buf.close()
         return data
 
-    def show(self) -> None:
-        """Display the comic in the built-in graphical viewer."""
+    def save_pdf(self, path: Union[Path, str]) -> None:
+        """Save the comic as a PDF file, one PDF page per comic page.
+
+        JPEG pages are embedded byte-for-byte; other pages are decoded
+        and stored losslessly. Pages are written one at a time, so memory
+        use does not grow with the page count (use lazy loading to avoid
+        holding the source pages in memory as well).
+
+        Args:
+            path: Destination file path for the .pdf file.
+        """
+        metadata = {"Title": self.title, "Subject": self.series, "Author": self.writer}
+        with Path(path).open("wb") as fp:
+            write_pdf(fp, self.pages, metadata)
+
+    def thumbnails(self, size: Tuple[int, int] = THUMBNAIL_SIZE, cache: Optional[ThumbnailCache] = None,
+                   max_workers: Optional[int] = None) -> List[Image.Image]:
+        """Return thumbnails of all pages, from the persistent cache.
+
+        Thumbnails missing from the cache are generated in a process
+        pool and stored for the next calls.
+
+        Args:
+            size: Bounding box (width, height) of the thumbnails.
+            cache: Thumbnail cache (default: cache in the user cache directory).
+            max_workers: Number of worker processes (default: CPU count).
+
+        Returns:
+            Thumbnail images, in page order.
+        """
+        cache = cache if cache is not None else ThumbnailCache()
+        contents = (page.content for page in self.pages)
+        return [Image.open(BytesIO(data)) for data in cache.get_many(contents, size, max_workers)]
+
+    def transcode(self, image_format: str, quality: int = CONVERT_QUALITY, max_workers: Optional[int] = None,
+                  keep_larger: bool = False, **options) -> List[TranscodeResult]:
+        """Re-encode all pages in another image format, in a process pool.
+
+        Pages are updated in place (content, suffix, dimensions, size and
+        name extension). A page is left unchanged when its encoded image
+        is larger than the original (unless keep_larger is set) or when
+        it cannot be encoded.
+
+        Args:
+            image_format: Target format (jpeg, png, webp, avif, jxl, etc.).
+            quality: Encoder quality, for lossy formats.
+            max_workers: Number of worker processes (default: CPU count).
+            keep_larger: If True, replace pages even when the result is larger.
+            **options: Additional Pillow encoder options (lossless, method, etc.).
+
+        Returns:
+            Size, encoding time and outcome of each page, in page order.
+
+        Raises:
+            InvalidImageError: If the target format cannot be written.
+        """
+        return transcode_pages(self.pages, image_format, quality, max_workers, keep_larger, **options)
+
+    def resize(self, max_width: Optional[int], max_height: Optional[int], quality: int = CONVERT_QUALITY,
+               max_workers: Optional[int] = None, **options) -> List[TranscodeResult]:
+        """Downscale all pages to fit in a bounding box, in a process pool.
+
+        Pages are scaled down keeping their aspect ratio and re-encoded
+        in their own format; JPEG pages are decoded at a reduced scale
+        instead of full resolution. Pages already within bounds are left
+        unchanged and not read. Resized pages are updated in place
+        (content, dimensions and size).
+
+        Args:
+            max_width: Maximum page width in pixels (None for no limit).
+            max_height: Maximum page height in pixels (None for no limit).
+            quality: Encoder quality, for lossy formats.
+            max_workers: Number of worker processes (default: CPU count).
+            **options: Additional Pillow encoder options.
+
+        Returns:
+            Size, encoding time and outcome of each page, in page order.
+
+        Raises:
+            ValueError: If a bound is not a positive number.
+        """
+        return resize_pages(self.pages, max_width, max_height, quality, max_workers, **options)
+
+    def show(self, continuous: bool = False) -> None:
+        """Display the comic in the built-in graphical viewer.
+
+        Args:
+            continuous: True to display pages in a continuous vertical scroll (webtoon mode).
+        """
         from cbz.player import Player
-        player = Player(self)
+        player = Player(self, continuous=continuous)
         player.run()
 
     def save(self, path: Union[Path, str], rename: bool = True,
-             compression: int = zipfile.ZIP_STORED) -> None:
+             compression: int = zipfile.ZIP_STORED, workers: int = 1) -> None:
         """Save the comic as a CBZ file directly to disk.
 
         More memory-efficient than pack() for large comics since it
         writes directly to the file without an intermediate buffer.
 
+        Saving over the archive the pages were loaded from is supported:
+        the new archive is written to a temporary file which then
+        replaces the original, and the pages are rebound to it.
+
         Args:
             path: Destination file path for the .cbz file.
             rename: If True, rename pages to sequential format (page-001.jpg).
             compression: ZIP compression method (default: ZIP_STORED).
+            workers: Number of threads compressing pages (default: 1).
         """
-        with zipfile.ZipFile(Path(path), "w", compression) as zf:
-            xml_content = xmltodict.unparse({"ComicInfo": self.get_info()}, pretty=True)
-            zf.writestr(XML_NAME, xml_content.replace("></Page>", " />").encode("utf-8"))
-
-            for i, page in enumerate(self.pages):
-                name = page.name
-                if not name or rename:
-                    name = f"page-{i + 1:03d}{page.suffix}"
-                zf.writestr(name, page.content)
+        path = Path(path)
+        overwritten = {
+            id(p._source): p._source for p in self.pages
+            if p._source is not None and path.exists() and p._source.path.exists()
+            and path.samefile(p._source.path)
+        }
+        if not overwritten:
+            with zipfile.ZipFile(path, "w", compression) as zf:
+                self._write_archive(zf, rename, workers, path=path)
+            return
+
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            with zipfile.ZipFile(tmp_path, "w", compression) as zf:
+                names = self._write_archive(zf, rename, workers, path=path)
+            shutil.copymode(path, tmp_path)
+            for source in overwritten.values():
+                source.close()
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink()
+            raise
+
+        source = ArchiveSource(path, zipfile.ZipFile)
+        for page, name in zip(self.pages, names):
+            if id(page._source) in overwritten:
+                page._source = source
+                page._member = name
@@ -0,0 +1,254 @@
+"""
+Page deduplication.
+
+Provides the DedupIndex class, an index of page content hashes
+across comic files reporting the pages they share, and the
+ContentStore class, a content-addressed store keeping each distinct
+page (and ComicInfo.xml) once, from which comics can be rebuilt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Union
+
+from cbz.archive import ArchiveSource
+from cbz.comic import ComicInfo
+from cbz.page import HASH_CHUNK_SIZE, PageInfo
+
+
+@dataclass(frozen=True)
+class PageRef:
+    """Location of a page in a comic file.
+
+    Attributes:
+        path: Path to the comic file.
+        index: Position of the page in the comic.
+        name: File name of the page.
+        size: Size of the page content in bytes.
+    """
+
+    path: Path
+    index: int
+    name: str
+    size: int
+
+
+@dataclass
+class DedupReport:
+    """Summary of the pages of a DedupIndex.
+
+    Attributes:
+        pages: Number of indexed pages.
+        unique_pages: Number of distinct pages.
+        total_bytes: Size of all indexed pages.
+        unique_bytes: Size of the distinct pages, each counted once.
+    """
+
+    pages: int
+    unique_pages: int
+    total_bytes: int
+    unique_bytes: int
+
+    @property
+    def duplicate_bytes(self) -> int:
+        """Bytes saved by storing each distinct page once."""
+        return self.total_bytes - self.unique_bytes
+
+
+def _open_comic(path: Path) -> ComicInfo:
+    """Open a comic file without reading its pages up front."""
+    if path.suffix.lower() == ".pdf":
+        return ComicInfo.from_pdf(path, lazy=True)
+    return ComicInfo.read_info(path)
+
+
+class DedupIndex:
+    """Index of pages by content hash, across comic files.
+
+    Pages are hashed with SHA-256 while streaming their archive
+    member, so indexing a library never holds a whole page in memory
+    more than once.
+    """
+
+    def __init__(self) -> None:
+        self._refs: Dict[str, List[PageRef]] = {}
+
+    def add(self, path: Union[Path, str]) -> List[str]:
+        """Index the pages of a CBZ, CBR or PDF file.
+
+        Args:
+            path: Path to the comic file.
+
+        Returns:
+            Content hash of each page, in page order.
+        """
+        path = Path(path)
+        with _open_comic(path) as comic:
+            return self.add_comic(comic, path)
+
+    def add_comic(self, comic: ComicInfo, path: Union[Path, str]) -> List[str]:
+        """Index the pages of a loaded comic.
+
+        Args:
+            comic: Comic to index.
+            path: Path recorded in the page references.
+
+        Returns:
+            Content hash of each page, in page order.
+        """
+        path = Path(path)
+        digests = []
+        for i, page in enumerate(comic):
+            digest = page.digest()
+            self._refs.setdefault(digest, []).append(PageRef(path, i, page.name, page.image_size))
+            digests.append(digest)
+        return digests
+
+    def __len__(self) -> int:
+        """Number of distinct pages."""
+        return len(self._refs)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._refs
+
+    def refs(self, digest: str) -> List[PageRef]:
+        """Return the locations of a page, or an empty list if unknown."""
+        return list(self._refs.get(digest, ()))
+
+    def duplicates(self) -> Dict[str, List[PageRef]]:
+        """Return the pages found more than once.
+
+        Returns:
+            Locations of each duplicated page by content hash, the
+            pages wasting the most bytes first.
+        """
+        shared = [(digest, refs) for digest, refs in self._refs.items() if len(refs) > 1]
+        shared.sort(key=lambda item: (len(item[1]) - 1) * item[1][0].size, reverse=True)
+        return {digest: list(refs) for digest, refs in shared}
+
+    def report(self) -> DedupReport:
+        """Return the page and byte counts of the index."""
+        return DedupReport(
+            pages=sum(len(refs) for refs in self._refs.values()),
+            unique_pages=len(self._refs),
+            total_bytes=sum(ref.size for refs in self._refs.values() for ref in refs),
+            unique_bytes=sum(refs[0].size for refs in self._refs.values()),
+        )
+
+
+class ContentStore:
+    """Content-addressed store of page blobs.
+
+    Each blob is stored once under its SHA-256 hash; comics are
+    described by a manifest listing the hashes of their ComicInfo.xml
+    and pages. Entries are written atomically, so the store can be
+    shared by several processes.
+
+    Attributes:
+        directory: Root directory of the store.
+    """
+
+    def __init__(self, directory: Union[Path, str]) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Root directory of the store.
+        """
+        self.directory = Path(directory)
+
+    def path(self, digest: str) -> Path:
+        """Return the file path of a blob."""
+        return self.directory / digest[:2] / digest
+
+    def __contains__(self, digest: str) -> bool:
+        return self.path(digest).is_file()
+
+    def get(self, digest: str) -> bytes:
+        """Return a stored blob.
+
+        Raises:
+            KeyError: If the blob is not in the store.
+        """
+        try:
+            return self.path(digest).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+
+    def put(self, data: bytes) -> str:
+        """Store a blob unless already present, and return its hash."""
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self:
+            self.put_stream(BytesIO(data))
+        return digest
+
+    def put_stream(self, fp: BinaryIO) -> str:
+        """Store a blob read from a file object, hashing it while it is copied.
+
+        Args:
+            fp: Binary file object positioned at the start of the blob.
+
+        Returns:
+            Hash of the blob.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        sha = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in iter(lambda: fp.read(HASH_CHUNK_SIZE), b""):
+                    sha.update(chunk)
+                    f.write(chunk)
+            digest = sha.hexdigest()
+            path = self.path(digest)
+            if path.is_file():
+                os.unlink(tmp)
+            else:
+                path.parent.mkdir(exist_ok=True)
+                os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return digest
+
+    def _put_page(self, page: PageInfo) -> str:
+        """Store the content of a page, streaming archive members."""
+        if not page._content and isinstance(page._source, ArchiveSource):
+            with page._source.open(page._member) as f:
+                return self.put_stream(f)
+        return self.put(page.content)
+
+    def add_comic(self, comic: ComicInfo) -> dict:
+        """Store the metadata and pages of a comic.
+
+        Args:
+            comic: Comic to store.
+
+        Returns:
+            JSON-serializable manifest: hash of ComicInfo.xml
+            ("metadata") and hash and name of each page ("pages").
+        """
+        return {
+            "metadata": self.put(comic._dump_xml()),
+            "pages": [{"digest": self._put_page(page), "name": page.name} for page in comic],
+        }
+
+    def load_comic(self, manifest: dict) -> ComicInfo:
+        """Rebuild a comic from a manifest returned by add_comic().
+
+        Raises:
+            KeyError: If a blob of the manifest is not in the store.
+            InvalidMetadataError: If the stored ComicInfo.xml is invalid.
+        """
+        comic_kwargs, pages_info = ComicInfo._parse_metadata(BytesIO(self.get(manifest["metadata"])))
+        pages = []
+        for i, entry in enumerate(manifest["pages"]):
+            page_kwargs = pages_info[i] if i < len(pages_info) else {}
+            pages.append(PageInfo.loads(self.get(entry["digest"]), name=entry["name"], **page_kwargs))
+        return ComicInfo.from_pages(pages=pages, **comic_kwargs)
@@ -0,0 +1,189 @@
+"""
+Instrumentation hooks.
+
+Reports the duration, bytes read or written and page count of each
+phase of loading and saving comics to registered hooks, for instance
+to export them as metrics. When no hook is registered, each phase
+costs a single function call.
+
+Operations and their phases:
+    load: directory (opening the archive and listing its members),
+        metadata (reading and parsing ComicInfo.xml into fields),
+        pages (reading the pages and probing their image headers).
+    from_pdf: pages (extracting the page images).
+    save, pack: metadata (serializing ComicInfo.xml),
+        pages (compressing or copying and writing the pages).
+
+ComicInfo.open_progressive() reports the load (or from_pdf) phases as
+well; its pages phase lasts from the first page to the last, including
+the time the caller spends between pages.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PhaseEvent:
+    """Measurements of one phase of an operation.
+
+    Attributes:
+        operation: Operation name (load, from_pdf, save or pack).
+        phase: Phase name (directory, metadata or pages).
+        duration: Wall-clock duration in seconds.
+        path: File being read or written, if any.
+        bytes_read: Bytes of metadata or page content read, uncompressed
+            (pages whose content is read on access are not counted).
+        bytes_written: Bytes of compressed member data written to the
+            archive (ZIP headers are not counted).
+        pages: Number of pages processed.
+        failed: True if the phase raised an exception.
+    """
+
+    operation: str
+    phase: str
+    duration: float
+    path: Optional[Path] = None
+    bytes_read: int = 0
+    bytes_written: int = 0
+    pages: int = 0
+    failed: bool = False
+
+
+Hook = Callable[[PhaseEvent], None]
+
+# Registered hooks; replaced on change, so emitting never sees a partial update
+_hooks: Tuple[Hook, ...] = ()
+
+
+def add_hook(hook: Hook) -> None:
+    """Register a callable receiving a PhaseEvent after each phase.
+
+    Hooks are called in the thread running the operation. Exceptions
+    raised by a hook are logged and do not interrupt the operation.
+    """
+    global _hooks
+    _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Unregister a hook.
+
+    Raises:
+        ValueError: If the hook is not registered.
+    """
+    global _hooks
+    hooks = list(_hooks)
+    hooks.remove(hook)
+    _hooks = tuple(hooks)
+
+
+@contextmanager
+def hooked(hook: Hook) -> Iterator[Hook]:
+    """Register a hook for the duration of a with block."""
+    add_hook(hook)
+    try:
+        yield hook
+    finally:
+        remove_hook(hook)
+
+
+@contextmanager
+def record() -> Iterator[List[PhaseEvent]]:
+    """Collect the events of the phases run in a with block.
+
+    Example:
+        with instrumentation.record() as events:
+            ComicInfo.from_cbz(path)
+        for event in events:
+            print(event.phase, event.duration)
+    """
+    events: List[PhaseEvent] = []
+    with hooked(events.append):
+        yield events
+
+
+class _Phase:
+    """A phase being measured, reported to the hooks when it ends.
+
+    The instrumented code sets the counters (bytes_read, bytes_written,
+    pages) on it. It is truthy, unlike the inactive phase, so counters
+    that are costly to compute are only computed when measured.
+    """
+
+    __slots__ = ("operation", "phase", "path", "bytes_read", "bytes_written", "pages", "_start")
+
+    def __init__(self, operation: str, phase: str, path: Optional[Union[Path, str]]) -> None:
+        self.operation = operation
+        self.phase = phase
+        self.path = Path(path) if path is not None else None
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.pages = 0
+        self._start = 0.0
+
+    def __enter__(self) -> _Phase:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        event = PhaseEvent(
+            self.operation, self.phase, time.perf_counter() - self._start, self.path,
+            self.bytes_read, self.bytes_written, self.pages,
+            # A generator closed before the end (e.g. progressive loading) did not fail
+            exc_type is not None and not issubclass(exc_type, GeneratorExit)
+        )
+        for hook in _hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
+
+
+class _InactivePhase:
+    """Phase returned when no hook is registered; measures nothing."""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __enter__(self) -> _InactivePhase:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_INACTIVE = _InactivePhase()
+
+
+def phase(operation: str, name: str, path: Optional[Union[Path, str]] = None) -> Union[_Phase, _InactivePhase]:
+    """Return a context manager measuring a phase of an operation.
+
+    Counters must only be set when the returned object is truthy:
+
+        with phase("load", "pages", path) as span:
+            pages = ...
+            if span:
+                span.pages = len(pages)
+
+    Args:
+        operation: Operation name.
+        name: Phase name.
+        path: File being read or written.
+
+    Returns:
+        A measuring context manager, or an inactive one without hooks.
+    """
+    if not _hooks:
+        return _INACTIVE
+    return _Phase(operation, name, path)
@@ -0,0 +1,149 @@
+"""
+ComicInfo.xml parsing and serialization.
+
+Writes the ComicInfo.xml document as a stream of text chunks,
+byte-for-byte identical to xmltodict.unparse(pretty=True) output
+with self-closing <Page /> elements, and reads it incrementally
+into model fields. Neither direction builds an intermediate
+dictionary tree.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple
+from xml.parsers import expat
+from xml.sax.saxutils import escape, quoteattr
+
+logger = logging.getLogger(__name__)
+
+XML_HEADER = '<?xml version="1.0" encoding="utf-8"?>\n'
+
+# Namespace declarations of the <ComicInfo> root element
+ROOT_NAMESPACES = (
+    ("xmlns:xsd", "http://www.w3.org/2001/XMLSchema"),
+    ("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance"),
+)
+
+Item = Tuple[str, object]
+
+# XML name (without @ prefix) -> (field name, converter)
+FieldTable = Mapping[str, Tuple[str, Callable[[str], Any]]]
+
+
+def to_text(value: object) -> str:
+    """Convert a field value to its XML text, as xmltodict does."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+# Quoted attribute values; page types and flags repeat on every page
+_quote = functools.lru_cache(maxsize=1024)(quoteattr)
+
+
+def _attribute(name: str, value: object) -> str:
+    """Format an XML attribute, with a leading space."""
+    if type(value) is int:
+        # Digits never need escaping
+        return f' {name}="{value}"'
+    return f" {name}={_quote(to_text(value))}"
+
+
+def _attributes(items: Iterable[Item]) -> str:
+    """Format XML attributes, with a leading space before each."""
+    return "".join([_attribute(name, value) for name, value in items])
+
+
+def iter_xml(elements: Iterable[Item], pages: Iterable[Iterable[Item]]) -> Iterator[str]:
+    """Generate a ComicInfo.xml document in chunks.
+
+    Args:
+        elements: (name, value) of the <ComicInfo> child elements, in order.
+        pages: For each <Page> element, its (name, value) attributes in order.
+
+    Yields:
+        Text chunks of the document: the root element, then one
+        chunk per element and per page.
+    """
+    yield f"{XML_HEADER}<ComicInfo{_attributes(ROOT_NAMESPACES)}>\n"
+    for name, value in elements:
+        yield f"\t<{name}>{escape(to_text(value))}</{name}>\n"
+
+    empty = True
+    for attributes in pages:
+        if empty:
+            yield "\t<Pages>\n"
+            empty = False
+        yield f"\t\t<Page{_attributes(attributes)} />\n"
+    yield "\t<Pages></Pages>\n" if empty else "\t</Pages>\n"
+    yield "</ComicInfo>"
+
+
+def _convert(table: FieldTable, name: str, raw: str, result: Dict[str, Any]) -> None:
+    """Convert an XML value to its model field, if the name is mapped."""
+    entry = table.get(name)
+    if entry is None:
+        return
+    try:
+        result[entry[0]] = entry[1](raw)
+    except (ValueError, KeyError):
+        logger.warning("Unable to convert field %s=%r", name, raw)
+
+
+def parse_xml(fp: BinaryIO, elements: FieldTable,
+              page_attributes: FieldTable) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Parse a ComicInfo.xml document into model fields.
+
+    The document is read incrementally; element text and <Page>
+    attributes are converted to field values as soon as they are
+    parsed. Unknown elements and attributes, and empty elements,
+    are ignored.
+
+    Args:
+        fp: Binary file object positioned at the start of the document.
+        elements: Table of the <ComicInfo> child elements.
+        page_attributes: Table of the <Page> attributes.
+
+    Returns:
+        Tuple (comic fields, [page fields for each <Page>]).
+
+    Raises:
+        xml.parsers.expat.ExpatError: If the document is not well-formed.
+    """
+    comic: Dict[str, Any] = {}
+    pages: List[Dict[str, Any]] = []
+    path: List[str] = []
+    text: List[str] = []
+
+    def start(name: str, attributes: Dict[str, str]) -> None:
+        path.append(name)
+        if len(path) == 2:
+            text.clear()
+        elif len(path) == 3 and name == "Page" and path[:2] == ["ComicInfo", "Pages"]:
+            page: Dict[str, Any] = {}
+            for key, value in attributes.items():
+                _convert(page_attributes, key, value, page)
+            pages.append(page)
+
+    def end(name: str) -> None:
+        if len(path) == 2 and path[0] == "ComicInfo":
+            value = "".join(text).strip()
+            if value:
+                _convert(elements, name, value, comic)
+        path.pop()
+
+    def characters(data: str) -> None:
+        if len(path) == 2:
+            text.append(data)
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+    parser.ParseFile(fp)
+    return comic, pages
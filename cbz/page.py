@@ -8,16 +8,148 @@ individual comic pages (images).
 from __future__ import annotations
 
 import base64
+import hashlib
 from dataclasses import dataclass, field
 from io import BytesIO
-from pathlib import Path
-from typing import Union
+from pathlib import Path, PurePath
+from typing import Optional, Tuple, Union
 
 from PIL import Image
 
+from cbz.archive import ArchiveSource
 from cbz.constants import IMAGE_FORMATS
 from cbz.exceptions import InvalidImageError
 from cbz.models import PageModel
+from cbz.probe import probe
+from cbz.thumbnail import THUMBNAIL_SIZE, ThumbnailCache
+
+# Canonical suffixes for file extensions with several spellings
+SUFFIX_ALIASES = {".jpg": ".jpeg", ".tif": ".tiff"}
+
+# Size of the chunks read when hashing archive members
+HASH_CHUNK_SIZE = 1 << 20
+
+# Default encoder quality of converted pages
+CONVERT_QUALITY = 85
+
+# Resized images are first reduced by an integer factor down to this
+# multiple of the target size, then resampled (see Image.resize)
+RESIZE_REDUCING_GAP = 2.0
+
+
+def read_image_info(data: bytes) -> Tuple[str, int, int]:
+    """Read the format and dimensions of an image without decoding it.
+
+    The header is parsed directly when its layout is known, with
+    Pillow as a fallback for other layouts.
+
+    Args:
+        data: Binary image data.
+
+    Returns:
+        Tuple (suffix, width, height).
+
+    Raises:
+        InvalidImageError: If the image is invalid or in an unsupported format.
+    """
+    header = probe(data)
+    if header is not None:
+        return header
+    try:
+        with Image.open(BytesIO(data)) as img:
+            suffix = f".{img.format.lower()}"
+            if suffix not in IMAGE_FORMATS:
+                raise InvalidImageError(f"Unsupported image format: {suffix}")
+            return suffix, img.width, img.height
+    except InvalidImageError:
+        raise
+    except Exception as e:
+        raise InvalidImageError(f"Unable to read image: {e}") from e
+
+
+def normalize_suffix(image_format: str) -> str:
+    """Return the canonical suffix of an image format (webp, .JPG, etc.)."""
+    suffix = image_format.lower()
+    if not suffix.startswith("."):
+        suffix = f".{suffix}"
+    return SUFFIX_ALIASES.get(suffix, suffix)
+
+
+def pil_format(suffix: str) -> str:
+    """Return the Pillow format name used to write images with a suffix.
+
+    Raises:
+        InvalidImageError: If the format is not supported or cannot be written.
+    """
+    name = Image.registered_extensions().get(suffix)
+    if suffix not in IMAGE_FORMATS or name not in Image.SAVE:
+        raise InvalidImageError(f"Unsupported image format: {suffix}")
+    return name
+
+
+def with_suffix(name: str, suffix: str) -> str:
+    """Replace the extension of a page name (empty names are kept)."""
+    return PurePath(name).with_suffix(suffix).name if name else name
+
+
+def _prepare_mode(img: Image.Image, pil_format: str) -> Image.Image:
+    """Convert an image to a mode the target format can store."""
+    has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+    if pil_format == "JPEG":
+        if has_alpha:
+            # No transparency in JPEG: flatten on a white background
+            rgba = img.convert("RGBA")
+            flat = Image.new("RGB", rgba.size, (255, 255, 255))
+            flat.paste(rgba, mask=rgba.getchannel("A"))
+            return flat
+        if img.mode not in ("L", "RGB", "CMYK"):
+            return img.convert("RGB")
+    elif img.mode not in ("L", "RGB", "RGBA") and (pil_format != "PNG" or img.mode not in ("1", "LA", "P")):
+        return img.convert("RGBA" if has_alpha else "RGB")
+    return img
+
+
+def encode_image(data: bytes, suffix: str, quality: int = CONVERT_QUALITY,
+                 size: Optional[Tuple[int, int]] = None, **options) -> bytes:
+    """Re-encode an image, optionally in another format or size.
+
+    The ICC profile and EXIF data are kept. Transparent images
+    converted to JPEG are flattened on a white background.
+
+    When downscaling, JPEG images are decoded at a reduced scale
+    close to the target size (draft mode), and other images are
+    reduced by an integer factor before the final resampling, so
+    the full resolution is rarely processed.
+
+    Args:
+        data: Binary image data.
+        suffix: Target format suffix (.jpeg, .webp, .avif, .jxl, etc.).
+        quality: Encoder quality, for lossy formats.
+        size: If given, scale the image to this size (width, height).
+        **options: Additional Pillow encoder options (lossless, method, etc.).
+
+    Returns:
+        Encoded image data.
+
+    Raises:
+        InvalidImageError: If the image is invalid or the format cannot be written.
+    """
+    target = pil_format(suffix)
+    try:
+        with Image.open(BytesIO(data)) as img:
+            for key in ("icc_profile", "exif"):
+                if img.info.get(key):
+                    options.setdefault(key, img.info[key])
+            if size is not None:
+                img.draft(img.mode, size)
+                if img.mode in ("1", "P"):
+                    img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+                img = img.resize(size, Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+            buffer = BytesIO()
+            _prepare_mode(img, target).save(buffer, format=target, quality=quality, **options)
+            return buffer.getvalue()
+    except Exception as e:
+        raise InvalidImageError(f"Unable to encode image as {suffix}: {e}") from e
 
 
 @dataclass
@@ -28,33 +160,34 @@ class PageInfo(PageModel):
     content management. Image metadata (dimensions, size, format)
     is automatically extracted when content is assigned.
 
+    Pages loaded lazily keep a reference to their source archive
+    member instead of the image data, which is read on each access.
+
     Attributes:
         _content: Binary image data (accessed via the content property).
+        _source: Archive the content is read from when not in memory.
+        _member: Name of the member inside the source archive.
     """
 
     _content: bytes = field(default=b"", repr=False, compare=False)
+    _source: Optional[ArchiveSource] = field(default=None, repr=False, compare=False)
+    _member: str = field(default="", repr=False, compare=False)
 
     @property
     def content(self) -> bytes:
-        """Binary image data."""
+        """Binary image data, read from the source archive if not in memory."""
+        if not self._content and self._source is not None:
+            return self._source.read(self._member)
         return self._content
 
     @content.setter
     def content(self, value: bytes) -> None:
         """Set content and automatically extract image metadata."""
-        try:
-            with Image.open(BytesIO(value)) as img:
-                self.suffix = f".{img.format.lower()}"
-                if self.suffix not in IMAGE_FORMATS:
-                    raise InvalidImageError(f"Unsupported image format: {self.suffix}")
-                self.image_width = img.width
-                self.image_height = img.height
-        except InvalidImageError:
-            raise
-        except Exception as e:
-            raise InvalidImageError(f"Unable to read image: {e}") from e
+        self.suffix, self.image_width, self.image_height = read_image_info(value)
         self.image_size = len(value)
         self._content = value
+        self._source = None
+        self._member = ""
 
     def __post_init__(self) -> None:
         """Validate content if provided at initialization."""
@@ -87,6 +220,26 @@ class PageInfo(PageModel):
         page.content = data
         return page
 
+    @classmethod
+    def from_source(cls, source: ArchiveSource, member: str, **kwargs) -> PageInfo:
+        """Create a lazily loaded PageInfo backed by an archive member.
+
+        Image metadata (suffix, dimensions, size) must be supplied by the
+        caller; the member content is only read when accessed.
+
+        Args:
+            source: Archive containing the page.
+            member: Name of the member inside the archive.
+            **kwargs: Page attributes (image_width, suffix, type, etc.).
+
+        Returns:
+            PageInfo instance without content in memory.
+        """
+        page = cls(**kwargs)
+        page._source = source
+        page._member = member
+        return page
+
     @classmethod
     def load(cls, path: Union[Path, str], **kwargs) -> PageInfo:
         """Create a PageInfo from an image file.
@@ -106,6 +259,51 @@ class PageInfo(PageModel):
         kwargs.setdefault("name", path.name)
         return cls.loads(path.read_bytes(), **kwargs)
 
+    def digest(self) -> str:
+        """Return the SHA-256 hex digest of the page content.
+
+        Pages read on access are hashed while streaming their archive
+        member, without holding the whole content in memory.
+        """
+        if not self._content and isinstance(self._source, ArchiveSource):
+            sha = hashlib.sha256()
+            with self._source.open(self._member) as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    sha.update(chunk)
+            return sha.hexdigest()
+        return hashlib.sha256(self.content).hexdigest()
+
+    def convert(self, image_format: str, quality: int = CONVERT_QUALITY, **options) -> None:
+        """Re-encode the page in another image format.
+
+        The suffix, dimensions and size are updated, and the extension
+        of the page name is changed to the new format.
+
+        Args:
+            image_format: Target format (jpeg, png, webp, avif, jxl, etc.).
+            quality: Encoder quality, for lossy formats.
+            **options: Additional Pillow encoder options (lossless, method, etc.).
+
+        Raises:
+            InvalidImageError: If the page cannot be converted to this format.
+        """
+        self.content = encode_image(self.content, normalize_suffix(image_format), quality, **options)
+        self.name = with_suffix(self.name, self.suffix)
+
+    def thumbnail(self, size: Tuple[int, int] = THUMBNAIL_SIZE,
+                  cache: Optional[ThumbnailCache] = None) -> Image.Image:
+        """Return a thumbnail of the page, from the persistent cache.
+
+        Args:
+            size: Bounding box (width, height) of the thumbnail.
+            cache: Thumbnail cache (default: cache in the user cache directory).
+
+        Returns:
+            Thumbnail image.
+        """
+        cache = cache if cache is not None else ThumbnailCache()
+        return Image.open(BytesIO(cache.get(self.content, size)))
+
     def show(self) -> None:
         """Display the page in the default image viewer."""
         with Image.open(BytesIO(self.content)) as img:
@@ -0,0 +1,337 @@
+"""
+PDF import and export helpers.
+
+Locates the image XObjects of PDF pages and extracts JPEG (DCTDecode)
+streams verbatim, and writes comics to PDF incrementally, embedding
+JPEG pages without decoding and re-encoding them.
+"""
+
+from __future__ import annotations
+
+import zlib
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
+
+from PIL import Image
+from pypdf import PageObject, PdfReader
+from pypdf.generic import StreamObject
+
+from cbz.archive import ArchiveSource
+from cbz.exceptions import CBZError
+from cbz.probe import jpeg_layout
+
+# Object numbers reserved for the document catalog, page tree and information
+_CATALOG, _PAGES, _INFO = 1, 2, 3
+
+# JPEG component count -> PDF color space embedded verbatim
+_JPEG_COLOR_SPACES = {1: "/DeviceGray", 3: "/DeviceRGB"}
+
+# Image XObject entries altering the decoded pixels (alpha masks, inverted ranges)
+_ALTERING_KEYS = ("/SMask", "/Mask", "/Decode")
+
+# Largest page side allowed by PDF readers, in points (200 inches)
+MAX_PAGE_SIZE = 14400
+
+ImageId = Union[str, List[str]]
+
+
+def image_path(image_id: ImageId) -> Tuple[str, ...]:
+    """Return the XObject names leading to an image (forms, then image)."""
+    return (image_id,) if isinstance(image_id, str) else tuple(image_id)
+
+
+def is_inline(image_id: ImageId) -> bool:
+    """True if the image is inline in the content stream (no XObject)."""
+    name = image_path(image_id)[-1]
+    return name.startswith("~") and name.endswith("~")
+
+
+def get_xobject(page: PageObject, image_id: ImageId) -> StreamObject:
+    """Resolve the image XObject of a page, through nested form XObjects.
+
+    Args:
+        page: PDF page.
+        image_id: Image identifier, as listed by page.images.keys().
+
+    Returns:
+        Image XObject stream.
+    """
+    obj = page
+    for name in image_path(image_id):
+        obj = obj["/Resources"]["/XObject"][name].get_object()
+    return obj
+
+
+def _verbatim_filters(xobj: StreamObject) -> Optional[list]:
+    """Return the filters of a JPEG image XObject usable as-is, or None."""
+    filters = xobj.get("/Filter")
+    filters = list(filters) if isinstance(filters, list) else [filters]
+    if not filters or filters[-1] != "/DCTDecode" or any(key in xobj for key in _ALTERING_KEYS):
+        return None
+    return filters
+
+
+def verbatim_jpeg(xobj: StreamObject) -> Optional[bytes]:
+    """Return the JPEG stream of an image XObject, if usable as-is.
+
+    Only DCTDecode images whose pixels are not altered by masks or
+    decode arrays are returned; lossless filters applied before the
+    DCTDecode filter are removed.
+
+    Args:
+        xobj: Image XObject stream.
+
+    Returns:
+        JPEG data, or None if the image must be decoded.
+    """
+    filters = _verbatim_filters(xobj)
+    if filters is None:
+        return None
+    if len(filters) == 1:
+        # The encoded stream is the JPEG data, read without running (and caching) the filters
+        return StreamObject.get_data(xobj)
+    # pypdf leaves the DCTDecode stage undecoded
+    return xobj.get_data()
+
+
+def verbatim_jpeg_info(xobj: StreamObject) -> Optional[Tuple[int, int, int]]:
+    """Return the size and dimensions of the JPEG stream of an image XObject.
+
+    Dimensions are read from the stream dictionary, without decoding
+    the image; only streams with lossless filters before the DCTDecode
+    filter are decoded to measure them.
+
+    Args:
+        xobj: Image XObject stream.
+
+    Returns:
+        Tuple (size, width, height), or None if the image is not
+        usable as-is (see verbatim_jpeg()).
+    """
+    filters = _verbatim_filters(xobj)
+    if filters is None:
+        return None
+    if len(filters) == 1:
+        size = len(StreamObject.get_data(xobj))
+    else:
+        size = len(xobj.get_data())
+    return size, int(xobj["/Width"]), int(xobj["/Height"])
+
+
+def member_name(page_index: int, image_id: ImageId) -> str:
+    """Build a member name identifying an image in a PDF file."""
+    return f"{page_index}{''.join(image_path(image_id))}"
+
+
+class PdfSource(ArchiveSource):
+    """Shared, lazily opened handle on a PDF file.
+
+    Members are JPEG images identified by member_name(); they are read
+    verbatim from their XObject stream on access, and not kept in
+    memory afterwards. Reads from several threads are serialized.
+    """
+
+    def __init__(self, path) -> None:
+        """Initialize the source without opening the PDF file.
+
+        Args:
+            path: Path to the PDF file.
+        """
+        super().__init__(path, PdfReader)
+
+    def _open(self) -> PdfReader:
+        # Given a path, pypdf would read the whole file in memory
+        fp = self.path.open("rb")
+        try:
+            return PdfReader(fp)
+        except BaseException:
+            fp.close()
+            raise
+
+    def close(self) -> None:
+        """Close the PDF file if it is open."""
+        reader = self._archive
+        super().close()
+        if reader is not None:
+            reader.stream.close()
+
+    def read(self, name: str) -> bytes:
+        """Read the JPEG data of an image.
+
+        Args:
+            name: Member name of the image (see member_name()).
+
+        Returns:
+            JPEG image data.
+        """
+        index, _, path = name.partition("/")
+        image_id = ["/" + part for part in path.split("/")]
+        reader = self.archive
+        # The reader seeks a single file handle: one read at a time
+        with self._lock:
+            try:
+                data = verbatim_jpeg(get_xobject(reader.pages[int(index)], image_id))
+            finally:
+                # Objects resolved by pypdf are cached, image streams included
+                reader.resolved_objects.clear()
+        if data is None:
+            raise CBZError(f"Image {name!r} is not a verbatim JPEG stream")
+        return data
+
+    def open(self, name: str) -> BinaryIO:
+        """Open an image for streaming reads.
+
+        JPEG streams are not compressed further in the PDF file, so the
+        image is read at once and wrapped in an in-memory file object.
+
+        Args:
+            name: Member name of the image (see member_name()).
+
+        Returns:
+            Binary file object of the JPEG data.
+        """
+        return BytesIO(self.read(name))
+
+
+def _real(value: float) -> bytes:
+    """Format a PDF number with at most two decimals."""
+    return (b"%.2f" % value).rstrip(b"0").rstrip(b".")
+
+
+def page_size(width: int, height: int) -> Tuple[float, float]:
+    """Return the PDF page size of an image, in points.
+
+    Images are sized at 72 DPI (one point per pixel), scaled down to
+    fit within MAX_PAGE_SIZE points (e.g. long webtoon strips).
+    """
+    scale = min(1.0, MAX_PAGE_SIZE / max(width, height, 1))
+    return width * scale, height * scale
+
+
+def _text_string(value: str) -> bytes:
+    """Encode a PDF text string as UTF-16BE hexadecimal."""
+    return b"<FEFF" + value.encode("utf-16-be").hex().upper().encode("ascii") + b">"
+
+
+def _encode_image(data: bytes) -> Tuple[Dict[str, object], bytes, int, int]:
+    """Convert page data to an image XObject dictionary and stream.
+
+    8-bit grayscale and RGB JPEG images are embedded byte-for-byte as
+    DCTDecode streams; other images are decoded and stored as
+    FlateDecode samples, flattened on a white background.
+
+    Args:
+        data: Binary image data.
+
+    Returns:
+        Tuple (XObject entries, stream data, width, height).
+    """
+    with Image.open(BytesIO(data)) as img:
+        width, height = img.size
+        layout = jpeg_layout(data)
+        if layout is not None and layout[0] == 8 and layout[1] in _JPEG_COLOR_SPACES:
+            entries = {"/Filter": "/DCTDecode", "/ColorSpace": _JPEG_COLOR_SPACES[layout[1]]}
+            return entries, data, width, height
+
+        if img.mode in ("1", "L"):
+            img = img.convert("L")
+            color_space = "/DeviceGray"
+        else:
+            if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+                rgba = img.convert("RGBA")
+                img = Image.new("RGB", rgba.size, (255, 255, 255))
+                img.paste(rgba, mask=rgba.getchannel("A"))
+            else:
+                img = img.convert("RGB")
+            color_space = "/DeviceRGB"
+        entries = {"/Filter": "/FlateDecode", "/ColorSpace": color_space}
+        return entries, zlib.compress(img.tobytes()), width, height
+
+
+class _PdfStream:
+    """Minimal PDF serializer writing numbered objects incrementally."""
+
+    def __init__(self, fp: BinaryIO) -> None:
+        self.fp = fp
+        self.offsets: Dict[int, int] = {}
+        self.next_number = _INFO + 1
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _write(self, data: bytes) -> None:
+        self.fp.write(data)
+
+    def allocate(self) -> int:
+        """Reserve the next object number."""
+        number = self.next_number
+        self.next_number += 1
+        return number
+
+    def write_object(self, number: int, body: bytes, stream: Optional[bytes] = None) -> None:
+        """Write an object (and its stream data) at the current position."""
+        self.offsets[number] = self.fp.tell()
+        self._write(b"%d 0 obj\n" % number)
+        if stream is None:
+            self._write(body + b"\nendobj\n")
+        else:
+            self._write(body[:-2] + b" /Length %d >>\nstream\n" % len(stream))
+            self._write(stream)
+            self._write(b"\nendstream\nendobj\n")
+
+    def finish(self) -> None:
+        """Write the cross-reference table and trailer."""
+        xref = self.fp.tell()
+        size = self.next_number
+        self._write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+        for number in range(1, size):
+            self._write(b"%010d 00000 n \n" % self.offsets[number])
+        self._write(
+            b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (size, _CATALOG, _INFO, xref)
+        )
+
+
+def write_pdf(fp: BinaryIO, pages: Iterable, metadata: Optional[Dict[str, str]] = None) -> None:
+    """Write pages to a PDF file, one PDF page per image.
+
+    Objects are written as pages are processed, so only one page is
+    held in memory at a time. Each page is sized to its image at
+    72 DPI (one point per pixel), scaled down to fit within
+    MAX_PAGE_SIZE points; the image keeps its full resolution.
+
+    Args:
+        fp: Seekable binary file object to write to.
+        pages: PageInfo objects, in reading order.
+        metadata: Document information entries (e.g. {"Title": ...}).
+    """
+    pdf = _PdfStream(fp)
+    pdf.write_object(_CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % _PAGES)
+
+    info = b" ".join(
+        b"/%s %s" % (key.encode("ascii"), _text_string(value))
+        for key, value in (metadata or {}).items() if value
+    )
+    pdf.write_object(_INFO, b"<< " + info + b" >>")
+
+    kids = []
+    for page in pages:
+        entries, stream, width, height = _encode_image(page.content)
+        image, content, page_number = pdf.allocate(), pdf.allocate(), pdf.allocate()
+
+        image_entries = b" ".join(b"%s %s" % (k.encode(), v.encode()) for k, v in entries.items())
+        pdf.write_object(image, (
+            b"<< /Type /XObject /Subtype /Image /Width %d /Height %d "
+            b"/BitsPerComponent 8 %s >>" % (width, height, image_entries)
+        ), stream)
+        page_width, page_height = map(_real, page_size(width, height))
+        pdf.write_object(content, b"<< >>", b"q %s 0 0 %s 0 0 cm /Im0 Do Q" % (page_width, page_height))
+        pdf.write_object(page_number, (
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %s %s] "
+            b"/Resources << /XObject << /Im0 %d 0 R >> >> /Contents %d 0 R >>"
+            % (_PAGES, page_width, page_height, image, content)
+        ))
+        kids.append(page_number)
+
+    pdf.write_object(_PAGES, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    ))
+    pdf.finish()
@@ -8,11 +8,14 @@ scrolling and metadata display.
 from __future__ import annotations
 
 import os
+import threading
 import tkinter as tk
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from tkinter import ttk
-from typing import Optional
+from tkinter import messagebox, ttk
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     from ctypes import windll
@@ -23,36 +26,96 @@ from PIL import Image, ImageTk
 
 from cbz.comic import ComicInfo
 from cbz.page import PageInfo
+from cbz.render import ImageCache, fit_size, page_offsets, reduce, render, render_tile, visible_tiles
 from cbz.utils import readable_size, ico_to_png
 
 PARENT = Path(__file__).parent
 CTRL_KEY = 0x4  # Tkinter event.state bitmask for the Ctrl modifier
+PREFETCH_PAGES = 2  # Pages decoded ahead of and behind the current page
+CACHE_SIZE = 256 * 1024 * 1024  # Maximum footprint of pre-scaled pages, in bytes
+REFINE_DELAY = 150  # Idle time before a preview is replaced by a high-quality render, in ms
+REFINE_POLL = 25  # Polling interval for the high-quality render, in ms
+TILE_SIZE = 512  # Side of the tiles used to display large pages, in pixels
+TILED_SCREENS = 4  # Pages larger than this many canvas areas are displayed in tiles
+PAGE_GAP = 0  # Space between pages in continuous mode, in pixels
+LOAD_POLL = 100  # Interval between display updates while pages are loading, in ms
 
 
 class Player:
     """Comic reader with Tkinter graphical interface.
 
     Displays comic pages with navigation, zoom and
-    a metadata summary page.
+    a metadata summary page. Neighbouring pages are decoded and
+    scaled to fit the window in a background thread, so page turns
+    display a cached image. Zooming and resizing first show a quick
+    bilinear preview, refined with a high-quality render once the
+    input goes idle. Pages much larger than the window, such as zoomed
+    webtoon strips, are displayed in tiles rendered as they scroll into
+    view.
+
+    In continuous mode, pages are stacked at the window width in a
+    single scroll region. Their positions are computed from the page
+    dimensions, and only the pages near the view are decoded and kept
+    on the canvas.
+
+    The reader can also be opened on a file path: the window is shown
+    as soon as the metadata and the first page are read, and the other
+    pages are loaded in a background thread while reading.
 
     Attributes:
         comic: The comic to display.
         current_page: Index of the current page (-1 = summary).
+        continuous: True to display pages in a continuous vertical scroll.
         root: Main Tkinter window.
+        cache: Pre-scaled pages, keyed by (index, width, height).
     """
 
-    def __init__(self, comic: ComicInfo) -> None:
+    def __init__(self, comic: Union[ComicInfo, Path, str], continuous: bool = False) -> None:
         """Initialize the reader with a comic.
 
         Args:
-            comic: ComicInfo instance to display.
+            comic: ComicInfo instance to display, or path to a CBZ, CBR
+                or PDF file to load progressively.
+            continuous: True to display pages in a continuous vertical scroll.
+
+        Raises:
+            CBZError: If the file metadata or its first page cannot be read.
         """
+        self._loading: Optional[Iterator[PageInfo]] = None
+        self._load_error: Optional[BaseException] = None
+        self._closing = threading.Event()
+        if not isinstance(comic, ComicInfo):
+            comic, self._loading = ComicInfo.open_progressive(comic)
+            # The first page sets the initial window size
+            next(self._loading, None)
+
         self.comic = comic
         self.current_page: int = -1
+        self.continuous = continuous
         self.max_zoom_factor: Optional[float] = None
         self.zoom_factor: Optional[float] = None
         self.img_original: Optional[Image.Image] = None
 
+        # Background decoding of neighbouring pages
+        self.cache = ImageCache(CACHE_SIZE)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cbz-prefetch")
+        self._prefetching: Dict[Tuple[int, int, int], Future] = {}
+
+        # Progressive rendering of the current page
+        self._mips: Dict[int, Image.Image] = {}
+        self._refine_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cbz-refine")
+        self._refining: Optional[Future] = None
+        self._refine_timer: Optional[str] = None
+
+        # Tiled display of large pages
+        self._tiled_size: Optional[Tuple[int, int]] = None
+        self._tiles: Dict[Tuple[int, int], Tuple[int, ImageTk.PhotoImage]] = {}
+
+        # Continuous mode layout and pages placed on the canvas
+        self._offsets: List[int] = []
+        self._layout_width = 0
+        self._placed: Dict[int, Tuple[int, ImageTk.PhotoImage]] = {}
+
         # Window initialization
         self.root = tk.Tk()
         self.root.title(self._get_window_title())
@@ -84,6 +147,12 @@ class Player:
         self.previous_height = self.root.winfo_height()
         self.resize_timer: Optional[str] = None
 
+        # Background loading of the remaining pages
+        if self._loading is not None:
+            self._loaded = len(self.comic)
+            threading.Thread(target=self._load_pages, name="cbz-loader", daemon=True).start()
+            self.root.after(LOAD_POLL, self._check_loading)
+
     def _set_icon(self) -> None:
         """Set the application icon."""
         icon_path = PARENT / "cbz.ico"
@@ -161,13 +230,22 @@ class Player:
 
     def show_page(self) -> None:
         """Display the current page (summary or image)."""
+        self._cancel_refine()
+        self._clear_tiles()
+        self._placed.clear()
         self.canvas.delete("all")
 
         if self.current_page == -1:
             self._show_summary_page()
         elif self.current_page < len(self.comic):
-            self._show_image_page()
-
+            if self.continuous:
+                self._show_continuous()
+            else:
+                self._show_image_page()
+        self._update_navigation()
+
+    def _update_navigation(self) -> None:
+        """Update the navigation buttons and page index for the current page."""
         self.prev_button.config(state=tk.DISABLED if self.current_page == -1 else tk.NORMAL)
         self.next_button.config(
             state=tk.DISABLED if self.current_page + 1 == len(self.comic) else tk.NORMAL
@@ -197,37 +275,333 @@ class Player:
         self.summary_text.place_forget()
         if self.img_original is not None:
             self.img_original.close()
-        page: PageInfo = self.comic[self.current_page]
-        self.img_original = Image.open(BytesIO(page.content))
+            self.img_original = None
+        self._mips.clear()
         self._display_image()
+        self._prefetch()
+
+    def _get_original(self) -> Image.Image:
+        """Open the current page image (header only until it is resized)."""
+        if self.img_original is None:
+            page: PageInfo = self.comic[self.current_page]
+            self.img_original = Image.open(BytesIO(page.content))
+        return self.img_original
+
+    def _get_image_size(self, index: int) -> Tuple[int, int]:
+        """Return the dimensions of a page, from its metadata when known."""
+        page: PageInfo = self.comic[index]
+        if page.image_width and page.image_height:
+            return page.image_width, page.image_height
+        if index == self.current_page:
+            return self._get_original().size
+        with Image.open(BytesIO(page.content)) as img:
+            return img.size
 
     def _display_image(self) -> None:
         """Display the image with the current zoom level."""
+        width, height = self._get_image_size(self.current_page)
         if not self.zoom_factor:
             self.max_zoom_factor = min(
-                self.canvas.winfo_width() / self.img_original.width,
-                self.canvas.winfo_height() / self.img_original.height,
+                self.canvas.winfo_width() / width,
+                self.canvas.winfo_height() / height,
             )
             self.zoom_factor = self.max_zoom_factor
 
-        new_w = int(self.img_original.width * self.zoom_factor)
-        new_h = int(self.img_original.height * self.zoom_factor)
-        img = self.img_original.resize((new_w, new_h), Image.Resampling.LANCZOS)
+        new_w = int(width * self.zoom_factor)
+        new_h = int(height * self.zoom_factor)
+        if new_w * new_h > TILED_SCREENS * self.canvas.winfo_width() * self.canvas.winfo_height():
+            self._cancel_refine()
+            self._show_tiles((new_w, new_h))
+            return
+
+        self._clear_tiles()
+        key = (self.current_page, new_w, new_h)
+        img = self._get_cached(key)
+        if img is None:
+            img = self._get_preview((new_w, new_h))
+            self._schedule_refine(key)
+        else:
+            self._cancel_refine()
+        self._place_image(img)
 
+    def _place_image(self, img: Image.Image) -> None:
+        """Replace the page image shown on the canvas."""
+        new_w, new_h = img.size
         self.canvas.image = ImageTk.PhotoImage(img)
+        self.canvas.delete("page")
         x = max(0, (self.canvas.winfo_width() - new_w) // 2)
         y = max(0, (self.canvas.winfo_height() - new_h) // 2)
-        self.canvas.create_image(x, y, anchor=tk.NW, image=self.canvas.image)
+        self.canvas.create_image(x, y, anchor=tk.NW, image=self.canvas.image, tags="page")
 
         canvas_w = max(new_w, self.canvas.winfo_width())
         canvas_h = max(new_h, self.canvas.winfo_height())
         self.canvas.config(scrollregion=(0, 0, canvas_w, canvas_h))
 
+    def _get_mip(self, size: Tuple[int, int]) -> Image.Image:
+        """Return the smallest reduced copy of the current page not below size.
+
+        Reduced copies are kept per reduction factor, so that successive
+        zoom steps only resample an image close to the target size.
+        """
+        original = self._get_original()
+        factor = max(1, min(original.width // size[0], original.height // size[1]))
+        mip = self._mips.get(factor)
+        if mip is None:
+            mip = self._mips[factor] = reduce(original, factor)
+        return mip
+
+    def _get_preview(self, size: Tuple[int, int]) -> Image.Image:
+        """Quickly scale the current page, from a reduced copy of the original."""
+        return self._get_mip(size).resize(size, Image.Resampling.BILINEAR)
+
+    def _show_tiles(self, size: Tuple[int, int]) -> None:
+        """Display the current page in tiles, at the given scaled size."""
+        self._clear_tiles()
+        self.canvas.delete("page")
+        self.canvas.image = None
+        self._tiled_size = size
+
+        canvas_w = max(size[0], self.canvas.winfo_width())
+        canvas_h = max(size[1], self.canvas.winfo_height())
+        self.canvas.config(scrollregion=(0, 0, canvas_w, canvas_h))
+        self._update_tiles()
+
+    def _update_tiles(self) -> None:
+        """Render the tiles in view and drop those that scrolled out of it.
+
+        Tiles one row or column beyond the view are kept, so small
+        scroll steps do not wait for rendering. Memory use depends on
+        the canvas size, not on the page size.
+        """
+        if self._tiled_size is None:
+            return
+
+        width, height = self._tiled_size
+        x = max(0, (self.canvas.winfo_width() - width) // 2)
+        y = max(0, (self.canvas.winfo_height() - height) // 2)
+        left = self.canvas.canvasx(0) - x - TILE_SIZE
+        top = self.canvas.canvasy(0) - y - TILE_SIZE
+        region = (
+            left, top,
+            left + self.canvas.winfo_width() + 2 * TILE_SIZE,
+            top + self.canvas.winfo_height() + 2 * TILE_SIZE,
+        )
+        tiles = visible_tiles(self._tiled_size, region, TILE_SIZE)
+
+        for tile in set(self._tiles) - tiles:
+            self.canvas.delete(self._tiles.pop(tile)[0])
+
+        source = self._get_mip(self._tiled_size)
+        for tile in tiles - set(self._tiles):
+            photo = ImageTk.PhotoImage(render_tile(source, self._tiled_size, tile, TILE_SIZE))
+            item = self.canvas.create_image(
+                x + tile[0] * TILE_SIZE, y + tile[1] * TILE_SIZE,
+                anchor=tk.NW, image=photo, tags="page",
+            )
+            self._tiles[tile] = (item, photo)
+
+    def _clear_tiles(self) -> None:
+        """Remove the tiles of the current page from the canvas."""
+        for item, _ in self._tiles.values():
+            self.canvas.delete(item)
+        self._tiles.clear()
+        self._tiled_size = None
+
+    def _schedule_refine(self, key: Tuple[int, int, int]) -> None:
+        """Render the page in high quality once the input goes idle."""
+        self._cancel_refine()
+        self._refine_timer = self.root.after(REFINE_DELAY, self._refine, key)
+
+    def _refine(self, key: Tuple[int, int, int]) -> None:
+        """Start the high-quality render of the displayed preview."""
+        self._refining = self._refine_executor.submit(
+            self._render_page, key, self.zoom_factor == self.max_zoom_factor
+        )
+        self._refine_timer = self.root.after(REFINE_POLL, self._check_refine)
+
+    def _check_refine(self) -> None:
+        """Replace the preview with the high-quality render when it is ready."""
+        future = self._refining
+        if not future.done():
+            self._refine_timer = self.root.after(REFINE_POLL, self._check_refine)
+            return
+
+        self._refining = None
+        self._refine_timer = None
+        if future.exception() is None:
+            # On error, the preview stays displayed
+            self._place_image(future.result())
+
+    def _cancel_refine(self) -> None:
+        """Drop the pending high-quality render, if any.
+
+        A render already running cannot be interrupted, its result is
+        discarded.
+        """
+        if self._refine_timer is not None:
+            self.root.after_cancel(self._refine_timer)
+            self._refine_timer = None
+        if self._refining is not None:
+            self._refining.cancel()
+            self._refining = None
+
+    def _get_cached(self, key: Tuple[int, int, int]) -> Optional[Image.Image]:
+        """Return a pre-scaled page, waiting for it if it is being decoded."""
+        future = self._prefetching.get(key)
+        if future is not None and not future.cancel():
+            try:
+                future.result()
+            except Exception:
+                # Decoding errors are reported by the synchronous path
+                pass
+        return self.cache.get(key)
+
+    def _prefetch(self) -> None:
+        """Decode the pages around the current one in the background."""
+        keys = []
+        box_w, box_h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if box_w > 1 and box_h > 1:
+            # Next pages first, then previous ones
+            indexes = [self.current_page + i for i in range(1, PREFETCH_PAGES + 1)]
+            indexes += [self.current_page - i for i in range(1, PREFETCH_PAGES + 1)]
+            for index in indexes:
+                if 0 <= index < len(self.comic):
+                    keys.append((index, *fit_size(*self._get_image_size(index), box_w, box_h)))
+
+        # Forget finished work and drop pending work for pages that are no longer neighbours
+        for key, future in list(self._prefetching.items()):
+            if future.done() or key not in keys:
+                future.cancel()
+                del self._prefetching[key]
+
+        for key in keys:
+            if key not in self.cache and key not in self._prefetching:
+                self._prefetching[key] = self._executor.submit(self._render_page, key)
+
+    def _render_page(self, key: Tuple[int, int, int], cache: bool = True) -> Image.Image:
+        """Decode and scale a page, optionally into the cache (background thread)."""
+        index, width, height = key
+        img = render(self.comic[index].content, (width, height))
+        if cache:
+            self.cache.put(key, img)
+        return img
+
+    def _show_continuous(self) -> None:
+        """Display the pages stacked vertically, scrolled to the current page."""
+        self.summary_text.place_forget()
+        if self.img_original is not None:
+            self.img_original.close()
+            self.img_original = None
+        self._mips.clear()
+
+        self._layout_width = self.canvas.winfo_width()
+        self._layout_continuous()
+        self.canvas.yview_moveto(self._offsets[self.current_page] / self._offsets[-1])
+        self._update_continuous()
+
+    def _layout_continuous(self) -> None:
+        """Compute the page positions and the scroll region of the continuous view."""
+        sizes = [self._get_image_size(i) for i in range(len(self.comic))]
+        self._offsets = page_offsets(sizes, self._layout_width, PAGE_GAP)
+        self.canvas.config(scrollregion=(0, 0, self._layout_width, self._offsets[-1]))
+
+    def _update_continuous(self) -> None:
+        """Place the pages near the view on the canvas and drop the others.
+
+        Visible pages are decoded immediately; the pages just before and
+        after the view are decoded in the background.
+        """
+        if not self.continuous or not self._offsets or self.current_page == -1:
+            return
+
+        # Pages loaded after the last layout are not placed yet
+        count = len(self._offsets) - 1
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = min(count - 1, max(0, bisect_right(self._offsets, top) - 1))
+        last = min(count - 1, max(first, bisect_left(self._offsets, bottom) - 1))
+        if first != self.current_page:
+            self.current_page = first
+            self._update_navigation()
+
+        near = range(max(0, first - PREFETCH_PAGES), min(count, last + PREFETCH_PAGES + 1))
+        for index in set(self._placed) - set(near):
+            self.canvas.delete(self._placed.pop(index)[0])
+        for key, future in list(self._prefetching.items()):
+            if future.done() or key[0] not in near:
+                future.cancel()
+                del self._prefetching[key]
+
+        for index in near:
+            if index in self._placed:
+                continue
+            height = self._offsets[index + 1] - self._offsets[index] - PAGE_GAP
+            key = (index, self._layout_width, height)
+            img = self._get_cached(key)
+            if img is None:
+                if first <= index <= last:
+                    img = self._render_page(key)
+                else:
+                    if key not in self._prefetching:
+                        self._prefetching[key] = self._executor.submit(self._render_page, key)
+                    continue
+            photo = ImageTk.PhotoImage(img)
+            item = self.canvas.create_image(0, self._offsets[index], anchor=tk.NW, image=photo, tags="page")
+            self._placed[index] = (item, photo)
+
+    def _scroll_to_page(self, index: int) -> None:
+        """Scroll the continuous view to the top of a page."""
+        self.canvas.yview_moveto(self._offsets[index] / self._offsets[-1])
+        self._update_continuous()
+        # The last pages may not reach the top of the view
+        self.current_page = index
+        self._update_navigation()
+
+    def toggle_continuous(self) -> None:
+        """Switch between single page and continuous display."""
+        self.continuous = not self.continuous
+        self.zoom_factor = None
+        if self.current_page != -1:
+            self.show_page()
+
+    def _load_pages(self) -> None:
+        """Load the remaining pages of the comic (background thread)."""
+        try:
+            for _ in self._loading:
+                if self._closing.is_set():
+                    break
+        except Exception as e:
+            self._load_error = e
+        finally:
+            self._loading.close()
+            self._loading = None
+
+    def _check_loading(self) -> None:
+        """Update the display with the pages loaded in the background."""
+        loading = self._loading is not None
+        if len(self.comic) != self._loaded:
+            self._loaded = len(self.comic)
+            self._update_navigation()
+            if self.continuous and self.current_page != -1:
+                self._layout_continuous()
+                self._update_continuous()
+
+        if loading:
+            self.root.after(LOAD_POLL, self._check_loading)
+            return
+
+        if self.current_page == -1:
+            # Page count and file size are final
+            self._show_summary_page()
+        if self._load_error is not None:
+            messagebox.showerror("Error", f"Unable to load all pages: {self._load_error}", parent=self.root)
+
     def _bind_keys(self) -> None:
         """Configure keyboard shortcuts and events."""
         self.root.bind("<Left>", lambda _: self.on_previous())
         self.root.bind("<Right>", lambda _: self.on_next())
         self.root.bind("<Control-q>", lambda _: self.root.quit())
+        self.root.bind("<KeyPress-w>", lambda _: self.toggle_continuous())
         self.root.bind("<Configure>", lambda e: self.on_window(e))
 
         self.root.bind("<Control-MouseWheel>", self.on_zoom)
@@ -245,7 +619,7 @@ class Player:
 
     def on_zoom(self, event: tk.Event) -> None:
         """Handle zoom with Ctrl + mouse wheel."""
-        if self.current_page == -1:
+        if self.current_page == -1 or self.continuous:
             return
 
         if event.delta > 0:
@@ -253,9 +627,10 @@ class Player:
         elif event.delta < 0:
             self.zoom_factor /= 1.1
 
+        width, height = self._get_image_size(self.current_page)
         min_zoom = min(
-            self.canvas.winfo_width() / self.img_original.width,
-            self.canvas.winfo_height() / self.img_original.height,
+            self.canvas.winfo_width() / width,
+            self.canvas.winfo_height() / height,
         )
         if self.zoom_factor < min_zoom:
             self.zoom_factor = min_zoom
@@ -267,17 +642,23 @@ class Player:
         if self.current_page == -1 or (event.state & CTRL_KEY):
             return
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        self._update_tiles()
+        self._update_continuous()
 
     def _on_shift_mouse_wheel(self, event: tk.Event) -> None:
         """Handle horizontal scrolling."""
         if self.current_page == -1 or (event.state & CTRL_KEY):
             return
         self.canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
+        self._update_tiles()
 
     def on_previous(self) -> None:
         """Navigate to the previous page."""
         if self.current_page == -1:
             return
+        if self.continuous and self.current_page > 0:
+            self._scroll_to_page(self.current_page - 1)
+            return
         self.current_page -= 1
         self.zoom_factor = None
         self.show_page()
@@ -285,6 +666,9 @@ class Player:
     def on_next(self) -> None:
         """Navigate to the next page."""
         if self.current_page < len(self.comic) - 1:
+            if self.continuous and self.current_page != -1:
+                self._scroll_to_page(self.current_page + 1)
+                return
             self.current_page += 1
             self.zoom_factor = None
             self.show_page()
@@ -301,13 +685,25 @@ class Player:
 
     def _on_resize(self) -> None:
         """React to window resize with delay."""
+        self.resize_timer = None
         if self.current_page == -1:
             return
+        if self.continuous:
+            if self.canvas.winfo_width() != self._layout_width:
+                self.show_page()
+            else:
+                self._update_continuous()
+            return
         if self.zoom_factor == self.max_zoom_factor:
             self.zoom_factor = None
         self._display_image()
-        self.resize_timer = None
+        self._prefetch()
 
     def run(self) -> None:
         """Start the reader main loop."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._closing.set()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._refine_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,308 @@
+"""
+Header-only image probing.
+
+Reads the format and dimensions of an image directly from the
+first bytes of its header, without going through Pillow's plugin
+dispatch. Unknown or unusual layouts are reported as None so the
+caller can fall back to Pillow.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Callable, Dict, Optional, Tuple
+
+# Number of leading bytes read to probe an image header
+PROBE_SIZE = 64 * 1024
+
+ImageHeader = Tuple[str, int, int]
+
+# JPEG start-of-frame markers (SOF0-SOF15 except DHT, JPG and DAC)
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# JPEG markers without a length field (TEM, RST0-RST7)
+_JPEG_STANDALONE = frozenset({0x01, *range(0xD0, 0xD8)})
+
+# JPEG XL aspect ratios (xsize = ysize * num // den), indexed by ratio code
+_JXL_RATIOS = {1: (1, 1), 2: (12, 10), 3: (4, 3), 4: (3, 2), 5: (16, 9), 6: (5, 4), 7: (2, 1)}
+
+
+def _find_jpeg_sof(data: bytes) -> Optional[int]:
+    """Return the offset of the first JPEG start-of-frame segment."""
+    pos = 2
+    size = len(data)
+    while pos + 4 <= size:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        if marker in _JPEG_STANDALONE:
+            pos += 2
+            continue
+        if marker in _JPEG_SOF:
+            return pos if pos + 10 <= size else None
+        if marker in (0xD9, 0xDA):
+            # End of image or start of scan before any frame header
+            return None
+        pos += 2 + struct.unpack_from(">H", data, pos + 2)[0]
+    return None
+
+
+def _probe_jpeg(data: bytes) -> Optional[ImageHeader]:
+    """Find the dimensions in the first JPEG start-of-frame segment."""
+    pos = _find_jpeg_sof(data)
+    if pos is None:
+        return None
+    height, width = struct.unpack_from(">HH", data, pos + 5)
+    return ".jpeg", width, height
+
+
+def jpeg_layout(data: bytes) -> Optional[Tuple[int, int]]:
+    """Read the sample precision and component count of a JPEG image.
+
+    Args:
+        data: JPEG data, or at least its first PROBE_SIZE bytes.
+
+    Returns:
+        Tuple (bits per sample, components), or None if not found.
+    """
+    if not data.startswith(b"\xff\xd8\xff"):
+        return None
+    try:
+        pos = _find_jpeg_sof(data)
+    except struct.error:
+        return None
+    if pos is None:
+        return None
+    return data[pos + 4], data[pos + 9]
+
+
+def _probe_png(data: bytes) -> Optional[ImageHeader]:
+    """Read the dimensions from the PNG IHDR chunk."""
+    if len(data) < 24 or data[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack_from(">II", data, 16)
+    return ".png", width, height
+
+
+def _probe_gif(data: bytes) -> Optional[ImageHeader]:
+    """Read the dimensions from the GIF logical screen descriptor."""
+    if len(data) < 10:
+        return None
+    width, height = struct.unpack_from("<HH", data, 6)
+    return ".gif", width, height
+
+
+def _probe_bmp(data: bytes) -> Optional[ImageHeader]:
+    """Read the dimensions from the BMP DIB header."""
+    if len(data) < 26:
+        return None
+    header_size = struct.unpack_from("<I", data, 14)[0]
+    if header_size == 12:
+        # OS/2 BITMAPCOREHEADER
+        width, height = struct.unpack_from("<HH", data, 18)
+    elif header_size >= 40:
+        width, height = struct.unpack_from("<ii", data, 18)
+    else:
+        return None
+    # Negative heights denote top-down bitmaps
+    return ".bmp", width, abs(height)
+
+
+def _probe_tiff(data: bytes) -> Optional[ImageHeader]:
+    """Read the ImageWidth and ImageLength tags from the first TIFF IFD."""
+    if len(data) < 8:
+        return None
+    endian = "<" if data[:2] == b"II" else ">"
+    offset = struct.unpack_from(endian + "I", data, 4)[0]
+    if offset + 2 > len(data):
+        return None
+    count = struct.unpack_from(endian + "H", data, offset)[0]
+    dims: Dict[int, int] = {}
+    for i in range(count):
+        entry = offset + 2 + i * 12
+        if entry + 12 > len(data):
+            return None
+        tag, kind = struct.unpack_from(endian + "HH", data, entry)
+        if tag in (256, 257):
+            if kind == 3:
+                dims[tag] = struct.unpack_from(endian + "H", data, entry + 8)[0]
+            elif kind == 4:
+                dims[tag] = struct.unpack_from(endian + "I", data, entry + 8)[0]
+            else:
+                return None
+        if len(dims) == 2:
+            return ".tiff", dims[256], dims[257]
+    return None
+
+
+def _probe_webp(data: bytes) -> Optional[ImageHeader]:
+    """Read the dimensions from the first WebP chunk (VP8, VP8L or VP8X)."""
+    if len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 ":
+        if data[23:26] != b"\x9d\x01\x2a":
+            return None
+        width, height = struct.unpack_from("<HH", data, 26)
+        return ".webp", width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        if data[20] != 0x2F:
+            return None
+        bits = struct.unpack_from("<I", data, 21)[0]
+        return ".webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return ".webp", width, height
+    return None
+
+
+def _iter_boxes(data: bytes, start: int, end: int):
+    """Iterate over ISOBMFF boxes as (type, payload_start, payload_end)."""
+    pos = start
+    while pos + 8 <= end:
+        size, kind = struct.unpack_from(">I4s", data, pos)
+        header = 8
+        if size == 1:
+            if pos + 16 > end:
+                return
+            size = struct.unpack_from(">Q", data, pos + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield kind, pos + header, min(pos + size, end)
+        pos += size
+
+
+def _probe_avif(data: bytes) -> Optional[ImageHeader]:
+    """Read the dimensions from the AVIF meta/iprp/ipco/ispe boxes.
+
+    The largest spatial extent is reported, which is the primary
+    image for both plain and grid-based files.
+    """
+    for kind, start, end in _iter_boxes(data, 0, len(data)):
+        if kind != b"meta":
+            continue
+        # FullBox: skip version and flags
+        for kind, start, end in _iter_boxes(data, start + 4, end):
+            if kind != b"iprp":
+                continue
+            for kind, start, end in _iter_boxes(data, start, end):
+                if kind != b"ipco":
+                    continue
+                extents = []
+                for kind, start, end in _iter_boxes(data, start, end):
+                    if kind in (b"irot", b"imir", b"clap"):
+                        # Transformed images are left to Pillow
+                        return None
+                    if kind == b"ispe" and end - start >= 12:
+                        extents.append(struct.unpack_from(">II", data, start + 4))
+                if extents:
+                    width, height = max(extents, key=lambda e: e[0] * e[1])
+                    return ".avif", width, height
+        return None
+    return None
+
+
+class _BitReader:
+    """Least-significant-bit-first reader used by the JPEG XL headers."""
+
+    def __init__(self, data: bytes, pos: int) -> None:
+        self.data = data
+        self.pos = pos * 8
+
+    def read(self, count: int) -> int:
+        value = 0
+        for i in range(count):
+            byte = self.data[self.pos >> 3]
+            value |= ((byte >> (self.pos & 7)) & 1) << i
+            self.pos += 1
+        return value
+
+
+def _jxl_size(reader: _BitReader, small: bool) -> int:
+    """Read one JPEG XL image dimension from a SizeHeader."""
+    if small:
+        return (reader.read(5) + 1) * 8
+    bits = (9, 13, 18, 30)[reader.read(2)]
+    return reader.read(bits) + 1
+
+
+def _jxl_codestream(data: bytes, pos: int) -> Optional[ImageHeader]:
+    """Parse the SizeHeader of a JPEG XL codestream starting at pos."""
+    if data[pos:pos + 2] != b"\xff\x0a":
+        return None
+    reader = _BitReader(data, pos + 2)
+    small = reader.read(1)
+    height = _jxl_size(reader, small)
+    ratio = reader.read(3)
+    if ratio:
+        num, den = _JXL_RATIOS[ratio]
+        width = height * num // den
+    else:
+        width = _jxl_size(reader, small)
+
+    # ImageMetadata: orientations 5-8 transpose the image, left to Pillow
+    if not reader.read(1) and reader.read(1) and reader.read(3) + 1 > 4:
+        return None
+    return ".jxl", width, height
+
+
+def _probe_jxl(data: bytes) -> Optional[ImageHeader]:
+    """Read the dimensions of a bare or ISOBMFF-wrapped JPEG XL image."""
+    if data.startswith(b"\xff\x0a"):
+        return _jxl_codestream(data, 0)
+    for kind, start, end in _iter_boxes(data, 0, len(data)):
+        if kind == b"jxlc":
+            return _jxl_codestream(data, start)
+        if kind == b"jxlp":
+            # Partial codestream, prefixed with its sequence index
+            return _jxl_codestream(data, start + 4)
+    return None
+
+
+# Signature prefix -> header parser
+_PROBES: Tuple[Tuple[bytes, Callable[[bytes], Optional[ImageHeader]]], ...] = (
+    (b"\xff\xd8\xff", _probe_jpeg),
+    (b"\x89PNG\r\n\x1a\n", _probe_png),
+    (b"GIF87a", _probe_gif),
+    (b"GIF89a", _probe_gif),
+    (b"BM", _probe_bmp),
+    (b"II*\x00", _probe_tiff),
+    (b"MM\x00*", _probe_tiff),
+    (b"\xff\x0a", _probe_jxl),
+    (b"\x00\x00\x00\x0cJXL \r\n\x87\n", _probe_jxl),
+)
+
+
+def probe(data: bytes) -> Optional[ImageHeader]:
+    """Identify an image and its dimensions from its leading bytes.
+
+    Args:
+        data: Image data, or at least its first PROBE_SIZE bytes.
+
+    Returns:
+        Tuple (suffix, width, height), or None if the header is not
+        recognized or incomplete.
+    """
+    try:
+        for signature, parser in _PROBES:
+            if data.startswith(signature):
+                header = parser(data)
+                return header if header and header[1] > 0 and header[2] > 0 else None
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            return _probe_webp(data)
+        if data[4:8] == b"ftyp":
+            brands = data[8:struct.unpack_from(">I", data)[0]]
+            if b"avif" in brands or b"avis" in brands:
+                return _probe_avif(data)
+    except (struct.error, IndexError):
+        # Truncated or malformed header
+        return None
+    return None
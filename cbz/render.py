@@ -0,0 +1,185 @@
+"""
+Image rendering helpers for the comic reader.
+
+Provides decoding and scaling functions that can run off the Tk
+thread, and a bounded cache of rendered images.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Hashable, Iterable, List, Optional, Set, Tuple
+
+from PIL import Image
+
+# Image modes supported by Image.reduce()
+_REDUCE_MODES = frozenset({"L", "LA", "RGB", "RGBA", "I", "F"})
+
+
+def fit_size(width: int, height: int, box_width: int, box_height: int) -> Tuple[int, int]:
+    """Return the size of an image scaled to fit in a box, keeping its ratio."""
+    zoom = min(box_width / width, box_height / height)
+    return max(1, int(width * zoom)), max(1, int(height * zoom))
+
+
+def image_nbytes(img: Image.Image) -> int:
+    """Approximate memory footprint of a decoded image."""
+    return img.width * img.height * len(img.getbands())
+
+
+def reduce(img: Image.Image, factor: int) -> Image.Image:
+    """Scale an image down by an integer factor, averaging pixel blocks.
+
+    This is much faster than a resampling filter and is used to build
+    reduced copies (mip levels) for quick previews.
+
+    Args:
+        img: Source image.
+        factor: Reduction factor (1 returns the image itself).
+
+    Returns:
+        Reduced image.
+    """
+    if img.mode not in _REDUCE_MODES:
+        img = img.convert("RGBA")
+    return img.reduce(factor) if factor > 1 else img
+
+
+def render(content: bytes, size: Tuple[int, int]) -> Image.Image:
+    """Decode an image and scale it to the given size.
+
+    JPEG images are decoded at a reduced scale when the target is
+    smaller than the original, which skips most of the decoding work.
+
+    Args:
+        content: Binary image data.
+        size: Target (width, height).
+
+    Returns:
+        Scaled image.
+    """
+    with Image.open(BytesIO(content)) as img:
+        img.draft("RGB", size)
+        return img.resize(size, Image.Resampling.LANCZOS)
+
+
+def page_offsets(sizes: Iterable[Tuple[int, int]], width: int, gap: int = 0) -> List[int]:
+    """Compute the layout of pages stacked vertically at a common width.
+
+    Args:
+        sizes: Original (width, height) of each page.
+        width: Display width of the pages.
+        gap: Vertical space between pages.
+
+    Returns:
+        Top offset of each page, followed by the total height.
+    """
+    offsets = [0]
+    for page_w, page_h in sizes:
+        offsets.append(offsets[-1] + max(1, round(page_h * width / page_w)) + gap)
+    return offsets
+
+
+def visible_tiles(size: Tuple[int, int], region: Tuple[float, float, float, float],
+                  tile_size: int) -> Set[Tuple[int, int]]:
+    """Return the tiles of a scaled image that intersect a region.
+
+    Args:
+        size: Scaled image (width, height).
+        region: Visible (left, top, right, bottom), in scaled image coordinates.
+        tile_size: Side of the square tiles.
+
+    Returns:
+        Set of (column, row) tile positions.
+    """
+    width, height = size
+    left, top, right, bottom = region
+    cols = range(max(0, int(left) // tile_size), min(-(-width // tile_size), int(right) // tile_size + 1))
+    rows = range(max(0, int(top) // tile_size), min(-(-height // tile_size), int(bottom) // tile_size + 1))
+    return {(col, row) for col in cols for row in rows}
+
+
+def render_tile(img: Image.Image, size: Tuple[int, int], tile: Tuple[int, int],
+                tile_size: int) -> Image.Image:
+    """Render one tile of an image scaled to the given size.
+
+    Only the source pixels under the tile (and the filter support
+    around it) are resampled, so adjacent tiles join without seams.
+
+    Args:
+        img: Source image.
+        size: Scaled image (width, height).
+        tile: Tile (column, row).
+        tile_size: Side of the square tiles.
+
+    Returns:
+        Tile image, smaller than tile_size on the right and bottom edges.
+    """
+    width, height = size
+    left, top = tile[0] * tile_size, tile[1] * tile_size
+    right, bottom = min(left + tile_size, width), min(top + tile_size, height)
+    scale_x, scale_y = img.width / width, img.height / height
+    box = (left * scale_x, top * scale_y, right * scale_x, bottom * scale_y)
+    return img.resize((right - left, bottom - top), Image.Resampling.LANCZOS, box=box)
+
+
+class ImageCache:
+    """Thread-safe least-recently-used cache of images, bounded in bytes.
+
+    Attributes:
+        max_bytes: Maximum total footprint of the cached images.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Maximum total footprint of the cached images.
+        """
+        self.max_bytes = max_bytes
+        self._items: OrderedDict = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Total footprint of the cached images."""
+        return self._nbytes
+
+    def get(self, key: Hashable) -> Optional[Image.Image]:
+        """Return a cached image and mark it as recently used."""
+        with self._lock:
+            img = self._items.get(key)
+            if img is not None:
+                self._items.move_to_end(key)
+            return img
+
+    def put(self, key: Hashable, img: Image.Image) -> None:
+        """Add an image, evicting the least recently used ones if needed."""
+        nbytes = image_nbytes(img)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._nbytes -= image_nbytes(old)
+            self._items[key] = img
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._nbytes -= image_nbytes(evicted)
+
+    def clear(self) -> None:
+        """Remove all cached images."""
+        with self._lock:
+            self._items.clear()
+            self._nbytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,381 @@
+"""
+Columnar page storage.
+
+Provides the PageTable class, a list of pages stored as columns:
+page types, flags, sizes and dimensions are packed in typed arrays,
+and text fields, content and source references in plain lists whose
+repeated values are shared. Pages are accessed through lightweight
+PageView objects instead of one PageInfo dataclass per page.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableSequence
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from weakref import WeakValueDictionary
+
+from cbz.archive import ArchiveSource
+from cbz.constants import PageType
+from cbz.page import PageInfo, read_image_info
+
+# Page types by type code, and the reverse mapping
+PAGE_TYPES: Tuple[PageType, ...] = tuple(PageType)
+TYPE_CODES: Dict[PageType, int] = {page_type: i for i, page_type in enumerate(PAGE_TYPES)}
+
+Page = Union[PageInfo, "PageView"]
+
+
+def _intern(value: str) -> str:
+    """Share equal strings, e.g. suffixes repeated on every page."""
+    return sys.intern(value) if value else ""
+
+
+class PageView:
+    """A page stored in a PageTable.
+
+    Exposes the attributes and methods of PageInfo, reading and writing
+    the table columns. A view follows its page when pages are inserted,
+    removed or reordered; once its page is removed or replaced, the view
+    keeps a private copy of it, like a PageInfo taken out of a list.
+    Use to_page() to get a standalone PageInfo.
+    """
+
+    __slots__ = ("_table", "_index", "__weakref__")
+
+    def __init__(self, table: PageTable, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    @property
+    def type(self) -> PageType:
+        return PAGE_TYPES[self._table._types[self._index]]
+
+    @type.setter
+    def type(self, value: PageType) -> None:
+        self._table._types[self._index] = TYPE_CODES[PageType(value)]
+
+    @property
+    def double(self) -> bool:
+        return bool(self._table._double[self._index])
+
+    @double.setter
+    def double(self, value: bool) -> None:
+        self._table._double[self._index] = bool(value)
+
+    @property
+    def image_size(self) -> int:
+        return self._table._sizes[self._index]
+
+    @image_size.setter
+    def image_size(self, value: int) -> None:
+        self._table._sizes[self._index] = value
+
+    @property
+    def key(self) -> str:
+        return self._table._keys[self._index]
+
+    @key.setter
+    def key(self, value: str) -> None:
+        self._table._keys[self._index] = value
+
+    @property
+    def bookmark(self) -> str:
+        return self._table._bookmarks[self._index]
+
+    @bookmark.setter
+    def bookmark(self, value: str) -> None:
+        self._table._bookmarks[self._index] = value
+
+    @property
+    def image_width(self) -> int:
+        return self._table._widths[self._index]
+
+    @image_width.setter
+    def image_width(self, value: int) -> None:
+        self._table._widths[self._index] = value
+
+    @property
+    def image_height(self) -> int:
+        return self._table._heights[self._index]
+
+    @image_height.setter
+    def image_height(self, value: int) -> None:
+        self._table._heights[self._index] = value
+
+    @property
+    def suffix(self) -> str:
+        return self._table._suffixes[self._index]
+
+    @suffix.setter
+    def suffix(self, value: str) -> None:
+        self._table._suffixes[self._index] = _intern(value)
+
+    @property
+    def name(self) -> str:
+        return self._table._names[self._index]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._table._names[self._index] = value
+
+    @property
+    def _content(self) -> bytes:
+        return self._table._contents[self._index]
+
+    @_content.setter
+    def _content(self, value: bytes) -> None:
+        self._table._contents[self._index] = value
+
+    @property
+    def _source(self) -> Optional[ArchiveSource]:
+        return self._table._sources[self._index]
+
+    @_source.setter
+    def _source(self, value: Optional[ArchiveSource]) -> None:
+        self._table._sources[self._index] = value
+
+    @property
+    def _member(self) -> str:
+        return self._table._members[self._index]
+
+    @_member.setter
+    def _member(self, value: str) -> None:
+        self._table._members[self._index] = value
+
+    @property
+    def content(self) -> bytes:
+        """Binary image data, read from the source archive if not in memory."""
+        content = self._content
+        if not content and self._source is not None:
+            return self._source.read(self._member)
+        return content
+
+    @content.setter
+    def content(self, value: bytes) -> None:
+        """Set content and automatically extract image metadata."""
+        self.suffix, self.image_width, self.image_height = read_image_info(value)
+        self.image_size = len(value)
+        self._content = value
+        self._source = None
+        self._member = ""
+
+    convert = PageInfo.convert
+    digest = PageInfo.digest
+    thumbnail = PageInfo.thumbnail
+    show = PageInfo.show
+    save = PageInfo.save
+
+    def to_page(self) -> PageInfo:
+        """Return a standalone PageInfo with the attributes of this page."""
+        page = PageInfo(
+            type=self.type, double=self.double, image_size=self.image_size,
+            key=self.key, bookmark=self.bookmark, image_width=self.image_width,
+            image_height=self.image_height, suffix=self.suffix, name=self.name
+        )
+        page._content = self._content
+        page._source = self._source
+        page._member = self._member
+        return page
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (PageInfo, PageView)):
+            return NotImplemented
+        return _fields(self) == _fields(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"PageView(type={self.type!r}, double={self.double!r}, image_size={self.image_size!r}, "
+                f"key={self.key!r}, bookmark={self.bookmark!r}, image_width={self.image_width!r}, "
+                f"image_height={self.image_height!r})")
+
+
+def _fields(page: Page) -> tuple:
+    """Return the compared attributes of a page, as PageInfo equality does."""
+    return (page.type, page.double, page.image_size, page.key, page.bookmark,
+            page.image_width, page.image_height, page.suffix, page.name)
+
+
+class PageTable(MutableSequence):
+    """Mutable sequence of pages stored as columns.
+
+    Behaves like a list of PageInfo and can be used as ComicInfo.pages.
+    Items are returned as PageView objects; any PageInfo or PageView
+    can be stored, its attributes being copied into the columns. A
+    page takes a fraction of the memory of a PageInfo, which matters
+    for comics with thousands of pages and for indexes over whole
+    libraries.
+    """
+
+    def __init__(self, pages: Iterable[Page] = ()) -> None:
+        """Initialize the table.
+
+        Args:
+            pages: Initial pages, consumed one by one.
+        """
+        self._types = array("B")
+        self._double = array("B")
+        self._sizes = array("q")
+        self._widths = array("l")
+        self._heights = array("l")
+        self._keys: List[str] = []
+        self._bookmarks: List[str] = []
+        self._suffixes: List[str] = []
+        self._names: List[str] = []
+        self._contents: List[bytes] = []
+        self._sources: List[Optional[ArchiveSource]] = []
+        self._members: List[str] = []
+        # Views handed out, by index, to be moved along with their page
+        self._views: WeakValueDictionary[int, PageView] = WeakValueDictionary()
+        self.extend(pages)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_views"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._views = WeakValueDictionary()
+
+    def _columns(self) -> tuple:
+        """Return the columns, in the order of _row() values."""
+        return (self._types, self._double, self._sizes, self._widths, self._heights,
+                self._keys, self._bookmarks, self._suffixes, self._names,
+                self._contents, self._sources, self._members)
+
+    @staticmethod
+    def _row(page: Page) -> tuple:
+        """Return the column values of a page."""
+        return (
+            TYPE_CODES[PageType(page.type)], bool(page.double), page.image_size,
+            page.image_width, page.image_height, page.key, page.bookmark,
+            _intern(page.suffix), page.name, page._content, page._source, page._member
+        )
+
+    def _check_index(self, index: int) -> int:
+        """Return a non-negative index, or raise IndexError."""
+        size = len(self._types)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("page index out of range")
+        return index
+
+    def _move_views(self, new_index: Callable[[int], Optional[int]]) -> None:
+        """Update the views before a change of the columns.
+
+        Must be called before the columns are modified: the views of
+        removed or replaced pages (new_index returns None) copy their
+        page into a private table.
+        """
+        views = list(self._views.items())
+        self._views = WeakValueDictionary()
+        for index, view in views:
+            target = new_index(index)
+            if target is None:
+                table = PageTable((view,))
+                view._table, view._index = table, 0
+                table._views[0] = view
+            else:
+                view._index = target
+                self._views[target] = view
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[PageView, List[PageView]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = self._check_index(index)
+        view = self._views.get(index)
+        if view is None:
+            view = self._views[index] = PageView(self, index)
+        return view
+
+    def __setitem__(self, index: Union[int, slice], page: Union[Page, Iterable[Page]]) -> None:
+        if isinstance(index, slice):
+            # Copy the incoming pages first: they may be views of this table
+            rows = [self._row(p) for p in page]
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                stop = max(start, stop)
+                shift = len(rows) - (stop - start)
+                self._move_views(lambda i: i if i < start else None if i < stop else i + shift)
+            else:
+                replaced = range(start, stop, step)
+                if len(rows) != len(replaced):
+                    raise ValueError(f"attempt to assign sequence of size {len(rows)} "
+                                     f"to extended slice of size {len(replaced)}")
+                replaced = set(replaced)
+                self._move_views(lambda i: None if i in replaced else i)
+            for j, column in enumerate(self._columns()):
+                values = [row[j] for row in rows]
+                column[index] = array(column.typecode, values) if isinstance(column, array) else values
+            return
+        index = self._check_index(index)
+        row = self._row(page)
+        self._move_views(lambda i: None if i == index else i)
+        for column, value in zip(self._columns(), row):
+            column[index] = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            removed = sorted(range(*index.indices(len(self))))
+            removed_set = set(removed)
+            self._move_views(lambda i: None if i in removed_set else i - bisect_left(removed, i))
+        else:
+            index = self._check_index(index)
+            self._move_views(lambda i: i if i < index else None if i == index else i - 1)
+        for column in self._columns():
+            del column[index]
+
+    def insert(self, index: int, page: Page) -> None:
+        row = self._row(page)
+        index = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        self._move_views(lambda i: i if i < index else i + 1)
+        for column, value in zip(self._columns(), row):
+            column.insert(index, value)
+
+    def append(self, page: Page) -> None:
+        for column, value in zip(self._columns(), self._row(page)):
+            column.append(value)
+
+    def pop(self, index: int = -1) -> PageView:
+        """Remove and return a page; the view keeps a copy of it."""
+        view = self[index]
+        del self[view._index]
+        return view
+
+    def clear(self) -> None:
+        del self[:]
+
+    def reverse(self) -> None:
+        """Reverse the pages in place."""
+        last = len(self) - 1
+        self._move_views(lambda i: last - i)
+        for column in self._columns():
+            column.reverse()
+
+    def sort(self, *, key: Optional[Callable[[PageView], object]] = None, reverse: bool = False) -> None:
+        """Sort the pages in place, as list.sort() does."""
+        order = sorted(range(len(self)), key=(lambda i: key(self[i])) if key else self.__getitem__,
+                       reverse=reverse)
+        position = {old: new for new, old in enumerate(order)}
+        self._move_views(position.__getitem__)
+        for column in self._columns():
+            values = [column[i] for i in order]
+            column[:] = array(column.typecode, values) if isinstance(column, array) else values
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, tuple, PageTable)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"PageTable({len(self)} pages)"
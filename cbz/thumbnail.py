@@ -0,0 +1,180 @@
+"""
+Page thumbnails.
+
+Provides the ThumbnailCache class, a persistent on-disk cache of
+page thumbnails keyed by the hash of the page content and the
+thumbnail size. Missing thumbnails are generated in a process pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Deque, Iterable, List, Optional, Tuple, Union
+
+from PIL import Image
+
+# Default bounding box of the thumbnails (width, height)
+THUMBNAIL_SIZE = (256, 256)
+
+# JPEG quality of the cached thumbnails
+THUMBNAIL_QUALITY = 85
+
+
+def default_directory() -> Path:
+    """Return the per-user cache directory for thumbnails."""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "cbz" / "thumbnails"
+
+
+def thumbnail_key(content: bytes, size: Tuple[int, int]) -> str:
+    """Return the cache key of a thumbnail: content hash and size."""
+    return f"{hashlib.sha256(content).hexdigest()}-{size[0]}x{size[1]}"
+
+
+def make_thumbnail(content: bytes, size: Tuple[int, int] = THUMBNAIL_SIZE) -> bytes:
+    """Create a JPEG thumbnail fitting in the given size.
+
+    JPEG pages are decoded at a reduced scale close to the thumbnail
+    size, which skips most of the decoding work. Transparent images
+    are flattened on a white background.
+
+    Args:
+        content: Binary image data.
+        size: Bounding box (width, height) of the thumbnail.
+
+    Returns:
+        JPEG thumbnail data.
+    """
+    with Image.open(BytesIO(content)) as img:
+        img.draft("RGB", size)
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, (255, 255, 255))
+            img.paste(rgba, mask=rgba.getchannel("A"))
+        elif img.mode not in ("L", "RGB"):
+            img = img.convert("RGB")
+
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG", quality=THUMBNAIL_QUALITY)
+        return buffer.getvalue()
+
+
+class ThumbnailCache:
+    """Persistent cache of page thumbnails, addressed by content.
+
+    Identical pages share their thumbnails, across files and runs.
+    Entries are written atomically, so the cache can be shared by
+    several processes.
+
+    Attributes:
+        directory: Root directory of the cache.
+    """
+
+    def __init__(self, directory: Optional[Union[Path, str]] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Root directory of the cache (default: user cache directory).
+        """
+        self.directory = Path(directory) if directory is not None else default_directory()
+
+    def path(self, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.directory / key[:2] / f"{key}.jpeg"
+
+    def load(self, key: str) -> Optional[bytes]:
+        """Return a cached thumbnail, or None if it is missing."""
+        try:
+            return self.path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def store(self, key: str, data: bytes) -> None:
+        """Write a thumbnail to the cache."""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def get(self, content: bytes, size: Tuple[int, int] = THUMBNAIL_SIZE) -> bytes:
+        """Return the thumbnail of an image, generating it if missing.
+
+        Args:
+            content: Binary image data.
+            size: Bounding box (width, height) of the thumbnail.
+
+        Returns:
+            JPEG thumbnail data.
+        """
+        key = thumbnail_key(content, size)
+        data = self.load(key)
+        if data is None:
+            data = make_thumbnail(content, size)
+            self.store(key, data)
+        return data
+
+    def get_many(self, contents: Iterable[bytes], size: Tuple[int, int] = THUMBNAIL_SIZE,
+                 max_workers: Optional[int] = None) -> List[bytes]:
+        """Return the thumbnails of several images, generating the missing ones in parallel.
+
+        Cached thumbnails are read directly; the worker processes are
+        only started on the first miss. Images are consumed one by one,
+        with at most 2 * max_workers of them waiting to be processed.
+
+        Args:
+            contents: Binary image data of each image.
+            size: Bounding box (width, height) of the thumbnails.
+            max_workers: Number of worker processes (default: CPU count).
+
+        Returns:
+            JPEG thumbnail data, in input order.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        results: List[Optional[bytes]] = []
+        pending: Deque[Tuple[int, str, Future]] = deque()
+        executor: Optional[ProcessPoolExecutor] = None
+
+        def collect() -> None:
+            index, key, future = pending.popleft()
+            results[index] = future.result()
+            self.store(key, results[index])
+
+        try:
+            for content in contents:
+                key = thumbnail_key(content, size)
+                results.append(self.load(key))
+                if results[-1] is not None:
+                    continue
+                if executor is None:
+                    executor = ProcessPoolExecutor(max_workers=max_workers)
+                if len(pending) >= 2 * max_workers:
+                    collect()
+                pending.append((len(results) - 1, key, executor.submit(make_thumbnail, content, size)))
+
+            while pending:
+                collect()
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        return results
+
+    def clear(self) -> None:
+        """Remove all cached thumbnails."""
+        for path in self.directory.glob("*/*.jpeg"):
+            path.unlink(missing_ok=True)
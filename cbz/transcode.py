@@ -0,0 +1,215 @@
+"""
+Page transcoding.
+
+Re-encodes the pages of a comic in another image format or at a
+smaller size, encoding in a process pool, and reports the size and
+encoding time of each page.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional, Sequence, Tuple
+
+from cbz.page import (
+    CONVERT_QUALITY,
+    PageInfo,
+    encode_image,
+    normalize_suffix,
+    pil_format,
+    read_image_info,
+    with_suffix
+)
+from cbz.render import fit_size
+
+# Encoding of a page: (target suffix, target size or None), or None to skip it
+Task = Optional[Tuple[str, Optional[Tuple[int, int]]]]
+
+
+@dataclass
+class TranscodeResult:
+    """Outcome of the re-encoding of one page.
+
+    Attributes:
+        index: Position of the page in the comic.
+        name: Name of the page after the operation.
+        original_size: Size of the page before the operation, in bytes.
+        encoded_size: Size of the encoded image, in bytes (0 if the page
+            was skipped or could not be encoded).
+        seconds: Encoding time in the worker, in seconds.
+        converted: True if the page was replaced by the encoded image.
+        error: Error message if the page could not be encoded.
+    """
+
+    index: int
+    name: str
+    original_size: int
+    encoded_size: int
+    seconds: float
+    converted: bool
+    error: str = ""
+
+    @property
+    def size(self) -> int:
+        """Size of the page after the operation, in bytes."""
+        return self.encoded_size if self.converted else self.original_size
+
+
+def _encode(data: bytes, suffix: str, size: Optional[Tuple[int, int]], quality: int,
+            options: dict) -> Tuple[bytes, float]:
+    """Encode an image and measure the encoding time (run in a worker)."""
+    start = time.perf_counter()
+    encoded = encode_image(data, suffix, quality, size, **options)
+    return encoded, time.perf_counter() - start
+
+
+def _encode_pages(pages: Sequence[PageInfo], task: Callable[[PageInfo], Task], quality: int,
+                  max_workers: Optional[int], keep_larger: bool, options: dict) -> List[TranscodeResult]:
+    """Re-encode pages in parallel and replace them with the results.
+
+    Pages are encoded in worker processes, with at most
+    2 * max_workers of them waiting to be processed, and updated in
+    place as results arrive. The worker processes are only started
+    for the first page to encode.
+
+    Args:
+        pages: Pages to process.
+        task: Returns the encoding of a page, or None to leave it unchanged.
+        quality: Encoder quality, for lossy formats.
+        max_workers: Number of worker processes (default: CPU count);
+            with 1, pages are encoded in the calling process.
+        keep_larger: If True, replace pages even when the result is larger.
+        options: Additional Pillow encoder options.
+
+    Returns:
+        One result per page, in page order.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    results: List[TranscodeResult] = [
+        TranscodeResult(index, page.name, page.image_size, 0, 0.0, False)
+        for index, page in enumerate(pages)
+    ]
+
+    def apply(index: int, outcome: Callable[[], Tuple[bytes, float]]) -> None:
+        """Update a page with its encoded image, given a callable returning it."""
+        page, result = pages[index], results[index]
+        try:
+            encoded, result.seconds = outcome()
+        except Exception as e:
+            result.error = str(e)
+            return
+        result.encoded_size = len(encoded)
+        if keep_larger or result.encoded_size < result.original_size:
+            page.content = encoded
+            page.name = result.name = with_suffix(page.name, page.suffix)
+            result.converted = True
+
+    pending: Deque[Tuple[int, Future]] = deque()
+    executor: Optional[ProcessPoolExecutor] = None
+
+    def collect() -> None:
+        index, future = pending.popleft()
+        apply(index, future.result)
+
+    try:
+        for index, page in enumerate(pages):
+            try:
+                encoding = task(page)
+            except Exception as e:
+                results[index].error = str(e)
+                continue
+            if encoding is None:
+                continue
+
+            args = (page.content, *encoding, quality, options)
+            if max_workers == 1:
+                apply(index, lambda: _encode(*args))
+                continue
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            if len(pending) >= 2 * max_workers:
+                collect()
+            pending.append((index, executor.submit(_encode, *args)))
+
+        while pending:
+            collect()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return results
+
+
+def transcode_pages(pages: Sequence[PageInfo], image_format: str, quality: int = CONVERT_QUALITY,
+                    max_workers: Optional[int] = None, keep_larger: bool = False,
+                    **options) -> List[TranscodeResult]:
+    """Re-encode pages in another image format, in parallel.
+
+    A page whose encoded image is larger than the original is left
+    unchanged, unless keep_larger is set; a page that cannot be
+    encoded is left unchanged and its error is reported.
+
+    Args:
+        pages: Pages to convert (e.g. ComicInfo.pages).
+        image_format: Target format (jpeg, png, webp, avif, jxl, etc.).
+        quality: Encoder quality, for lossy formats.
+        max_workers: Number of worker processes (default: CPU count);
+            with 1, pages are encoded in the calling process.
+        keep_larger: If True, replace pages even when the result is larger.
+        **options: Additional Pillow encoder options (lossless, method, etc.).
+
+    Returns:
+        One result per page, in page order.
+
+    Raises:
+        InvalidImageError: If the target format cannot be written.
+    """
+    suffix = normalize_suffix(image_format)
+    pil_format(suffix)
+    return _encode_pages(pages, lambda page: (suffix, None), quality, max_workers, keep_larger, options)
+
+
+def resize_pages(pages: Sequence[PageInfo], max_width: Optional[int], max_height: Optional[int],
+                 quality: int = CONVERT_QUALITY, max_workers: Optional[int] = None,
+                 **options) -> List[TranscodeResult]:
+    """Downscale pages to fit in a bounding box, in parallel.
+
+    Pages already within bounds are skipped without reading their
+    content. The other pages are scaled down, keeping their aspect
+    ratio, and re-encoded in their own format; JPEG pages are decoded
+    at a reduced scale. Resized pages replace the originals even if
+    their new encoding is larger; a page that cannot be resized is
+    left unchanged and its error is reported.
+
+    Args:
+        pages: Pages to resize (e.g. ComicInfo.pages).
+        max_width: Maximum width in pixels (None for no limit).
+        max_height: Maximum height in pixels (None for no limit).
+        quality: Encoder quality, for lossy formats.
+        max_workers: Number of worker processes (default: CPU count);
+            with 1, pages are encoded in the calling process.
+        **options: Additional Pillow encoder options.
+
+    Returns:
+        One result per page, in page order.
+
+    Raises:
+        ValueError: If a bound is not a positive number.
+    """
+    if any(bound is not None and bound < 1 for bound in (max_width, max_height)):
+        raise ValueError("Maximum dimensions must be positive")
+
+    def task(page: PageInfo) -> Task:
+        width, height = page.image_width, page.image_height
+        if not (width and height):
+            # Dimensions not read yet (e.g. metadata-only loading)
+            _, width, height = read_image_info(page.content)
+        box = (max_width or width, max_height or height)
+        if width <= box[0] and height <= box[1]:
+            return None
+        return page.suffix, fit_size(width, height, *box)
+
+    return _encode_pages(pages, task, quality, max_workers, True, options)
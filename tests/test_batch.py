@@ -0,0 +1,57 @@
+"""Tests for batch loading."""
+
+import zipfile
+from pathlib import Path
+
+from cbz.batch import load
+from cbz.comic import ComicInfo
+from cbz.exceptions import InvalidMetadataError
+
+
+class TestBatch:
+    """Tests for parallel loading of several files."""
+
+    def test_load_reports_errors(self, sample_cbz_file: Path, tmp_path: Path) -> None:
+        """Valid files are loaded and invalid ones reported without aborting."""
+        broken = tmp_path / "broken.cbz"
+        copies = []
+        for i in range(3):
+            copy = tmp_path / f"copy-{i}.cbz"
+            copy.write_bytes(sample_cbz_file.read_bytes())
+            copies.append(copy)
+
+        with zipfile.ZipFile(broken, "w") as zf:
+            zf.writestr("ComicInfo.xml", "<ComicInfo><Title>")
+
+        results = {r.path: r for r in load([*copies, broken], max_workers=2, max_pending=2)}
+
+        assert len(results) == 4
+        for copy in copies:
+            assert results[copy].ok
+            assert results[copy].comic.title == "Test Comic"
+            assert len(results[copy].comic) == 3
+        assert not results[broken].ok
+        assert isinstance(results[broken].error, InvalidMetadataError)
+
+    def test_load_metadata_only(self, sample_cbz_file: Path) -> None:
+        """Metadata-only results keep lazily readable pages."""
+        (result,) = load([sample_cbz_file], metadata_only=True, max_workers=1)
+
+        assert result.ok
+        assert result.comic[0]._content == b""
+        assert len(result.comic[0].content) == result.comic[0].image_size
+
+    def test_load_metadata_only_pdf(self, sample_cbz_file: Path, tmp_path: Path) -> None:
+        """PDF files are loaded lazily in metadata-only mode."""
+        comic = ComicInfo.from_cbz(sample_cbz_file)
+        pdf_path = tmp_path / "comic.pdf"
+        comic.save_pdf(pdf_path)
+
+        results = list(load([pdf_path, sample_cbz_file], metadata_only=True, max_workers=2))
+
+        assert all(result.ok for result in results)
+        (result,) = [r for r in results if r.path == pdf_path]
+        with result.comic as loaded:
+            assert len(loaded) == len(comic)
+            assert loaded[0]._content == b""
+            assert [page.content for page in loaded] == [page.content for page in comic]
@@ -0,0 +1,36 @@
+"""Tests for the benchmark suite."""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fixtures import FixtureSpec, make_cbz, make_image
+from benchmarks.runner import compare, run
+from cbz.comic import ComicInfo
+
+
+class TestBenchmarks:
+    """Tests for fixture generation, measurements and comparison."""
+
+    def test_fixtures(self, tmp_path: Path) -> None:
+        """Synthetic comics follow their specification and are deterministic."""
+        assert make_image((32, 48), "png", seed=1) == make_image((32, 48), "png", seed=1)
+        with pytest.raises(ValueError):
+            FixtureSpec(format="bmp")
+
+        spec = FixtureSpec(pages=3, width=40, height=60, format="png", compression="deflated")
+        comic = ComicInfo.from_cbz(make_cbz(tmp_path / "comic.cbz", spec))
+        assert len(comic) == 3
+        assert {(p.suffix, p.image_width, p.image_height) for p in comic} == {(".png", 40, 60)}
+
+    def test_run_and_compare(self) -> None:
+        """Reports hold each case's measurements; slower cases are flagged."""
+        report = run(FixtureSpec(pages=2, width=40, height=60), repeat=1, names=["pack", "render"])
+        assert list(report["results"]) == ["pack", "render"]
+        assert report["fixture"]["pages"] == 2
+        assert all(r["median"] > 0 and r["peak_memory"] > 0 for r in report["results"].values())
+
+        slower = {"results": {"pack": {"median": report["results"]["pack"]["median"] * 2,
+                                       "peak_memory": report["results"]["pack"]["peak_memory"]}}}
+        rows = compare(report, slower, threshold=0.5)
+        assert [(r["metric"], r["regression"]) for r in rows] == [("median", True), ("peak_memory", False)]
@@ -1,13 +1,33 @@
 """Tests for the ComicInfo class."""
 
+import gc
 import tempfile
+import tracemalloc
+import warnings
+import zipfile
+from io import BytesIO
 from pathlib import Path
 
-from cbz.comic import ComicInfo
-from cbz.constants import AgeRating, Format, Manga, PageType, YesNo
+import pytest
+import xmltodict
+from PIL import Image
+from pypdf import PdfReader
+
+from cbz import archive
+from cbz.archive import ArchiveSource
+from cbz.comic import ComicInfo, _codec
+from cbz.constants import AgeRating, Format, Manga, PageType, Rating, YesNo
+from cbz.exceptions import CBZError, InvalidImageError, UnsupportedFormatError
+from cbz.models import ComicModel, PageModel
 from cbz.page import PageInfo
 
 
+def _encode_png(mode: str, size: tuple) -> bytes:
+    buf = BytesIO()
+    Image.new(mode, size).save(buf, "PNG")
+    return buf.getvalue()
+
+
 class TestComicInfo:
     """Tests for comic creation, loading and serialization."""
 
@@ -219,3 +239,468 @@ class TestComicInfo:
         assert comic.volume is None
         assert comic.year is None
         assert comic.community_rating is None
+
+    def test_from_cbz_lazy(self, sample_cbz_file: Path) -> None:
+        """Lazy loading reads page content on access only."""
+        eager = ComicInfo.from_cbz(sample_cbz_file)
+
+        with ComicInfo.from_cbz(sample_cbz_file, lazy=True) as comic:
+            assert comic.title == eager.title
+            assert len(comic) == len(eager)
+            for lazy_page, page in zip(comic, eager):
+                assert lazy_page._content == b""
+                assert lazy_page.image_width == page.image_width
+                assert lazy_page.image_height == page.image_height
+                assert lazy_page.image_size == page.image_size
+                assert lazy_page.suffix == page.suffix
+                assert lazy_page.content == page.content
+
+    def test_lazy_reopens_after_close(self, sample_cbz_file: Path) -> None:
+        """Lazy pages stay readable after the comic is closed."""
+        comic = ComicInfo.from_cbz(sample_cbz_file, lazy=True)
+        comic.close()
+        assert len(comic[0].content) == comic[0].image_size
+        comic.close()
+
+    def test_lazy_save_round_trip(self, sample_cbz_file: Path, tmp_path: Path) -> None:
+        """A lazily loaded comic can be saved like an eager one."""
+        with ComicInfo.from_cbz(sample_cbz_file, lazy=True) as comic:
+            out_path = tmp_path / "lazy.cbz"
+            comic.save(out_path)
+
+        loaded = ComicInfo.from_cbz(out_path)
+        assert loaded.title == comic.title
+        assert [p.content for p in loaded] == [p.content for p in comic]
+
+    def test_lazy_without_metadata(self, images_dir: Path, tmp_path: Path) -> None:
+        """Lazy loading probes image headers when ComicInfo.xml is missing."""
+        image_path = sorted(images_dir.iterdir())[0]
+        cbz_path = tmp_path / "bare.cbz"
+        with zipfile.ZipFile(cbz_path, "w") as zf:
+            zf.write(image_path, "001.jpg")
+
+        page = PageInfo.load(image_path)
+        with ComicInfo.from_cbz(cbz_path, lazy=True) as comic:
+            assert comic[0].suffix == page.suffix
+            assert comic[0].image_width == page.image_width
+            assert comic[0].image_height == page.image_height
+
+    def test_save_copies_unchanged_members(self, sample_cbz_file: Path, tmp_path: Path) -> None:
+        """Unchanged pages are copied verbatim from their source member."""
+        deflated = tmp_path / "deflated.cbz"
+        ComicInfo.from_cbz(sample_cbz_file).save(deflated, compression=zipfile.ZIP_DEFLATED)
+
+        comic = ComicInfo.from_cbz(deflated)
+        comic.title = "Retagged"
+        comic.pages.reverse()
+        out_path = tmp_path / "retagged.cbz"
+        comic.save(out_path, rename=False, compression=zipfile.ZIP_DEFLATED)
+
+        with zipfile.ZipFile(deflated) as src, zipfile.ZipFile(out_path) as dst:
+            for page in comic:
+                src_info = src.getinfo(page.name)
+                dst_info = dst.getinfo(page.name)
+                assert dst_info.CRC == src_info.CRC
+                assert dst_info.compress_size == src_info.compress_size
+                assert dst.read(page.name) == src.read(page.name)
+            assert dst.testzip() is None
+
+        assert ComicInfo.from_cbz(out_path).title == "Retagged"
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_save_closes_sources(self, sample_cbz_file: Path, tmp_path: Path, compression: int) -> None:
+        """Source archives opened to copy members are closed after saving."""
+        source_path = tmp_path / "source.cbz"
+        ComicInfo.from_cbz(sample_cbz_file).save(source_path, compression=compression)
+        comic = ComicInfo.from_cbz(source_path)
+        source = comic[0]._source
+        assert not source.is_open
+
+        opened = []
+        source_open = source._open
+        source._open = lambda: opened.append(True) or source_open()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ResourceWarning)
+            comic.save(tmp_path / "copy.cbz", compression=compression)
+            comic.pack(compression=compression)
+            gc.collect()
+        assert not source.is_open
+        # Stored pages in memory are copied with the CRC kept from loading
+        assert opened == []
+
+        with zipfile.ZipFile(source_path) as src, zipfile.ZipFile(tmp_path / "copy.cbz") as dst:
+            assert [i.CRC for i in dst.infolist()[1:]] == [i.CRC for i in src.infolist()[1:]]
+
+    def test_save_over_source(self, sample_cbz_file: Path) -> None:
+        """A lazily loaded comic can be saved over its own archive."""
+        with ComicInfo.from_cbz(sample_cbz_file, lazy=True) as comic:
+            contents = [page.content for page in comic]
+            comic.title = "Overwritten"
+            comic.save(sample_cbz_file)
+            assert [page.content for page in comic] == contents
+
+        loaded = ComicInfo.from_cbz(sample_cbz_file)
+        assert loaded.title == "Overwritten"
+        assert [page.content for page in loaded] == contents
+        assert list(sample_cbz_file.parent.glob("*.tmp")) == []
+
+    def test_modified_page_is_rewritten(self, sample_cbz_file: Path, images_dir: Path) -> None:
+        """Pages with new content are not copied from their source member."""
+        comic = ComicInfo.from_cbz(sample_cbz_file)
+        replacement = sorted(images_dir.iterdir())[-1].read_bytes()
+        comic[0].content = replacement
+
+        loaded_path = sample_cbz_file.with_name("modified.cbz")
+        comic.save(loaded_path)
+        assert ComicInfo.from_cbz(loaded_path)[0].content == replacement
+
+    def test_update_metadata(self, sample_cbz_file: Path) -> None:
+        """Update ComicInfo.xml in place, leaving page members untouched."""
+        with zipfile.ZipFile(sample_cbz_file) as zf:
+            before = {i.filename: (i.header_offset, i.CRC) for i in zf.infolist() if i.filename != "ComicInfo.xml"}
+
+        ComicInfo.update_metadata(sample_cbz_file, series="New Series", story_arc="Arc")
+        ComicInfo.update_metadata(sample_cbz_file, title="New Title")
+
+        with zipfile.ZipFile(sample_cbz_file) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist().count("ComicInfo.xml") == 1
+            after = {i.filename: (i.header_offset, i.CRC) for i in zf.infolist() if i.filename != "ComicInfo.xml"}
+        assert after == before
+
+        comic = ComicInfo.from_cbz(sample_cbz_file)
+        assert comic.title == "New Title"
+        assert comic.series == "New Series"
+        assert comic.story_arc == "Arc"
+        assert comic.number == 1
+        assert comic[0].type == PageType.FRONT_COVER
+
+    def test_update_metadata_reads_no_pages(self, images_dir: Path, tmp_path: Path, monkeypatch) -> None:
+        """Only ComicInfo.xml is read; page attributes are kept as they were."""
+        path = tmp_path / "no-dimensions.cbz"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("ComicInfo.xml", '<ComicInfo><Title>Old</Title><Pages><Page Image="0" Type="FrontCover"/>'
+                                         '</Pages></ComicInfo>')
+            for image in sorted(images_dir.iterdir())[:2]:
+                zf.write(image, image.name)
+
+        read = []
+        zip_open = zipfile.ZipFile.open
+        monkeypatch.setattr(zipfile.ZipFile, "open", lambda zf, name, mode="r", **kwargs: (
+            read.append(getattr(name, "filename", name)) if mode == "r" else None
+        ) or zip_open(zf, name, mode, **kwargs))
+        ComicInfo.update_metadata(path, title="New")
+        monkeypatch.undo()
+
+        assert read == ["ComicInfo.xml"]
+        with zipfile.ZipFile(path) as zf:
+            xml = zf.read("ComicInfo.xml").decode("utf-8")
+        assert "<Title>New</Title>" in xml
+        assert "ImageWidth" not in xml and "ImageHeight" not in xml
+        assert ComicInfo.from_cbz(path)[0].type == PageType.FRONT_COVER
+
+    def test_zip_internals_fallback(self, sample_cbz_file: Path, tmp_path: Path, monkeypatch) -> None:
+        """Without verified zipfile internals, members are written with the public API."""
+        monkeypatch.setattr(archive, "ZIP_INTERNALS_VERSIONS", ((0, 0), (0, 0)))
+        assert not archive.zip_internals_supported()
+        with pytest.raises(CBZError):
+            archive.compress_member(b"data", zipfile.ZIP_DEFLATED)
+
+        comic = ComicInfo.from_cbz(sample_cbz_file)
+        for compression, workers in ((zipfile.ZIP_STORED, 1), (zipfile.ZIP_DEFLATED, 3)):
+            out_path = tmp_path / f"fallback-{compression}.cbz"
+            comic.save(out_path, compression=compression, workers=workers)
+            assert [p.content for p in ComicInfo.from_cbz(out_path)] == [p.content for p in comic]
+
+        ComicInfo.update_metadata(sample_cbz_file, title="Rewritten")
+        with zipfile.ZipFile(sample_cbz_file) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist().count("ComicInfo.xml") == 1
+        updated = ComicInfo.from_cbz(sample_cbz_file)
+        assert updated.title == "Rewritten"
+        assert updated.series == comic.series
+        assert [p.content for p in updated] == [p.content for p in comic]
+        assert list(sample_cbz_file.parent.glob("*.tmp")) == []
+
+    def test_update_metadata_unknown_field(self, sample_cbz_file: Path) -> None:
+        """Unknown metadata fields are rejected."""
+        with pytest.raises(TypeError):
+            ComicInfo.update_metadata(sample_cbz_file, pages=[])
+
+    def test_read_info(self, sample_cbz_file: Path) -> None:
+        """Read metadata and page attributes without reading page content."""
+        eager = ComicInfo.from_cbz(sample_cbz_file)
+        comic = ComicInfo.read_info(sample_cbz_file)
+
+        assert comic.title == eager.title
+        assert comic.series == eager.series
+        assert comic.get_info()["FileSize"] == eager.get_info()["FileSize"]
+        for page, expected in zip(comic, eager):
+            assert page._content == b""
+            assert page.name == expected.name
+            assert page.type == expected.type
+            assert page.image_size == expected.image_size
+            assert page.image_width == expected.image_width
+            assert page.image_height == expected.image_height
+        assert comic[0].content == eager[0].content
+
+    def test_read_info_without_metadata(self, images_dir: Path, tmp_path: Path) -> None:
+        """Pages without ComicInfo.xml entries carry only name and size."""
+        image_path = sorted(images_dir.iterdir())[0]
+        cbz_path = tmp_path / "bare.cbz"
+        with zipfile.ZipFile(cbz_path, "w") as zf:
+            zf.write(image_path, "001.jpg")
+
+        comic = ComicInfo.read_info(cbz_path)
+        assert comic[0].name == "001.jpg"
+        assert comic[0].image_size == image_path.stat().st_size
+        assert comic[0].image_width == 0
+
+    def test_read_info_unsupported(self, sample_image_path: Path) -> None:
+        """Non-archive files are rejected."""
+        with pytest.raises(UnsupportedFormatError):
+            ComicInfo.read_info(sample_image_path)
+
+    def test_from_cbz_workers(self, images_dir: Path, tmp_path: Path, monkeypatch) -> None:
+        """Thread-parallel loading keeps page order and metadata, and closes its handles."""
+        pages = [PageInfo.load(path=path) for path in sorted(images_dir.iterdir())]
+        cbz_path = tmp_path / "parallel.cbz"
+        ComicInfo.from_pages(pages=pages, title="Parallel").save(cbz_path, compression=zipfile.ZIP_DEFLATED)
+
+        opened = []
+        open_archive = ArchiveSource.open_archive
+        monkeypatch.setattr(ArchiveSource, "open_archive", lambda self: opened.append(open_archive(self)) or opened[-1])
+
+        sequential = ComicInfo.from_cbz(cbz_path)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ResourceWarning)
+            parallel = ComicInfo.from_cbz(cbz_path, workers=4)
+            gc.collect()
+
+        assert 1 <= len(opened) <= 4
+        assert all(archive.fp is None for archive in opened)
+        assert parallel.title == "Parallel"
+        assert parallel == sequential
+        assert [p.content for p in parallel] == [p.content for p in sequential]
+
+    def test_from_cbz_workers_invalid_page(self, sample_cbz_file: Path) -> None:
+        """Thread-parallel loading raises the same error as sequential loading."""
+        with zipfile.ZipFile(sample_cbz_file, "a") as zf:
+            zf.writestr("page-002.5.jpg", b"not an image")
+
+        with pytest.raises(InvalidImageError):
+            ComicInfo.from_cbz(sample_cbz_file)
+        with pytest.raises(InvalidImageError):
+            ComicInfo.from_cbz(sample_cbz_file, workers=4)
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA])
+    def test_save_workers(self, images_dir: Path, tmp_path: Path, compression: int) -> None:
+        """Parallel compression produces the same archive content."""
+        pages = [PageInfo.load(path=path) for path in sorted(images_dir.iterdir())[:3]]
+        comic = ComicInfo.from_pages(pages=pages, title="Parallel")
+
+        sequential = tmp_path / "sequential.cbz"
+        parallel = tmp_path / "parallel.cbz"
+        comic.save(sequential, compression=compression)
+        comic.save(parallel, compression=compression, workers=3)
+
+        with zipfile.ZipFile(sequential) as seq, zipfile.ZipFile(parallel) as par:
+            assert par.testzip() is None
+            assert par.namelist() == seq.namelist()
+            for info in seq.infolist()[1:]:
+                par_info = par.getinfo(info.filename)
+                assert par_info.compress_type == compression
+                assert par_info.CRC == info.CRC
+                assert par.read(info.filename) == seq.read(info.filename)
+
+    def test_from_pdf_verbatim_jpeg(self, images_dir: Path, tmp_path: Path) -> None:
+        """JPEG images are extracted from PDF files byte-for-byte."""
+        image_paths = sorted(images_dir.iterdir())[:2]
+        pdf_path = tmp_path / "comic.pdf"
+        images = [Image.open(path) for path in image_paths] + [Image.new("P", (40, 60))]
+        images[0].save(pdf_path, "PDF", save_all=True, append_images=images[1:])
+
+        reader = PdfReader(pdf_path)
+        streams = [page["/Resources"]["/XObject"]["/image"].get_object().get_data() for page in reader.pages]
+
+        comic = ComicInfo.from_pdf(pdf_path)
+        assert len(comic) == 3
+        assert [page.content for page in comic[:2]] == streams[:2]
+        assert comic[2].suffix == ".png"
+
+        with ComicInfo.from_pdf(pdf_path, lazy=True) as lazy:
+            assert lazy[0]._content == b""
+            assert [page.content for page in lazy] == [page.content for page in comic]
+            assert [(p.image_width, p.image_height, p.suffix) for p in lazy] == \
+                [(p.image_width, p.image_height, p.suffix) for p in comic]
+
+    def test_from_pdf_lazy_save_workers(self, images_dir: Path, tmp_path: Path) -> None:
+        """Lazy PDF pages can be read from several threads while saving."""
+        pages = [PageInfo.load(path=path) for path in sorted(images_dir.iterdir())] * 4
+        pdf_path = tmp_path / "comic.pdf"
+        ComicInfo.from_pages(pages=pages).save_pdf(pdf_path)
+
+        out_path = tmp_path / "comic.cbz"
+        with ComicInfo.from_pdf(pdf_path, lazy=True) as comic:
+            comic.save(out_path, compression=zipfile.ZIP_DEFLATED, workers=8)
+        assert [p.content for p in ComicInfo.from_cbz(out_path)] == [p.content for p in pages]
+
+    def test_from_pdf_lazy_memory(self, images_dir: Path, tmp_path: Path) -> None:
+        """Lazy PDF pages are not held in memory once read."""
+        pages = [PageInfo.load(path=path) for path in sorted(images_dir.iterdir())]
+        pdf_path = tmp_path / "comic.pdf"
+        ComicInfo.from_pages(pages=pages).save_pdf(pdf_path)
+        total = sum(page.image_size for page in pages)
+
+        tracemalloc.start()
+        try:
+            with ComicInfo.from_pdf(pdf_path, lazy=True) as comic:
+                opened, _ = tracemalloc.get_traced_memory()
+                for page in comic:
+                    assert len(page.content) == page.image_size
+                read, _ = tracemalloc.get_traced_memory()
+                assert not comic[0]._source.archive.resolved_objects
+        finally:
+            tracemalloc.stop()
+
+        assert [(p.image_width, p.image_height, p.image_size) for p in comic] == \
+            [(p.image_width, p.image_height, p.image_size) for p in pages]
+        assert opened < total / 2
+        assert read < total / 2
+
+    def test_save_pdf(self, images_dir: Path, tmp_path: Path) -> None:
+        """Export to PDF embeds JPEG pages byte-for-byte."""
+        pages = [PageInfo.load(path=path) for path in sorted(images_dir.iterdir())[:2]]
+        pages.append(PageInfo.loads(data=_encode_png("RGBA", (30, 20))))
+        comic = ComicInfo.from_pages(pages=pages, title="PDF Export")
+
+        pdf_path = tmp_path / "export.pdf"
+        comic.save_pdf(pdf_path)
+
+        reader = PdfReader(pdf_path, strict=True)
+        assert reader.metadata.title == "PDF Export"
+        assert len(reader.pages) == 3
+        assert [float(v) for v in reader.pages[0].mediabox] == [0, 0, pages[0].image_width, pages[0].image_height]
+
+        loaded = ComicInfo.from_pdf(pdf_path)
+        assert [page.content for page in loaded[:2]] == [page.content for page in pages[:2]]
+        assert (loaded[2].image_width, loaded[2].image_height) == (30, 20)
+
+    def test_save_pdf_tall_page(self, tmp_path: Path) -> None:
+        """Pages taller than the PDF size limit are scaled down, not their image."""
+        comic = ComicInfo.from_pages(pages=[PageInfo.loads(data=_encode_png("L", (100, 30000)))])
+        pdf_path = tmp_path / "tall.pdf"
+        comic.save_pdf(pdf_path)
+
+        reader = PdfReader(pdf_path, strict=True)
+        assert [float(v) for v in reader.pages[0].mediabox] == [0, 0, 48, 14400]
+        loaded = ComicInfo.from_pdf(pdf_path)
+        assert (loaded[0].image_width, loaded[0].image_height) == (100, 30000)
+
+    def test_open_progressive(self, sample_cbz_file: Path) -> None:
+        """Progressive loading adds pages to the comic as they are read."""
+        expected = ComicInfo.from_cbz(sample_cbz_file)
+        comic, pages = ComicInfo.open_progressive(sample_cbz_file)
+        assert comic.title == "Test Comic"
+        assert len(comic) == 0
+
+        first = next(pages)
+        assert comic.pages == [first]
+        assert first.content == expected[0].content
+
+        assert list(pages) == comic.pages[1:]
+        assert [page.content for page in comic] == [page.content for page in expected]
+        assert [page.type for page in comic] == [page.type for page in expected]
+
+    def test_open_progressive_pdf(self, images_dir: Path, tmp_path: Path) -> None:
+        """PDF files are loaded progressively as well."""
+        pdf_path = tmp_path / "comic.pdf"
+        images = [Image.open(path) for path in sorted(images_dir.iterdir())[:2]]
+        images[0].save(pdf_path, "PDF", save_all=True, append_images=images[1:])
+
+        comic, pages = ComicInfo.open_progressive(pdf_path)
+        assert len(comic) == 0
+        for _ in pages:
+            pass
+        assert [page.content for page in comic] == [page.content for page in ComicInfo.from_pdf(pdf_path)]
+
+    @pytest.mark.parametrize("page_count", [0, 3])
+    def test_dump_xml_matches_xmltodict(self, images_dir: Path, page_count: int) -> None:
+        """The streaming serializer matches xmltodict output byte-for-byte."""
+        pages = [PageInfo.load(path=path) for path in sorted(images_dir.iterdir())[:page_count]]
+        if pages:
+            pages[0].type = PageType.FRONT_COVER
+            pages[0].bookmark = "Chapter \"1\" & <intro>"
+            pages[1].double = True
+            pages[2].key = "it's\tkey\n"
+        comic = ComicInfo.from_pages(
+            pages=pages,
+            title="Tom & Jerry <Special>",
+            summary="Line 1\nLine 2 > \"quoted\" 'single'",
+            number=0,
+            language_iso="fr",
+            manga=Manga.YES,
+            community_rating=Rating(4.5),
+            file_creation_time="2024-01-01T00:00:00.000Z",
+            file_modified_time="2024-01-02T00:00:00.000Z",
+        )
+
+        expected = xmltodict.unparse({"ComicInfo": comic.get_info()}, pretty=True)
+        assert comic._dump_xml() == expected.replace("></Page>", " />").encode("utf-8")
+
+        buffer = BytesIO(comic.pack())
+        with zipfile.ZipFile(buffer) as zf:
+            assert zf.read("ComicInfo.xml") == comic._dump_xml()
+
+    def test_xml_round_trip(self, images_dir: Path, tmp_path: Path) -> None:
+        """Metadata and page attributes survive a save and load."""
+        pages = [PageInfo.load(path=path) for path in sorted(images_dir.iterdir())[:2]]
+        pages[0].type = PageType.FRONT_COVER
+        pages[1].double = True
+        pages[1].bookmark = "Chapter <1>"
+        comic = ComicInfo.from_pages(pages=pages, title="A & B", number=3, manga=Manga.YES, language_iso="ja")
+        path = tmp_path / "comic.cbz"
+        comic.save(path)
+
+        loaded = ComicInfo.read_info(path)
+        assert (loaded.title, loaded.number, loaded.manga, loaded.language_iso) == ("A & B", 3, Manga.YES, "ja")
+        assert [p.type for p in loaded] == [PageType.FRONT_COVER, PageType.STORY]
+        assert [p.double for p in loaded] == [False, True]
+        assert loaded[1].bookmark == "Chapter <1>"
+
+    def test_xml_lenient_parsing(self, sample_image_path: Path, tmp_path: Path, caplog) -> None:
+        """Unknown, empty and invalid values are skipped when reading metadata."""
+        path = tmp_path / "comic.cbz"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("ComicInfo.xml", (
+                '<ComicInfo xmlns="urn:test"><Title>  Spaced  </Title><Number/><Volume>x</Volume>'
+                '<Unknown>1</Unknown><Pages><Page Image="0" ImageWidth="10" DoublePage="true" Other="1"/>'
+                '</Pages></ComicInfo>'
+            ))
+            zf.write(sample_image_path, "page-001.jpg")
+
+        comic = ComicInfo.read_info(path)
+        assert comic.title == "Spaced"
+        assert comic.number is None and comic.volume is None
+        assert comic[0].image_width == 10 and comic[0].double
+        assert "Volume" in caplog.text
+
+    def test_model_codec(self) -> None:
+        """Codecs skip default values and memoize repeated conversions."""
+        codec = _codec(ComicModel)
+        assert codec is _codec(ComicModel)
+
+        comic = ComicInfo(title="Codec", manga=Manga.UNKNOWN, black_white=YesNo.YES, number=0)
+        assert codec.serialize(comic) == {"Title": "Codec", "Number": 0, "BlackAndWhite": "Yes"}
+
+        name, convert = codec.table["LanguageISO"]
+        assert name == "language_iso"
+        convert("en")
+        hits = convert.cache_info().hits
+        assert convert("en") == "en"
+        assert convert.cache_info().hits == hits + 1
+
+        page_codec = _codec(PageModel)
+        assert page_codec.table["DoublePage"][1]("false") is False
+        with pytest.raises(ValueError):
+            page_codec.table["Type"][1]("NotAType")
@@ -0,0 +1,73 @@
+"""Tests for page hashing, the dedup index and the content store."""
+
+import hashlib
+from pathlib import Path
+
+from cbz.comic import ComicInfo
+from cbz.dedup import ContentStore, DedupIndex
+from cbz.page import PageInfo
+
+
+class TestDedup:
+    """Tests for duplicate detection and content-addressed storage."""
+
+    def test_page_digest(self, sample_cbz_file: Path) -> None:
+        """Lazy and eager pages hash to the digest of their content."""
+        eager = ComicInfo.from_cbz(sample_cbz_file)
+        with ComicInfo.from_cbz(sample_cbz_file, lazy=True) as lazy:
+            for lazy_page, page in zip(lazy, eager):
+                assert lazy_page.digest() == page.digest() == hashlib.sha256(page.content).hexdigest()
+
+    def test_index(self, sample_cbz_file: Path, images_dir: Path, tmp_path: Path) -> None:
+        """Pages shared by several files are reported as duplicates."""
+        cover = PageInfo.load(sorted(images_dir.iterdir())[0])
+        other = tmp_path / "other.cbz"
+        other.write_bytes(ComicInfo.from_pages([cover, PageInfo.load(sorted(images_dir.iterdir())[4])]).pack())
+
+        index = DedupIndex()
+        first = index.add(sample_cbz_file)
+        second = index.add(other)
+        assert len(first) == 3 and len(second) == 2
+        assert first[0] == second[0] == cover.digest()
+
+        duplicates = index.duplicates()
+        assert list(duplicates) == [cover.digest()]
+        assert [(ref.path, ref.index) for ref in duplicates[cover.digest()]] == [(sample_cbz_file, 0), (other, 0)]
+
+        report = index.report()
+        assert (report.pages, report.unique_pages) == (5, 4)
+        assert report.duplicate_bytes == cover.image_size
+
+    def test_store(self, sample_cbz_file: Path, tmp_path: Path) -> None:
+        """Comics are stored once per distinct blob and rebuilt from their manifest."""
+        store = ContentStore(tmp_path / "store")
+        with ComicInfo.from_cbz(sample_cbz_file, lazy=True) as comic:
+            manifest = store.add_comic(comic)
+            assert store.add_comic(comic)["pages"] == manifest["pages"]
+
+            blobs = list((tmp_path / "store").glob("*/*"))
+            assert len(blobs) == len({p.digest() for p in comic}) + 1
+            assert not list((tmp_path / "store").glob("*.tmp"))
+
+            rebuilt = store.load_comic(manifest)
+            assert rebuilt.title == comic.title
+            assert rebuilt.pages == comic.pages
+            assert [p.content for p in rebuilt] == [p.content for p in comic]
+
+    def test_pdf(self, sample_cbz_file: Path, tmp_path: Path) -> None:
+        """Pages read on access from a PDF file are indexed and stored."""
+        comic = ComicInfo.from_cbz(sample_cbz_file)
+        pdf_path = tmp_path / "comic.pdf"
+        comic.save_pdf(pdf_path)
+
+        index = DedupIndex()
+        digests = index.add(pdf_path)
+        assert digests == index.add(sample_cbz_file) == [page.digest() for page in comic]
+        assert len(index.duplicates()) == len(comic)
+
+        store = ContentStore(tmp_path / "store")
+        with ComicInfo.from_pdf(pdf_path, lazy=True) as lazy:
+            assert lazy[0]._content == b""
+            manifest = store.add_comic(lazy)
+        assert [entry["digest"] for entry in manifest["pages"]] == digests
+        assert [p.content for p in store.load_comic(manifest)] == [p.content for p in comic]
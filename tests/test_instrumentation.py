@@ -0,0 +1,75 @@
+"""Tests for the instrumentation hooks."""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from cbz import instrumentation
+from cbz.comic import ComicInfo
+
+
+class TestInstrumentation:
+    """Tests for phase events and hook registration."""
+
+    def test_load_and_save_phases(self, sample_cbz_file: Path, tmp_path: Path) -> None:
+        """Each phase reports its duration, bytes and pages."""
+        with instrumentation.record() as events:
+            comic = ComicInfo.from_cbz(sample_cbz_file)
+            comic.save(tmp_path / "out.cbz")
+
+        phases = [(e.operation, e.phase) for e in events]
+        assert phases == [
+            ("load", "directory"), ("load", "metadata"), ("load", "pages"),
+            ("save", "metadata"), ("save", "pages"),
+        ]
+        assert all(e.duration >= 0 and not e.failed for e in events)
+        assert events[0].path == sample_cbz_file
+        assert events[1].bytes_read > 0
+        assert events[2].pages == len(comic)
+        assert events[2].bytes_read == sum(p.image_size for p in comic)
+        assert events[3].bytes_written + events[4].bytes_written < (tmp_path / "out.cbz").stat().st_size
+        with zipfile.ZipFile(tmp_path / "out.cbz") as zf:
+            assert events[4].bytes_written == sum(info.compress_size for info in zf.infolist()[1:])
+
+    def test_hooks(self, sample_cbz_file: Path, caplog) -> None:
+        """Failing hooks are logged; phases are inactive without hooks."""
+        def broken(event: instrumentation.PhaseEvent) -> None:
+            raise RuntimeError("exporter down")
+
+        with instrumentation.hooked(broken), instrumentation.record() as events:
+            ComicInfo.from_cbz(sample_cbz_file).pack()
+        assert [e.operation for e in events] == ["load"] * 3 + ["pack"] * 2
+        assert "exporter down" in caplog.text
+
+        assert not instrumentation.phase("load", "pages")
+        with pytest.raises(ValueError):
+            instrumentation.remove_hook(broken)
+
+    def test_failed_phase(self, tmp_path: Path) -> None:
+        """Phases interrupted by an error are reported as failed."""
+        path = tmp_path / "empty.pdf"
+        path.write_bytes(b"")
+        with instrumentation.record() as events, pytest.raises(Exception):
+            ComicInfo.from_pdf(path)
+        assert [(e.operation, e.failed) for e in events] == [("from_pdf", True)]
+
+    def test_open_progressive_phases(self, sample_cbz_file: Path, tmp_path: Path) -> None:
+        """Progressive loading reports the phases of the matching loader."""
+        with instrumentation.record() as events:
+            comic, pages = ComicInfo.open_progressive(sample_cbz_file)
+            assert [e.phase for e in events] == ["directory", "metadata"]
+            list(pages)
+        assert [(e.operation, e.phase) for e in events] == [
+            ("load", "directory"), ("load", "metadata"), ("load", "pages"),
+        ]
+        assert events[2].pages == len(comic) == 3
+        assert events[2].bytes_read == sum(p.image_size for p in comic)
+
+        pdf_path = tmp_path / "comic.pdf"
+        comic.save_pdf(pdf_path)
+        with instrumentation.record() as events:
+            _, pages = ComicInfo.open_progressive(pdf_path)
+            next(pages)
+            pages.close()
+        assert [(e.operation, e.phase, e.pages, e.failed) for e in events] == [("from_pdf", "pages", 1, False)]
@@ -0,0 +1,60 @@
+"""Tests for header-only image probing."""
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from cbz.page import read_image_info
+from cbz.probe import PROBE_SIZE, probe
+
+
+def _encode(fmt: str, mode: str = "RGB", size: tuple = (33, 17), **kwargs) -> bytes:
+    buf = BytesIO()
+    Image.new(mode, size).save(buf, fmt, **kwargs)
+    return buf.getvalue()
+
+
+class TestProbe:
+    """Tests for format and dimension detection from image headers."""
+
+    @pytest.mark.parametrize("fmt, kwargs", [
+        ("JPEG", {}),
+        ("JPEG", {"progressive": True}),
+        ("PNG", {}),
+        ("GIF", {}),
+        ("BMP", {}),
+        ("TIFF", {}),
+        ("WEBP", {}),
+        ("WEBP", {"lossless": True}),
+    ])
+    def test_matches_pillow(self, fmt: str, kwargs: dict) -> None:
+        """Probed format and dimensions match Pillow."""
+        for size in ((1, 1), (33, 17), (3, 1000), (2000, 7)):
+            data = _encode(fmt, size=size, **kwargs)
+            with Image.open(BytesIO(data)) as img:
+                expected = (f".{img.format.lower()}", img.width, img.height)
+            assert probe(data) == expected
+
+    def test_fixture_images(self, images_dir: Path) -> None:
+        """Test fixtures are probed like Pillow reads them."""
+        for path in sorted(images_dir.iterdir()):
+            with Image.open(path) as img:
+                assert probe(path.read_bytes()) == (".jpeg", img.width, img.height)
+
+    def test_truncated_header(self) -> None:
+        """A frame header beyond the probed bytes is reported as unknown."""
+        data = _encode("JPEG", icc_profile=b"\0" * (PROBE_SIZE * 2))
+        assert probe(data[:PROBE_SIZE]) is None
+        assert probe(data) == (".jpeg", 33, 17)
+
+    def test_unknown_data(self) -> None:
+        """Unrecognized data is reported as unknown."""
+        assert probe(b"not an image") is None
+        assert probe(b"") is None
+
+    def test_pillow_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Layouts unknown to the probe are still read through Pillow."""
+        monkeypatch.setattr("cbz.page.probe", lambda data: None)
+        assert read_image_info(_encode("PNG")) == (".png", 33, 17)
@@ -0,0 +1,70 @@
+"""Tests for the reader rendering helpers."""
+
+from pathlib import Path
+
+from PIL import Image
+
+from cbz.render import ImageCache, fit_size, page_offsets, reduce, render, render_tile, visible_tiles
+
+
+class TestRender:
+    """Tests for off-thread decoding and the rendered image cache."""
+
+    def test_fit_size(self) -> None:
+        """Images are scaled to fit in the box, keeping their ratio."""
+        assert fit_size(1000, 2000, 500, 500) == (250, 500)
+        assert fit_size(2000, 1000, 500, 500) == (500, 250)
+        assert fit_size(100, 100, 400, 200) == (200, 200)
+
+    def test_render(self, sample_image_path: Path) -> None:
+        """Pages are decoded and scaled to the requested size."""
+        img = render(sample_image_path.read_bytes(), (120, 180))
+        assert img.size == (120, 180)
+
+    def test_cache_eviction(self) -> None:
+        """The least recently used images are evicted beyond the byte budget."""
+        cache = ImageCache(max_bytes=3 * 10 * 10 * 3)
+        for i in range(3):
+            cache.put(i, Image.new("RGB", (10, 10)))
+        assert cache.get(0) is not None
+
+        cache.put(3, Image.new("RGB", (10, 10)))
+        assert 1 not in cache
+        assert 0 in cache and 2 in cache and 3 in cache
+        assert cache.nbytes == 3 * 10 * 10 * 3
+
+    def test_cache_oversized(self) -> None:
+        """Images larger than the whole budget are not cached."""
+        cache = ImageCache(max_bytes=100)
+        cache.put("big", Image.new("RGB", (10, 10)))
+        assert len(cache) == 0
+
+    def test_reduce(self) -> None:
+        """Images are reduced by an integer factor, whatever their mode."""
+        assert reduce(Image.new("RGB", (100, 60)), 4).size == (25, 15)
+        assert reduce(Image.new("P", (100, 60)), 2).mode == "RGBA"
+        img = Image.new("L", (10, 10))
+        assert reduce(img, 1) is img
+
+    def test_visible_tiles(self) -> None:
+        """Only the tiles intersecting the region are listed."""
+        assert visible_tiles((1000, 5000), (0, 0, 800, 600), 512) == {(0, 0), (1, 0), (0, 1), (1, 1)}
+        assert visible_tiles((1000, 5000), (-600, 4900, 100, 6000), 512) == {(0, 9)}
+
+    def test_render_tile(self, sample_image_path: Path) -> None:
+        """Tiles assemble into the image scaled as a whole."""
+        with Image.open(sample_image_path) as img:
+            img = img.convert("RGB")
+        size = (300, 450)
+        whole = img.resize(size, Image.Resampling.LANCZOS)
+        tiled = Image.new("RGB", size)
+        for col, row in visible_tiles(size, (0, 0, *size), 128):
+            tiled.paste(render_tile(img, size, (col, row), 128), (col * 128, row * 128))
+        diff = max(abs(a - b) for a, b in zip(whole.tobytes(), tiled.tobytes()))
+        assert diff <= 2
+
+    def test_page_offsets(self) -> None:
+        """Pages are stacked at a common width from their dimensions."""
+        assert page_offsets([(800, 1200), (400, 300), (1000, 3000)], 400) == [0, 600, 900, 2100]
+        assert page_offsets([(100, 100), (100, 100)], 50, gap=10) == [0, 60, 120]
+        assert page_offsets([], 400) == [0]
@@ -0,0 +1,125 @@
+"""Tests for the columnar page table."""
+
+import pickle
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from cbz.comic import ComicInfo
+from cbz.constants import PageType
+from cbz.page import PageInfo
+from cbz.table import PageTable, PageView
+
+
+class TestPageTable:
+    """Tests for page storage, views and compact loading."""
+
+    def test_list_behaviour(self, images_dir: Path) -> None:
+        """The table behaves like a list of pages."""
+        pages = [PageInfo.load(path) for path in sorted(images_dir.iterdir())[:3]]
+        table = PageTable(pages)
+
+        assert len(table) == 3
+        assert table == pages
+        assert isinstance(table[0], PageView)
+        assert table[-1].name == pages[-1].name
+        assert [p.name for p in table[1:]] == [p.name for p in pages[1:]]
+        with pytest.raises(IndexError):
+            table[3]
+
+        table.insert(0, pages[2])
+        del table[-1]
+        table[1:3] = pages[1::-1]
+        assert [p.name for p in table] == [pages[i].name for i in (2, 1, 0)]
+        assert pages[0] in table
+
+    def test_view_writes_columns(self, sample_image_path: Path) -> None:
+        """Views read and write the table columns."""
+        page = PageInfo.load(sample_image_path, type=PageType.FRONT_COVER, bookmark="Cover")
+        table = PageTable([page])
+        view = table[0]
+        assert view.type == PageType.FRONT_COVER
+        assert view.bookmark == "Cover"
+        assert view.content == page.content
+
+        view.type = "Story"
+        view.double = True
+        assert table[0].type == PageType.STORY
+        assert table[0].double is True
+        assert view.to_page() == view
+        assert view.to_page() != page
+
+    def test_pickle(self, sample_image_path: Path) -> None:
+        """Tables survive a round trip through pickle (e.g. a process pool)."""
+        table = PageTable([PageInfo.load(sample_image_path)])
+        assert pickle.loads(pickle.dumps(table)) == table
+
+    def test_compact_loading(self, sample_cbz_file: Path, tmp_path: Path) -> None:
+        """Compact comics load, save and read their metadata like list-backed ones."""
+        eager = ComicInfo.from_cbz(sample_cbz_file)
+        with ComicInfo.from_cbz(sample_cbz_file, lazy=True, compact=True) as comic:
+            assert isinstance(comic.pages, PageTable)
+            assert comic.pages == eager.pages
+            assert comic.get_info() == eager.get_info()
+            assert [p.content for p in comic] == [p.content for p in eager]
+
+            output = tmp_path / "compact.cbz"
+            comic.save(output)
+            with zipfile.ZipFile(output) as zf, zipfile.ZipFile(sample_cbz_file) as src:
+                assert [zf.read(n) for n in zf.namelist()[1:]] == [src.read(n) for n in src.namelist()[1:]]
+
+        info = ComicInfo.read_info(sample_cbz_file, compact=True)
+        assert isinstance(info.pages, PageTable)
+        assert info.pages == eager.pages
+
+    @pytest.fixture
+    def compact_comic(self, images_dir: Path, tmp_path: Path) -> ComicInfo:
+        """A four-page comic loaded with compact page storage."""
+        pages = [PageInfo.load(path) for path in sorted(images_dir.iterdir())[:4]]
+        path = tmp_path / "four.cbz"
+        path.write_bytes(ComicInfo.from_pages(pages=pages, title="Four").pack())
+        return ComicInfo.from_cbz(path, compact=True)
+
+    def test_reorder(self, compact_comic: ComicInfo) -> None:
+        """Reversing, swapping and slice self-assignment move whole pages."""
+        pages = compact_comic.pages
+        names = [p.name for p in pages]
+
+        pages.reverse()
+        assert [p.name for p in pages] == names[::-1]
+        pages.reverse()
+
+        pages[0], pages[1] = pages[1], pages[0]
+        assert [p.name for p in pages] == [names[1], names[0], *names[2:]]
+        pages[0], pages[1] = pages[1], pages[0]
+
+        pages[:] = pages[::-1]
+        assert [p.name for p in pages] == names[::-1]
+        pages[::2] = pages[1::2]
+        assert [p.name for p in pages] == [names[2], names[2], names[0], names[0]]
+
+    def test_views_follow_pages(self, compact_comic: ComicInfo) -> None:
+        """Views follow reordered pages and keep a copy of removed ones."""
+        pages = compact_comic.pages
+        first, last = pages[0], pages[-1]
+        first_page, last_page = first.to_page(), last.to_page()
+
+        pages.reverse()
+        assert pages[0] is last and pages[-1] is first
+        pages.sort(key=lambda p: p.name)
+        assert pages[0] is first
+
+        popped = pages.pop()
+        assert popped == last_page
+        assert popped.content == last_page.content
+        assert len(pages) == 3
+        popped.bookmark = "Detached"
+        assert all(p.bookmark == "" for p in pages)
+
+        pages[0] = popped
+        assert first == first_page
+        assert pages[0].bookmark == "Detached"
+        del pages[:]
+        assert len(pages) == 0
+        assert popped.name == last_page.name
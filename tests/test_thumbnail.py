@@ -0,0 +1,61 @@
+"""Tests for the persistent thumbnail cache."""
+
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+from cbz.comic import ComicInfo
+from cbz.page import PageInfo
+from cbz.thumbnail import ThumbnailCache, make_thumbnail, thumbnail_key
+
+
+class TestThumbnail:
+    """Tests for thumbnail generation and caching."""
+
+    def test_make_thumbnail(self, sample_image_path: Path) -> None:
+        """Thumbnails fit in the requested size and keep the page ratio."""
+        data = make_thumbnail(sample_image_path.read_bytes(), (100, 100))
+        with Image.open(BytesIO(data)) as img, Image.open(sample_image_path) as page:
+            assert img.format == "JPEG"
+            assert max(img.size) == 100
+            assert abs(img.width / img.height - page.width / page.height) < 0.02
+
+    def test_transparent_thumbnail(self) -> None:
+        """Transparent images are flattened for the JPEG thumbnail."""
+        buffer = BytesIO()
+        Image.new("RGBA", (64, 32), (0, 0, 0, 0)).save(buffer, format="PNG")
+        with Image.open(BytesIO(make_thumbnail(buffer.getvalue(), (16, 16)))) as img:
+            assert img.size == (16, 8)
+            assert img.getpixel((0, 0)) == (255, 255, 255)
+
+    def test_page_thumbnail_cached(self, sample_image_path: Path, tmp_path: Path) -> None:
+        """Page thumbnails are stored by content hash and size."""
+        cache = ThumbnailCache(tmp_path)
+        page = PageInfo.load(sample_image_path)
+        thumb = page.thumbnail((64, 64), cache=cache)
+        assert max(thumb.size) == 64
+
+        path = cache.path(thumbnail_key(page.content, (64, 64)))
+        assert path.is_file()
+        path.write_bytes(make_thumbnail(page.content, (32, 32)))
+        assert max(page.thumbnail((64, 64), cache=cache).size) == 32
+
+    def test_comic_thumbnails(self, sample_cbz_file: Path, tmp_path: Path, monkeypatch) -> None:
+        """Comic thumbnails are generated in order and reused."""
+        cache = ThumbnailCache(tmp_path)
+        comic = ComicInfo.from_cbz(sample_cbz_file, lazy=True)
+        thumbs = comic.thumbnails((48, 48), cache=cache, max_workers=2)
+        assert len(thumbs) == len(comic)
+        for thumb, page in zip(thumbs, comic):
+            assert max(thumb.size) == 48
+            assert (thumb.width > thumb.height) == (page.image_width > page.image_height)
+        assert len(list(tmp_path.glob("*/*.jpeg"))) == len({p.content for p in comic})
+
+        # A warm cache does not start any worker process
+        monkeypatch.setattr("cbz.thumbnail.ProcessPoolExecutor", None)
+        assert [t.size for t in comic.thumbnails((48, 48), cache=cache)] == [t.size for t in thumbs]
+
+        cache.clear()
+        assert not list(tmp_path.glob("*/*.jpeg"))
+        comic.close()
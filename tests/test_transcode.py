@@ -0,0 +1,113 @@
+"""Tests for page conversion and comic transcoding."""
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from cbz.comic import ComicInfo
+from cbz.exceptions import InvalidImageError
+from cbz.page import PageInfo
+
+
+def _png(mode: str, size=(64, 48)) -> bytes:
+    """Create a PNG image in the given mode."""
+    buffer = BytesIO()
+    Image.new(mode, size).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestTranscode:
+    """Tests for PageInfo.convert() and ComicInfo.transcode()."""
+
+    def test_convert(self, sample_image_path: Path) -> None:
+        """Converted pages get the new format, size and extension."""
+        page = PageInfo.load(sample_image_path)
+        width, height = page.image_width, page.image_height
+        page.convert("webp", quality=60)
+
+        assert page.suffix == ".webp"
+        assert page.name == f"{sample_image_path.stem}.webp"
+        assert (page.image_width, page.image_height) == (width, height)
+        assert page.image_size == len(page.content)
+        with Image.open(BytesIO(page.content)) as img:
+            assert img.format == "WEBP"
+
+    def test_convert_transparent_to_jpeg(self) -> None:
+        """Transparency is flattened when converting to JPEG."""
+        page = PageInfo.loads(_png("RGBA"), name="alpha.png")
+        page.convert("JPG")
+        assert (page.suffix, page.name) == (".jpeg", "alpha.jpeg")
+        with Image.open(BytesIO(page.content)) as img:
+            assert img.mode == "RGB"
+            assert img.getpixel((0, 0)) == (255, 255, 255)
+
+    def test_unsupported_format(self, sample_image_path: Path) -> None:
+        """Unknown target formats are rejected."""
+        with pytest.raises(InvalidImageError):
+            PageInfo.load(sample_image_path).convert("xcf")
+        with pytest.raises(InvalidImageError):
+            ComicInfo.from_pages([PageInfo.load(sample_image_path)]).transcode("svg")
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_transcode(self, sample_cbz_file: Path, max_workers: int) -> None:
+        """Pages are replaced only when the result is smaller."""
+        with ComicInfo.from_cbz(sample_cbz_file, lazy=True) as comic:
+            report = comic.transcode("webp", quality=50, max_workers=max_workers)
+
+            assert [r.index for r in report] == list(range(len(comic)))
+            for result, page in zip(report, comic):
+                assert not result.error
+                assert result.encoded_size > 0 and result.seconds > 0
+                assert result.converted == (result.encoded_size < result.original_size)
+                assert page.suffix == (".webp" if result.converted else ".jpeg")
+                assert page.image_size == result.size
+                assert page.name == result.name
+            assert any(r.converted for r in report)
+
+    def test_transcode_keep_larger(self) -> None:
+        """keep_larger replaces pages even when the result is larger."""
+        comic = ComicInfo.from_pages([PageInfo.loads(_png("L"), name="blank.png")])
+        report = comic.transcode("jpeg", quality=100, max_workers=1)
+        assert not report[0].converted
+        assert report[0].encoded_size > report[0].original_size == comic[0].image_size
+        assert comic[0].name == "blank.png"
+
+        report = comic.transcode("jpeg", quality=100, max_workers=1, keep_larger=True)
+        assert report[0].converted
+        assert comic[0].suffix == ".jpeg"
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_resize(self, sample_cbz_file: Path, max_workers: int) -> None:
+        """Pages larger than the box are downscaled; the others are left untouched."""
+        with ComicInfo.from_cbz(sample_cbz_file, lazy=True) as comic:
+            small = PageInfo.loads(_png("RGB", (40, 30)), name="small.png")
+            comic.pages.append(small)
+            sizes = [(p.image_width, p.image_height) for p in comic]
+
+            report = comic.resize(300, 300, quality=70, max_workers=max_workers)
+
+            for result, page, (width, height) in zip(report, comic, sizes):
+                assert not result.error
+                if max(width, height) <= 300:
+                    assert not result.converted and result.encoded_size == 0
+                    assert (page.image_width, page.image_height) == (width, height)
+                    continue
+                assert result.converted
+                assert max(page.image_width, page.image_height) == 300
+                assert abs(page.image_width / page.image_height - width / height) < 0.02
+                assert page.suffix == ".jpeg" and page.image_size == len(page.content)
+                with Image.open(BytesIO(page.content)) as img:
+                    assert img.size == (page.image_width, page.image_height)
+            assert comic[-1] is small and small.name == "small.png"
+
+    def test_resize_single_bound(self) -> None:
+        """A single bound limits one dimension; bounds must be positive."""
+        comic = ComicInfo.from_pages([PageInfo.loads(_png("P", (400, 100)), name="strip.png")])
+        report = comic.resize(None, 50, max_workers=1)
+        assert report[0].converted
+        assert (comic[0].image_width, comic[0].image_height) == (200, 50)
+        assert comic[0].suffix == ".png"
+        with pytest.raises(ValueError):
+            comic.resize(0, 100)